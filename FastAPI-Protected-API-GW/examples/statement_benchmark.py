@@ -0,0 +1,70 @@
+"""
+Benchmark of the prebuilt statement registry on DbAccessImpl's hot reads.
+
+Runs each hot query against a throw-away SQLite database twice: once with
+statements rebuilt on every call (registry disabled) and once with the
+prebuilt, parameterized statements. Prints the CPU time per query.
+
+Usage:
+    python examples/statement_benchmark.py [iterations]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports and use the disposable test database
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+os.environ["ENVIRONMENT"] = "test"
+
+from adapter.sql.data_access import DbAccessImpl
+from adapter.sql.data_base import close_session, init_db
+from adapter.sql.statements import StatementRegistry
+
+
+async def cpu_per_call(query, iterations: int) -> float:
+    """Microseconds of process CPU time per awaited call, after a warm-up."""
+    for _ in range(50):
+        await query()
+    started = time.process_time()
+    for _ in range(iterations):
+        await query()
+    return (time.process_time() - started) / iterations * 1e6
+
+
+async def main(iterations: int):
+    await init_db()
+    team = await DbAccessImpl.create_record("teams", {"name": "benchmark"})
+    await DbAccessImpl.bulk_create_records("users", [
+        {"name": f"user{index:03}", "email": f"user{index:03}@example.com", "team_id": team.id}
+        for index in range(100)
+    ])
+    user = await DbAccessImpl.find_record("users", "email", "user042@example.com")
+
+    queries = {
+        "user by id": lambda: DbAccessImpl.read_record("users", record_id=user.id),
+        "team by id (manager, users)": lambda: DbAccessImpl.read_record("teams", record_id=team.id),
+        "user by email": lambda: DbAccessImpl.find_record("users", "email", "user042@example.com"),
+        "user row by id": lambda: DbAccessImpl.read_rows("users", ("id", "name", "email"), record_id=user.id),
+        "users page (20, asc)": lambda: DbAccessImpl.read_record("users", offset=20, limit=20, order="asc"),
+    }
+    print(f"{'query':<30}{'rebuilt':>12}{'prebuilt':>12}{'saved':>12}")
+    for name, query in queries.items():
+        DbAccessImpl.statements = StatementRegistry(max_size=0)
+        rebuilt = await cpu_per_call(query, iterations)
+        DbAccessImpl.statements = StatementRegistry()
+        prebuilt = await cpu_per_call(query, iterations)
+        print(
+            f"{name:<30}{rebuilt:>10.0f}us{prebuilt:>10.0f}us"
+            f"{rebuilt - prebuilt:>8.0f}us ({(rebuilt - prebuilt) / rebuilt:.0%})"
+        )
+
+    await close_session()
+    if os.path.exists("test.db"):
+        os.remove("test.db")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -0,0 +1,156 @@
+"""
+Background maintenance for the authorization decision cache.
+
+Two asyncio tasks run alongside the web server:
+
+- the warmer re-fetches cache entries of recently active users shortly before
+  their TTL runs out, so hot users never pay a cold miss;
+- the watcher polls Keto's relation tuples and invalidates the entries of
+  users whose tuples changed, so grants and revocations show up before TTL
+  expiry. Keto's REST API has no change stream, hence the polling snapshot.
+"""
+
+import asyncio
+from typing import Dict, FrozenSet, Optional, TYPE_CHECKING
+
+from config.logger import logger
+
+if TYPE_CHECKING:
+    from adapter.auth.cached_checker import CachedPermissionChecker
+    from adapter.auth.keto_client import KetoPermissionChecker
+    from adapter.auth.role_index import RolePermissionIndex
+
+
+class AuthzCacheWarmer:
+    """
+    Keeps a CachedPermissionChecker warm and in sync with Keto.
+
+    Args:
+        cache: The decision cache to maintain
+        keto: Keto adapter used to poll relation tuples (None disables watching)
+        role_index: Role index to refresh when role definitions change
+        refresh_interval: Seconds between warm-up passes
+        refresh_ahead: Refresh entries expiring within this many seconds
+        active_window: Only warm users seen within this many seconds
+        watch_interval: Seconds between Keto polls (0 disables watching)
+        refresh_concurrency: Maximum lookups in flight during a warm-up pass
+    """
+
+    def __init__(
+        self,
+        cache: "CachedPermissionChecker",
+        keto: Optional["KetoPermissionChecker"] = None,
+        role_index: Optional["RolePermissionIndex"] = None,
+        refresh_interval: float = 5.0,
+        refresh_ahead: float = 10.0,
+        active_window: float = 300.0,
+        watch_interval: float = 30.0,
+        refresh_concurrency: int = 10,
+    ):
+        self.cache = cache
+        self.keto = keto
+        self.role_index = role_index
+        self.refresh_interval = refresh_interval
+        self.refresh_ahead = refresh_ahead
+        self.active_window = active_window
+        self.watch_interval = watch_interval
+        self.refresh_concurrency = refresh_concurrency
+        self._snapshot: Optional[Dict[str, FrozenSet[tuple]]] = None
+        self._tasks: list[asyncio.Task] = []
+        self.invalidations = 0
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        if self.refresh_interval > 0:
+            self._tasks.append(asyncio.create_task(
+                self._run_every(self.refresh_interval, self.warm)
+            ))
+        if self.keto is not None and self.watch_interval > 0:
+            self._tasks.append(asyncio.create_task(
+                self._run_every(self.watch_interval, self.poll_changes)
+            ))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    async def _run_every(self, interval: float, job) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await job()
+            except Exception as e:
+                logger.error(f"Authz cache maintenance job failed: {e}")
+
+    async def warm(self) -> int:
+        """Refresh entries of active users that are about to expire."""
+        return await self.cache.refresh_expiring(
+            self.refresh_ahead, self.active_window, concurrency=self.refresh_concurrency
+        )
+
+    async def poll_changes(self) -> int:
+        """
+        Diff Keto's relation tuples against the previous poll and invalidate.
+
+        Changes to a user's own tuples invalidate that user. Changes to role
+        definitions ("role:*" objects) can affect any member, so they clear the
+        whole cache and refresh the role index.
+
+        Returns:
+            Number of users invalidated (all users count once on a full clear)
+        """
+        snapshot: Dict[str, set] = {}
+        async for tuple_data in self.keto.iter_relation_tuples():
+            subject = tuple_data.get("subject_id")
+            if subject:
+                snapshot.setdefault(subject, set()).add(
+                    (tuple_data.get("object", ""), tuple_data.get("relation", ""))
+                )
+        current = {subject: frozenset(tuples) for subject, tuples in snapshot.items()}
+
+        previous, self._snapshot = self._snapshot, current
+        if previous is None:
+            return 0
+
+        changed_subjects = {
+            subject for subject in previous.keys() | current.keys()
+            if previous.get(subject) != current.get(subject)
+        }
+        if not changed_subjects:
+            return 0
+
+        role_definitions_changed = any(
+            obj.startswith("role:") and relation == "granted"
+            for subject in changed_subjects
+            for obj, relation in previous.get(subject, frozenset()) ^ current.get(subject, frozenset())
+        )
+        if role_definitions_changed:
+            logger.info("Role definitions changed in Keto; clearing authz cache")
+            # Refresh the index first: entries loaded while the refresh is pending
+            # are expanded with the old roles, so the cache is cleared afterwards
+            try:
+                if self.role_index is not None and self.role_index.source == "keto":
+                    await self.role_index.refresh()
+            finally:
+                self.cache.clear()
+            self.invalidations += 1
+            return 1
+
+        for subject in changed_subjects:
+            self.cache.invalidate_user(subject)
+        self.invalidations += len(changed_subjects)
+        logger.info(f"Invalidated authz cache for {len(changed_subjects)} changed users")
+        return len(changed_subjects)
+
+    def stats(self) -> dict:
+        return {
+            "running": bool(self._tasks),
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,228 @@
+"""
+Caching decorator for the PermissionChecker port.
+
+Wraps any PermissionChecker (e.g. KetoPermissionChecker) and answers repeated
+(user, permission) questions from an in-process TTL + LRU cache, so hot users
+hitting hot endpoints do not re-query the permission backend on every request.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List
+
+from adapter.cache.ttl_cache import MISSING, TTLCache
+from config.logger import logger
+from ports.models.permissions import permission_registry
+from ports.outbound.auth import PermissionBackendUnavailable, PermissionChecker
+
+
+class CachedPermissionChecker(PermissionChecker):
+    """
+    PermissionChecker decorator with a bounded decision cache.
+
+    Positive answers (allowed / non-empty results) are kept for positive_ttl
+    seconds and negative answers for negative_ttl seconds, so revoked access
+    is picked up quickly while grants stay cheap to re-check. Permission sets
+    are stored as integer bitmasks to keep the per-user footprint small.
+
+    With max_staleness > 0, expired answers are kept that much longer and
+    served as last-known-good values when the wrapped checker raises
+    PermissionBackendUnavailable (e.g. Keto outage or open circuit breaker).
+
+    Cache keys are tuples whose second element is the username:
+    ("check", username, permission), ("permissions", username) and
+    ("roles", username).
+
+    invalidate_user() and clear() bump a generation counter (per user, or
+    for the whole cache) so a lookup that was in flight when they ran does
+    not store its now outdated answer afterwards.
+    """
+
+    def __init__(
+        self,
+        inner: PermissionChecker,
+        max_size: int = 10000,
+        positive_ttl: float = 60.0,
+        negative_ttl: float = 10.0,
+        max_staleness: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.inner = inner
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._cache = TTLCache(max_size=max_size, clock=clock, stale_ttl=max_staleness)
+        # Users in least-recently-seen order, used by the cache warmer
+        self._last_seen: OrderedDict[str, float] = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self.refreshes = 0
+
+    def _ttl(self, value) -> float:
+        return self.positive_ttl if value else self.negative_ttl
+
+    def _touch(self, username: str) -> None:
+        self._last_seen[username] = self._clock()
+        self._last_seen.move_to_end(username)
+        while len(self._last_seen) > self._cache.max_size:
+            forgotten, _ = self._last_seen.popitem(last=False)
+            if self._generations.pop(forgotten, None) is not None:
+                # Keep any lookup still in flight for that user from storing
+                self._epoch += 1
+
+    def _generation(self, username: str) -> tuple:
+        return self._epoch, self._generations.get(username, 0)
+
+    def _store(self, key: Hashable, value, generation: tuple) -> None:
+        if self._generation(key[1]) == generation:
+            self._cache.set(key, value, self._ttl(value))
+
+    async def _load(self, key: Hashable):
+        """Fetch the value for a cache key from the wrapped checker."""
+        kind, username = key[0], key[1]
+        if kind == "check":
+            return await self.inner.check_permission(username, key[2])
+        if kind == "permissions":
+            return await self.inner.get_user_permission_mask(username)
+        return tuple(await self.inner.get_user_roles(username))
+
+    async def _get(self, key: Hashable):
+        self._touch(key[1])
+        cached = self._cache.get(key)
+        if cached is not MISSING:
+            return cached
+
+        generation = self._generation(key[1])
+        try:
+            value = await self._load(key)
+        except PermissionBackendUnavailable:
+            stale = self._cache.get_stale(key)
+            if stale is MISSING:
+                raise
+            logger.warning(f"Permission backend unavailable; serving stale authz entry {key}")
+            return stale
+        self._store(key, value, generation)
+        return value
+
+    async def check_permission(self, username: str, permission: str) -> bool:
+        return await self._get(("check", username, permission))
+
+    async def check_permissions(
+        self,
+        username: str,
+        permissions: List[str]
+    ) -> Dict[str, bool]:
+        self._touch(username)
+        results = {}
+        misses = []
+        for permission in dict.fromkeys(permissions):
+            cached = self._cache.get(("check", username, permission))
+            if cached is MISSING:
+                misses.append(permission)
+            else:
+                results[permission] = cached
+
+        if misses:
+            generation = self._generation(username)
+            try:
+                fetched = await self.inner.check_permissions(username, misses)
+            except PermissionBackendUnavailable:
+                stale = {
+                    permission: self._cache.get_stale(("check", username, permission))
+                    for permission in misses
+                }
+                if any(allowed is MISSING for allowed in stale.values()):
+                    raise
+                logger.warning(
+                    f"Permission backend unavailable; serving stale decisions for user '{username}'"
+                )
+                results.update(stale)
+                return results
+            for permission, allowed in fetched.items():
+                self._store(("check", username, permission), allowed, generation)
+            results.update(fetched)
+        return results
+
+    async def get_user_permissions(self, username: str) -> List[str]:
+        return permission_registry.names(await self.get_user_permission_mask(username))
+
+    async def get_user_permission_mask(self, username: str) -> int:
+        return await self._get(("permissions", username))
+
+    async def get_user_roles(self, username: str) -> List[str]:
+        return list(await self._get(("roles", username)))
+
+    def active_users(self, window: float) -> List[str]:
+        """Users that used the cache within the last window seconds."""
+        since = self._clock() - window
+        return [username for username, seen in self._last_seen.items() if seen >= since]
+
+    async def refresh_expiring(self, within: float, active_window: float, concurrency: int = 10) -> int:
+        """
+        Re-fetch entries of recently active users before they expire.
+
+        Entries are refreshed concurrently, at most `concurrency` at a time.
+        If the backend reports itself unavailable the pass stops: entries not
+        yet started are left to expire (or be served stale) and are retried
+        on the next pass.
+
+        Args:
+            within: Refresh entries expiring in the next `within` seconds
+            active_window: Only refresh users seen in the last `active_window` seconds
+            concurrency: Maximum number of backend lookups in flight
+
+        Returns:
+            Number of entries refreshed
+        """
+        active = set(self.active_users(active_window))
+        keys = [key for key in self._cache.expiring_keys(within) if key[1] in active]
+        semaphore = asyncio.Semaphore(concurrency)
+        unavailable = False
+
+        async def refresh(key: Hashable) -> bool:
+            nonlocal unavailable
+            async with semaphore:
+                if unavailable:
+                    return False
+                generation = self._generation(key[1])
+                try:
+                    value = await self._load(key)
+                except PermissionBackendUnavailable:
+                    unavailable = True
+                    return False
+                except Exception as e:
+                    # Leave the entry to expire; the next request will retry
+                    logger.warning(f"Failed to refresh cached authz entry {key}: {e}")
+                    return False
+            if self._generation(key[1]) != generation:
+                # Invalidated while the refresh was in flight
+                return False
+            self._cache.set(key, value, self._ttl(value))
+            return True
+
+        refreshed = sum(await asyncio.gather(*(refresh(key) for key in keys)))
+        if unavailable:
+            logger.warning(
+                f"Permission backend unavailable; stopped refreshing after {refreshed} of {len(keys)} authz entries"
+            )
+        self.refreshes += refreshed
+        return refreshed
+
+    def invalidate_user(self, username: str) -> int:
+        """Drop every cached entry for a user (e.g. after a grant or revocation)."""
+        if username in self._last_seen:
+            self._generations[username] = self._generations.get(username, 0) + 1
+        else:
+            # No per-user counter to bump for users the cache no longer tracks
+            self._epoch += 1
+        removed = self._cache.delete_where(lambda key: key[1] == username)
+        logger.debug(f"Invalidated {removed} cached authz entries for user '{username}'")
+        return removed
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return {**self._cache.stats(), "refreshes": self.refreshes}
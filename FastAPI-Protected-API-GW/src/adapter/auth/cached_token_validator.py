@@ -0,0 +1,117 @@
+"""
+Caching decorator for the TokenValidator port.
+
+Opaque tokens have to be introspected remotely, so validating one on every API
+call costs a round trip to Hydra. This decorator keeps validated TokenData in a
+bounded in-process cache keyed by a hash of the token (raw tokens are never
+stored), and never lets an entry outlive the token itself.
+"""
+
+import hashlib
+import time
+from typing import Callable, Dict, Set
+
+from adapter.cache.ttl_cache import MISSING, TTLCache
+from config.logger import logger
+from ports.models.auth import TokenData
+from ports.outbound.auth import TokenValidator
+
+
+def token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class _InvalidToken:
+    """Negative cache entry for a token that failed validation."""
+
+    def __init__(self, reason: str):
+        self.reason = reason
+
+
+class CachedTokenValidator(TokenValidator):
+    """
+    TokenValidator decorator with a bounded introspection cache.
+
+    Valid tokens are cached for min(max_ttl, time left until expires_at).
+    Tokens rejected with ValueError are cached for negative_ttl so replayed
+    bad tokens do not hammer the introspection endpoint. Other errors
+    (e.g. Hydra unreachable) are not cached.
+
+    Args:
+        inner: The TokenValidator to decorate
+        max_size: Maximum number of cached tokens
+        max_ttl: Upper bound in seconds for caching a valid token
+        negative_ttl: Seconds to remember an invalid token
+        clock: Monotonic clock driving cache expiry
+        wall_clock: Source of epoch time used against expires_at
+    """
+
+    def __init__(
+        self,
+        inner: TokenValidator,
+        max_size: int = 10000,
+        max_ttl: float = 300.0,
+        negative_ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self.inner = inner
+        self.max_ttl = max_ttl
+        self.negative_ttl = negative_ttl
+        self._wall_clock = wall_clock
+        self._cache = TTLCache(max_size=max_size, clock=clock, on_remove=self._unindex)
+        # Cache keys per subject, for revoke_subject; kept in step with the cache
+        self._keys_by_subject: Dict[str, Set[str]] = {}
+
+    def _unindex(self, key: str, value) -> None:
+        if not isinstance(value, TokenData):
+            return
+        keys = self._keys_by_subject.get(value.sub)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_subject[value.sub]
+
+    def _ttl_for(self, token_data: TokenData) -> float:
+        if token_data.expires_at is None:
+            return self.max_ttl
+        return min(self.max_ttl, token_data.expires_at - self._wall_clock())
+
+    async def introspect_token(self, token: str) -> TokenData:
+        key = token_key(token)
+        cached = self._cache.get(key)
+        if isinstance(cached, _InvalidToken):
+            raise ValueError(cached.reason)
+        if cached is not MISSING:
+            # Guard against clock skew between TTL bookkeeping and expires_at
+            if cached.expires_at is None or cached.expires_at > self._wall_clock():
+                return cached
+            self._cache.delete(key)
+
+        try:
+            token_data = await self.inner.introspect_token(token)
+        except ValueError as e:
+            self._cache.set(key, _InvalidToken(str(e)), self.negative_ttl)
+            raise
+
+        self._cache.set(key, token_data, self._ttl_for(token_data))
+        if key in self._cache:
+            self._keys_by_subject.setdefault(token_data.sub, set()).add(key)
+        return token_data
+
+    def revoke(self, token: str) -> bool:
+        """Evict a token (e.g. on logout or a Hydra revocation event)."""
+        return self._cache.delete(token_key(token))
+
+    def revoke_subject(self, sub: str) -> int:
+        """Evict every cached token issued to a subject."""
+        removed = sum(self._cache.delete(key) for key in self._keys_by_subject.pop(sub, set()))
+        logger.info(f"Evicted {removed} cached tokens for subject '{sub}'")
+        return removed
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._keys_by_subject.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
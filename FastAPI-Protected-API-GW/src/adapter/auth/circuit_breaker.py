@@ -0,0 +1,86 @@
+"""
+Circuit breaker for calls to the permission backend.
+
+When Keto is failing or slow, waiting for every call to time out ties up the
+event loop and pooled connections. The breaker trips after a run of failed or
+slow calls and short-circuits further calls until a reset timeout has passed,
+then lets a single probe through to decide whether to close again.
+"""
+
+import time
+from typing import Callable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Args:
+        failure_threshold: Consecutive failed/slow calls that trip the breaker
+        slow_call_threshold: Calls slower than this many seconds count as failures
+        reset_timeout: Seconds to stay open before allowing a probe call
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        slow_call_threshold: float = 1.0,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.times_opened = 0
+        self.short_circuited = 0
+        self.slow_calls = 0
+
+    def allow_request(self) -> bool:
+        """Return True if a call may go to the backend right now."""
+        if self.state == OPEN:
+            if self._clock() - self._opened_at < self.reset_timeout:
+                self.short_circuited += 1
+                return False
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN:
+            if self._probe_in_flight:
+                self.short_circuited += 1
+                return False
+            self._probe_in_flight = True
+        return True
+
+    def record_success(self, latency: float) -> None:
+        if latency > self.slow_call_threshold:
+            self.slow_calls += 1
+            self.record_failure()
+            return
+        self._probe_in_flight = False
+        self.consecutive_failures = 0
+        self.state = CLOSED
+
+    def record_failure(self) -> None:
+        self._probe_in_flight = False
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.times_opened += 1
+            self.state = OPEN
+            self._opened_at = self._clock()
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "short_circuited": self.short_circuited,
+            "slow_calls": self.slow_calls,
+        }
@@ -0,0 +1,67 @@
+"""
+Single-flight decorator for the PermissionChecker port.
+
+Sits between the decision cache and the permission backend so that a burst of
+identical lookups for the same user results in a single backend request.
+"""
+
+from typing import Dict, List
+
+from adapter.cache.single_flight import SingleFlight
+from ports.outbound.auth import PermissionChecker
+
+
+class CoalescingPermissionChecker(PermissionChecker):
+    """
+    PermissionChecker decorator that coalesces concurrent identical calls.
+
+    Calls are keyed by (method, args); concurrent callers with the same key
+    await one shared future instead of each hitting the backend. Batched
+    checks are coalesced per permission and the permissions nobody is
+    already fetching go to the backend's own check_permissions.
+    """
+
+    def __init__(self, inner: PermissionChecker):
+        self.inner = inner
+        self._single_flight = SingleFlight()
+
+    async def check_permission(self, username: str, permission: str) -> bool:
+        return await self._single_flight.do(
+            ("check_permission", username, permission),
+            lambda: self.inner.check_permission(username, permission),
+        )
+
+    async def check_permissions(self, username: str, permissions: List[str]) -> Dict[str, bool]:
+        async def fetch(keys: list) -> dict:
+            allowed = await self.inner.check_permissions(username, [key[2] for key in keys])
+            return {key: allowed[key[2]] for key in keys}
+
+        results = await self._single_flight.do_many(
+            (("check_permission", username, permission) for permission in permissions),
+            fetch,
+        )
+        return {key[2]: allowed for key, allowed in results.items()}
+
+    async def get_user_permissions(self, username: str) -> List[str]:
+        permissions = await self._single_flight.do(
+            ("get_user_permissions", username),
+            lambda: self.inner.get_user_permissions(username),
+        )
+        # Every caller gets its own list so one cannot mutate another's result
+        return list(permissions)
+
+    async def get_user_roles(self, username: str) -> List[str]:
+        roles = await self._single_flight.do(
+            ("get_user_roles", username),
+            lambda: self.inner.get_user_roles(username),
+        )
+        return list(roles)
+
+    async def get_user_permission_mask(self, username: str) -> int:
+        return await self._single_flight.do(
+            ("get_user_permission_mask", username),
+            lambda: self.inner.get_user_permission_mask(username),
+        )
+
+    def stats(self) -> dict:
+        return self._single_flight.stats()
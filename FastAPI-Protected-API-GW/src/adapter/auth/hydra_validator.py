@@ -0,0 +1,85 @@
+"""
+Hydra adapter for token validation (hexagonal architecture).
+
+This adapter implements the TokenValidator port interface using Ory Hydra's
+admin introspection endpoint for opaque access tokens.
+"""
+
+from typing import Optional
+
+import httpx
+
+from config.settings import settings
+from config.logger import logger
+from ports.models.auth import TokenData
+from ports.outbound.auth import TokenValidator
+
+
+def create_hydra_http_client() -> httpx.AsyncClient:
+    """Build the long-lived HTTP client used to talk to Hydra's admin API."""
+    return httpx.AsyncClient(
+        base_url=settings.HYDRA_ADMIN_URL,
+        limits=httpx.Limits(
+            max_connections=settings.HYDRA_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HYDRA_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        timeout=httpx.Timeout(settings.HYDRA_TIMEOUT),
+    )
+
+
+class HydraTokenValidator(TokenValidator):
+    """
+    Adapter that implements TokenValidator using Hydra token introspection.
+
+    Invalid, inactive or unknown tokens raise ValueError. Transport errors
+    and non-200 responses are raised as httpx errors so callers can tell an
+    outage apart from a bad token (and avoid caching it as invalid).
+    """
+
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        self._client = http_client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = create_hydra_http_client()
+        return self._client
+
+    async def introspect_token(self, token: str) -> TokenData:
+        """
+        Introspect an opaque access token with Hydra.
+
+        Args:
+            token: The access token to validate
+
+        Returns:
+            TokenData with user information and scopes
+
+        Raises:
+            ValueError: If token is invalid or inactive
+            httpx.HTTPError: If Hydra is unreachable or answers with a non-200 status
+        """
+        response = await self.client.post(
+            "/admin/oauth2/introspect",
+            data={"token": token},
+        )
+        if response.status_code != 200:
+            logger.warning(f"Hydra introspection returned HTTP {response.status_code}")
+            raise httpx.HTTPStatusError(
+                f"Token introspection failed: HTTP {response.status_code}",
+                request=response.request,
+                response=response,
+            )
+
+        data = response.json()
+        if not data.get("active", False):
+            raise ValueError("Token is not active")
+
+        ext = data.get("ext") or {}
+        return TokenData(
+            sub=data.get("sub", ""),
+            username=ext.get("username") or data.get("username") or data.get("sub", ""),
+            scopes=(data.get("scope") or "").split(),
+            active=True,
+            expires_at=data.get("exp"),
+        )
@@ -0,0 +1,179 @@
+"""
+JWT adapter for token validation (hexagonal architecture).
+
+This adapter implements the TokenValidator port interface by verifying
+Hydra-issued JWT access tokens locally against Hydra's JSON Web Key Set.
+Keys are fetched once, parsed once and kept in memory keyed by `kid`, so the
+request path is a signature check and claim validation with no network I/O.
+The key set is only re-fetched when a token references an unknown `kid`
+(i.e. after Hydra rotated its signing keys).
+"""
+
+import asyncio
+import time
+from typing import Callable, Dict, List, Optional
+
+import httpx
+from joserfc import jwt
+from joserfc.errors import JoseError
+from joserfc.jwk import JWKRegistry
+from joserfc.jws import extract_compact
+
+from config.settings import settings
+from config.logger import logger
+from ports.models.auth import TokenData
+from ports.outbound.auth import TokenValidator
+
+
+class JwtTokenValidator(TokenValidator):
+    """
+    Adapter that implements TokenValidator by verifying JWTs locally.
+
+    Args:
+        http_client: Shared HTTP client used to download the key set
+        jwks_url: URL of the JSON Web Key Set
+        issuer: Expected `iss` claim, or None to skip the check
+        audience: Expected `aud` claim, or None to skip the check
+        algorithms: Accepted signing algorithms
+        leeway: Allowed clock skew in seconds for `exp`/`nbf`
+        min_refresh_interval: Minimum seconds between key set downloads, so
+            tokens with random `kid`s cannot be used to hammer Hydra
+        clock: Monotonic clock used for the refresh rate limit
+    """
+
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        jwks_url: Optional[str] = None,
+        issuer: Optional[str] = None,
+        audience: Optional[str] = None,
+        algorithms: Optional[List[str]] = None,
+        leeway: int = 0,
+        min_refresh_interval: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._client = http_client
+        self.jwks_url = jwks_url or f"{settings.HYDRA_PUBLIC_URL}/.well-known/jwks.json"
+        self.algorithms = algorithms or ["RS256"]
+        self.min_refresh_interval = min_refresh_interval
+        self._clock = clock
+        self._keys: Dict[str, object] = {}
+        self._last_refresh: Optional[float] = None
+        self._refresh_lock = asyncio.Lock()
+        self.refreshes = 0
+        self.unknown_kids = 0
+
+        claims = {"exp": {"essential": True}, "sub": {"essential": True}}
+        if issuer:
+            claims["iss"] = {"essential": True, "value": issuer}
+        if audience:
+            claims["aud"] = {"essential": True, "value": audience}
+        self._claims_registry = jwt.JWTClaimsRegistry(leeway=leeway, **claims)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient()
+        return self._client
+
+    async def refresh_keys(self) -> int:
+        """
+        Download and parse the key set, replacing the cached keys.
+
+        Returns:
+            Number of usable signing keys loaded
+
+        Raises:
+            ValueError: If the key set cannot be fetched
+        """
+        try:
+            response = await self.client.get(self.jwks_url)
+        except httpx.RequestError as e:
+            raise ValueError(f"Error fetching JWKS: {e}") from e
+        if response.status_code != 200:
+            raise ValueError(f"Error fetching JWKS: HTTP {response.status_code}")
+
+        keys = {}
+        for key_data in response.json().get("keys", []):
+            if key_data.get("use", "sig") != "sig" or not key_data.get("kid"):
+                continue
+            try:
+                keys[key_data["kid"]] = JWKRegistry.import_key(key_data)
+            except (JoseError, ValueError) as e:
+                logger.warning(f"Skipping unusable JWK '{key_data.get('kid')}': {e}")
+
+        self._keys = keys
+        self._last_refresh = self._clock()
+        self.refreshes += 1
+        logger.info(f"Loaded {len(keys)} signing keys from {self.jwks_url}")
+        return len(keys)
+
+    async def _get_key(self, kid: str):
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+
+        self.unknown_kids += 1
+        async with self._refresh_lock:
+            # Another request may have rotated the keys while we waited
+            key = self._keys.get(kid)
+            if key is not None:
+                return key
+            if (
+                self._last_refresh is None
+                or self._clock() - self._last_refresh >= self.min_refresh_interval
+            ):
+                await self.refresh_keys()
+                key = self._keys.get(kid)
+        if key is None:
+            raise ValueError(f"Unknown signing key '{kid}'")
+        return key
+
+    async def introspect_token(self, token: str) -> TokenData:
+        """
+        Verify a JWT access token and map its claims to TokenData.
+
+        Args:
+            token: The JWT access token to validate
+
+        Returns:
+            TokenData with user information and scopes
+
+        Raises:
+            ValueError: If the token is malformed, badly signed or its claims are invalid
+        """
+        try:
+            header = extract_compact(token.encode("utf-8")).headers()
+        except (JoseError, ValueError) as e:
+            raise ValueError(f"Malformed token: {e}") from e
+        kid = header.get("kid")
+        if not kid:
+            raise ValueError("Token header has no 'kid'")
+
+        key = await self._get_key(kid)
+        try:
+            decoded = jwt.decode(token, key, algorithms=self.algorithms)
+            self._claims_registry.validate(decoded.claims)
+        except JoseError as e:
+            raise ValueError(f"Invalid token: {e}") from e
+
+        claims = decoded.claims
+        # Hydra puts granted scopes in `scp`; accept the RFC 9068 `scope` string too
+        scopes = claims.get("scp")
+        if scopes is None:
+            scopes = (claims.get("scope") or "").split()
+        ext = claims.get("ext") or {}
+        return TokenData(
+            sub=claims["sub"],
+            username=ext.get("username") or claims.get("username") or claims["sub"],
+            scopes=list(scopes),
+            active=True,
+            expires_at=claims.get("exp"),
+        )
+
+    def stats(self) -> dict:
+        return {
+            "keys": len(self._keys),
+            "refreshes": self.refreshes,
+            "unknown_kids": self.unknown_kids,
+        }
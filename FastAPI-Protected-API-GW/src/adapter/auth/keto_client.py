@@ -5,11 +5,42 @@ This adapter implements the PermissionChecker port interface using Ory Keto
 as the concrete permission management system.
 """
 
-from typing import List
+import asyncio
+import time
+from typing import AsyncIterator, Dict, Iterable, List, Optional, TYPE_CHECKING
 import httpx
 from config.settings import settings
 from config.logger import logger
-from ports.outbound.auth import PermissionChecker
+from ports.outbound.auth import PermissionBackendUnavailable, PermissionChecker
+from adapter.cache.request_memo import request_memoized
+
+if TYPE_CHECKING:
+    from adapter.auth.circuit_breaker import CircuitBreaker
+    from adapter.auth.role_index import RolePermissionIndex
+
+
+def create_keto_http_client() -> httpx.AsyncClient:
+    """
+    Build the long-lived HTTP client used to talk to Keto.
+
+    Connection limits, keep-alive and per-phase timeouts come from Settings,
+    so every permission check reuses pooled connections instead of paying
+    TCP/TLS setup and teardown on each call.
+    """
+    return httpx.AsyncClient(
+        http2=settings.KETO_HTTP2,
+        limits=httpx.Limits(
+            max_connections=settings.KETO_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.KETO_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.KETO_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            connect=settings.KETO_CONNECT_TIMEOUT,
+            read=settings.KETO_READ_TIMEOUT,
+            write=settings.KETO_WRITE_TIMEOUT,
+            pool=settings.KETO_POOL_TIMEOUT,
+        ),
+    )
 
 
 class KetoPermissionChecker(PermissionChecker):
@@ -24,11 +55,102 @@ class KetoPermissionChecker(PermissionChecker):
     - "fastapi-resource-server:role:data:admin#member@Soro-Kan"
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        role_index: Optional["RolePermissionIndex"] = None,
+        breaker: Optional["CircuitBreaker"] = None,
+    ):
         self.read_url = settings.KETO_READ_URL
         self.write_url = settings.KETO_WRITE_URL
         self.namespace = settings.KETO_NAMESPACE
+        self.role_index = role_index
+        self.breaker = breaker
+        self._client = http_client
+        self._owns_client = http_client is None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Pooled HTTP client shared by all Keto calls.
+
+        An injected client (owned by the DependencyContainer) is used as-is;
+        otherwise one is created lazily and owned by this adapter.
+        """
+        if self._client is None:
+            self._client = create_keto_http_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this adapter created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get(self, path: str, params: dict) -> httpx.Response:
+        """
+        Issue a read API request, guarded by the circuit breaker if configured.
+
+        With a breaker, transport errors, 5xx responses and short-circuited
+        calls raise PermissionBackendUnavailable so callers can tell "Keto is
+        down" apart from "permission denied". Without one, errors surface as
+        before and each lookup fails closed.
+        """
+        if self.breaker is not None and not self.breaker.allow_request():
+            raise PermissionBackendUnavailable("Keto circuit breaker is open")
 
+        if self.breaker is None:
+            return await self.client.get(f"{self.read_url}{path}", params=params)
+
+        started = time.monotonic()
+        recorded = False
+        try:
+            try:
+                response = await self.client.get(f"{self.read_url}{path}", params=params)
+            except httpx.RequestError as e:
+                recorded = True
+                self.breaker.record_failure()
+                raise PermissionBackendUnavailable(f"Error connecting to Keto: {e}") from e
+
+            recorded = True
+            if response.status_code >= 500:
+                self.breaker.record_failure()
+                raise PermissionBackendUnavailable(f"Keto returned HTTP {response.status_code}")
+            self.breaker.record_success(time.monotonic() - started)
+            return response
+        finally:
+            if not recorded:
+                # Cancelled or unexpected error: count it as a failure so a
+                # half-open probe is released instead of blocking every call
+                self.breaker.record_failure()
+
+    async def iter_relation_tuples(self, **query) -> AsyncIterator[dict]:
+        """
+        Iterate over every relation tuple in the namespace matching query.
+
+        Follows Keto's next_page_token pagination. Unlike the permission
+        lookups, errors are raised so bulk loaders can keep their previous state.
+
+        Args:
+            **query: Extra Keto filters (e.g., relation="granted")
+
+        Yields:
+            Relation tuple dicts as returned by Keto
+        """
+        params = {"namespace": self.namespace, **query}
+        while True:
+            response = await self._get("/relation-tuples", params)
+            if response.status_code != 200:
+                raise ValueError(f"Keto returned HTTP {response.status_code} listing relation tuples")
+            data = response.json()
+            for tuple_data in data.get("relation_tuples", []):
+                yield tuple_data
+            next_page_token = data.get("next_page_token")
+            if not next_page_token:
+                return
+            params = {**params, "page_token": next_page_token}
+
+    @request_memoized("keto")
     async def get_user_permissions(self, username: str) -> List[str]:
         """
         Get all permissions granted to a user from Keto.
@@ -48,47 +170,48 @@ class KetoPermissionChecker(PermissionChecker):
             # Returns: ["data:read", "data:write", "data:update", "data:delete"]
         """
         permissions = set()
+        role_names = set()
 
         try:
-            async with httpx.AsyncClient() as client:
-                # Query all relation tuples for this user
-                # Format: GET /relation-tuples?namespace=X&subject_id=username
-                response = await client.get(
-                    f"{self.read_url}/relation-tuples",
-                    params={
-                        "namespace": self.namespace,
-                        "subject_id": username
-                    },
-                    timeout=5.0
+            # Query all relation tuples for this user
+            # Format: GET /relation-tuples?namespace=X&subject_id=username
+            response = await self._get(
+                "/relation-tuples",
+                {
+                    "namespace": self.namespace,
+                    "subject_id": username
+                }
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                relation_tuples = data.get("relation_tuples", [])
+
+                for tuple_data in relation_tuples:
+                    # Extract permission from object field
+                    # Example: "data:read" or "role:data:admin"
+                    obj = tuple_data.get("object", "")
+                    relation = tuple_data.get("relation", "")
+
+                    # Direct permissions have relation "granted"
+                    if relation == "granted" and not obj.startswith("role:"):
+                        permissions.add(obj)
+
+                    # Role memberships - collected and expanded below
+                    if relation == "member" and obj.startswith("role:"):
+                        role_names.add(obj.replace("role:", ""))
+
+                permissions.update(await self._expand_roles(role_names))
+
+                logger.info(f"Retrieved {len(permissions)} permissions for user '{username}'")
+            else:
+                logger.warning(
+                    f"Failed to fetch permissions for user '{username}': "
+                    f"HTTP {response.status_code}"
                 )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    relation_tuples = data.get("relation_tuples", [])
-
-                    for tuple_data in relation_tuples:
-                        # Extract permission from object field
-                        # Example: "data:read" or "role:data:admin"
-                        obj = tuple_data.get("object", "")
-                        relation = tuple_data.get("relation", "")
-
-                        # Direct permissions have relation "granted"
-                        if relation == "granted" and not obj.startswith("role:"):
-                            permissions.add(obj)
-
-                        # Role memberships - need to expand to permissions
-                        if relation == "member" and obj.startswith("role:"):
-                            role_name = obj.replace("role:", "")
-                            role_permissions = await self._get_role_permissions(role_name)
-                            permissions.update(role_permissions)
-
-                    logger.info(f"Retrieved {len(permissions)} permissions for user '{username}'")
-                else:
-                    logger.warning(
-                        f"Failed to fetch permissions for user '{username}': "
-                        f"HTTP {response.status_code}"
-                    )
-
+        except PermissionBackendUnavailable:
+            raise
         except httpx.RequestError as e:
             logger.error(f"Error connecting to Keto: {e}")
         except Exception as e:
@@ -96,6 +219,43 @@ class KetoPermissionChecker(PermissionChecker):
 
         return list(permissions)
 
+    async def _expand_roles(self, role_names: Iterable[str]) -> set:
+        """
+        Expand roles to their permissions concurrently.
+
+        Roles found in the role index are resolved in-process. The rest are
+        looked up in Keto: duplicate role names are looked up once, and at
+        most KETO_LOOKUP_CONCURRENCY lookups are in flight at a time,
+        so N roles cost roughly one Keto round trip instead of N.
+
+        Args:
+            role_names: Role names to expand (e.g., ["data:admin"])
+
+        Returns:
+            Union of the permissions granted by all roles
+        """
+        permissions = set()
+        unique_roles = []
+        for role_name in dict.fromkeys(role_names):
+            indexed = self.role_index.get(role_name) if self.role_index is not None else None
+            if indexed is not None:
+                permissions.update(indexed)
+            else:
+                unique_roles.append(role_name)
+        if not unique_roles:
+            return permissions
+
+        semaphore = asyncio.Semaphore(settings.KETO_LOOKUP_CONCURRENCY)
+
+        async def expand(role_name: str) -> List[str]:
+            async with semaphore:
+                return await self._get_role_permissions(role_name)
+
+        results = await asyncio.gather(*(expand(role) for role in unique_roles))
+        for role_permissions in results:
+            permissions.update(role_permissions)
+        return permissions
+
     async def _get_role_permissions(self, role_name: str) -> List[str]:
         """
         Get all permissions associated with a specific role.
@@ -109,29 +269,29 @@ class KetoPermissionChecker(PermissionChecker):
         permissions = []
 
         try:
-            async with httpx.AsyncClient() as client:
-                # Query permissions for this role
-                # Format: role:data:admin#granted@<permission>
-                response = await client.get(
-                    f"{self.read_url}/relation-tuples",
-                    params={
-                        "namespace": self.namespace,
-                        "object": f"role:{role_name}",
-                        "relation": "granted"
-                    },
-                    timeout=5.0
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    relation_tuples = data.get("relation_tuples", [])
-
-                    for tuple_data in relation_tuples:
-                        # Extract permission from subject
-                        subject = tuple_data.get("subject_id", "")
-                        if subject:
-                            permissions.append(subject)
-
+            # Query permissions for this role
+            # Format: role:data:admin#granted@<permission>
+            response = await self._get(
+                "/relation-tuples",
+                {
+                    "namespace": self.namespace,
+                    "object": f"role:{role_name}",
+                    "relation": "granted"
+                }
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                relation_tuples = data.get("relation_tuples", [])
+
+                for tuple_data in relation_tuples:
+                    # Extract permission from subject
+                    subject = tuple_data.get("subject_id", "")
+                    if subject:
+                        permissions.append(subject)
+
+        except PermissionBackendUnavailable:
+            raise
         except httpx.RequestError as e:
             logger.error(f"Error fetching role permissions: {e}")
         except Exception as e:
@@ -159,35 +319,35 @@ class KetoPermissionChecker(PermissionChecker):
                 # User can read data
         """
         try:
-            async with httpx.AsyncClient() as client:
-                # Use Keto's check API
-                # GET /relation-tuples/check?namespace=X&object=Y&relation=granted&subject_id=Z
-                response = await client.get(
-                    f"{self.read_url}/relation-tuples/check",
-                    params={
-                        "namespace": self.namespace,
-                        "object": permission,
-                        "relation": "granted",
-                        "subject_id": username
-                    },
-                    timeout=5.0
+            # Use Keto's check API
+            # GET /relation-tuples/check?namespace=X&object=Y&relation=granted&subject_id=Z
+            response = await self._get(
+                "/relation-tuples/check",
+                {
+                    "namespace": self.namespace,
+                    "object": permission,
+                    "relation": "granted",
+                    "subject_id": username
+                }
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                allowed = data.get("allowed", False)
+                logger.debug(
+                    f"Permission check: user='{username}', permission='{permission}', "
+                    f"allowed={allowed}"
                 )
+                return allowed
+            else:
+                logger.warning(
+                    f"Keto check returned HTTP {response.status_code} "
+                    f"for user '{username}' permission '{permission}'"
+                )
+                return False
 
-                if response.status_code == 200:
-                    data = response.json()
-                    allowed = data.get("allowed", False)
-                    logger.debug(
-                        f"Permission check: user='{username}', permission='{permission}', "
-                        f"allowed={allowed}"
-                    )
-                    return allowed
-                else:
-                    logger.warning(
-                        f"Keto check returned HTTP {response.status_code} "
-                        f"for user '{username}' permission '{permission}'"
-                    )
-                    return False
-
+        except PermissionBackendUnavailable:
+            raise
         except httpx.RequestError as e:
             logger.error(f"Error connecting to Keto for permission check: {e}")
             return False
@@ -195,6 +355,41 @@ class KetoPermissionChecker(PermissionChecker):
             logger.error(f"Unexpected error checking permission: {e}")
             return False
 
+    async def check_permissions(
+        self,
+        username: str,
+        permissions: List[str]
+    ) -> Dict[str, bool]:
+        """
+        Check several permissions for a user concurrently.
+
+        Each permission is still answered by Keto's check API, so results match
+        check_permission exactly, but the checks share the pooled client and run
+        in parallel (bounded by KETO_LOOKUP_CONCURRENCY), costing about
+        one round trip for the whole batch.
+
+        Args:
+            username: The username to check
+            permissions: The permissions to check (e.g., ["data:read", "project:read"])
+
+        Returns:
+            Mapping of each permission to whether the user has it
+
+        Example:
+            results = await keto_client.check_permissions("Soro-Kan", ["data:read", "project:read"])
+            # Returns: {"data:read": True, "project:read": True}
+        """
+        unique_permissions = list(dict.fromkeys(permissions))
+        semaphore = asyncio.Semaphore(settings.KETO_LOOKUP_CONCURRENCY)
+
+        async def check(permission: str) -> bool:
+            async with semaphore:
+                return await self.check_permission(username, permission)
+
+        results = await asyncio.gather(*(check(permission) for permission in unique_permissions))
+        return dict(zip(unique_permissions, results))
+
+    @request_memoized("keto")
     async def get_user_roles(self, username: str) -> List[str]:
         """
         Get all roles assigned to a user.
@@ -212,30 +407,30 @@ class KetoPermissionChecker(PermissionChecker):
         roles = []
 
         try:
-            async with httpx.AsyncClient() as client:
-                # Query role memberships
-                response = await client.get(
-                    f"{self.read_url}/relation-tuples",
-                    params={
-                        "namespace": self.namespace,
-                        "subject_id": username,
-                        "relation": "member"
-                    },
-                    timeout=5.0
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    relation_tuples = data.get("relation_tuples", [])
-
-                    for tuple_data in relation_tuples:
-                        obj = tuple_data.get("object", "")
-                        if obj.startswith("role:"):
-                            role_name = obj.replace("role:", "")
-                            roles.append(role_name)
-
-                    logger.info(f"Retrieved {len(roles)} roles for user '{username}'")
-
+            # Query role memberships
+            response = await self._get(
+                "/relation-tuples",
+                {
+                    "namespace": self.namespace,
+                    "subject_id": username,
+                    "relation": "member"
+                }
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                relation_tuples = data.get("relation_tuples", [])
+
+                for tuple_data in relation_tuples:
+                    obj = tuple_data.get("object", "")
+                    if obj.startswith("role:"):
+                        role_name = obj.replace("role:", "")
+                        roles.append(role_name)
+
+                logger.info(f"Retrieved {len(roles)} roles for user '{username}'")
+
+        except PermissionBackendUnavailable:
+            raise
         except httpx.RequestError as e:
             logger.error(f"Error connecting to Keto: {e}")
         except Exception as e:
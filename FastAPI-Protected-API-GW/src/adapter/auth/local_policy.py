@@ -0,0 +1,224 @@
+"""
+In-process policy engine implementing the PermissionChecker port.
+
+For read-heavy deployments the namespace's relation tuples are loaded from Keto
+into memory and users -> roles -> permissions are flattened into precomputed
+transitive closures. Checks are then dict lookups and bit tests, with Keto only
+involved in the periodic resync, never on the request path.
+"""
+
+import asyncio
+import time
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from config.logger import logger
+from ports.models.permissions import permission_registry
+from ports.outbound.auth import PermissionBackendUnavailable, PermissionChecker
+
+if TYPE_CHECKING:
+    from adapter.auth.keto_client import KetoPermissionChecker
+
+# (object, relation, subject) with subject either a subject_id or "object#relation" of a subject set
+RelationTuple = Tuple[str, str, str]
+
+
+def _role_name(obj: str) -> str:
+    return obj[len("role:"):] if obj.startswith("role:") else obj
+
+
+def _to_relation_tuple(tuple_data: dict) -> Optional[RelationTuple]:
+    subject = tuple_data.get("subject_id")
+    if not subject:
+        subject_set = tuple_data.get("subject_set") or {}
+        if not subject_set.get("object"):
+            return None
+        subject = f"{subject_set['object']}#{subject_set.get('relation', '')}"
+    return (tuple_data.get("object", ""), tuple_data.get("relation", ""), subject)
+
+
+class LocalPolicyPermissionChecker(PermissionChecker):
+    """
+    PermissionChecker answering from an in-memory relation graph.
+
+    Understands the tuple shapes used in this namespace:
+    - role:<role>#member@<user>                    user is a member of role
+    - role:<role>#granted@<permission>             role grants permission
+    - <permission>#granted@<role>#member           role grants permission (subject set)
+    - role:<role>#member@role:<other>#member       members of other are members of role
+    - <permission>#granted@<user>                  direct grant
+    """
+
+    def __init__(self, keto: "KetoPermissionChecker"):
+        self.keto = keto
+        self._tuples: Set[RelationTuple] = set()
+        self._user_roles: Dict[str, FrozenSet[str]] = {}
+        self._user_masks: Dict[str, int] = {}
+        self._role_permissions: Dict[str, FrozenSet[str]] = {}
+        self._role_parents: Dict[str, Set[str]] = {}
+        self._direct_roles: Dict[str, Set[str]] = {}
+        self._direct_permissions: Dict[str, Set[str]] = {}
+        self.loaded_at: Optional[float] = None
+        self.full_rebuilds = 0
+        self.incremental_updates = 0
+        self._sync_task: Optional[asyncio.Task] = None
+
+    def _require_loaded(self) -> None:
+        if self.loaded_at is None:
+            raise PermissionBackendUnavailable("Local policy has not been synced from Keto yet")
+
+    async def check_permission(self, username: str, permission: str) -> bool:
+        self._require_loaded()
+        return permission_registry.has(self._user_masks.get(username, 0), permission)
+
+    async def check_permissions(self, username: str, permissions: List[str]) -> Dict[str, bool]:
+        self._require_loaded()
+        mask = self._user_masks.get(username, 0)
+        return {permission: permission_registry.has(mask, permission) for permission in permissions}
+
+    async def get_user_permissions(self, username: str) -> List[str]:
+        self._require_loaded()
+        return permission_registry.names(self._user_masks.get(username, 0))
+
+    async def get_user_permission_mask(self, username: str) -> int:
+        self._require_loaded()
+        return self._user_masks.get(username, 0)
+
+    async def get_user_roles(self, username: str) -> List[str]:
+        self._require_loaded()
+        return sorted(self._user_roles.get(username, frozenset()))
+
+    async def sync(self) -> None:
+        """
+        Resync the graph from Keto.
+
+        The new tuple set is diffed against the loaded one. Changes confined to
+        users (memberships, direct grants) only recompute the affected users;
+        changes to role definitions rebuild every closure.
+        """
+        tuples = set()
+        async for tuple_data in self.keto.iter_relation_tuples():
+            relation_tuple = _to_relation_tuple(tuple_data)
+            if relation_tuple is not None:
+                tuples.add(relation_tuple)
+
+        changed = tuples ^ self._tuples
+        if self.loaded_at is not None and not changed:
+            self.loaded_at = time.time()
+            return
+
+        self._index(tuples)
+        role_changes = [t for t in changed if self._is_role_definition(t)]
+        if self.loaded_at is None or role_changes:
+            self._rebuild_all()
+            self.full_rebuilds += 1
+        else:
+            for username in {subject for _, _, subject in changed}:
+                self._rebuild_user(username)
+            self.incremental_updates += 1
+        self._tuples = tuples
+        self.loaded_at = time.time()
+        logger.info(
+            f"Local policy synced: {len(tuples)} tuples, {len(self._user_masks)} users"
+        )
+
+    @staticmethod
+    def _is_role_definition(relation_tuple: RelationTuple) -> bool:
+        obj, relation, subject = relation_tuple
+        if relation == "granted" and (obj.startswith("role:") or "#" in subject):
+            return True
+        return relation == "member" and "#" in subject
+
+    def _index(self, tuples: Set[RelationTuple]) -> None:
+        role_grants: Dict[str, Set[str]] = {}
+        role_parents: Dict[str, Set[str]] = {}
+        direct_roles: Dict[str, Set[str]] = {}
+        direct_permissions: Dict[str, Set[str]] = {}
+
+        for obj, relation, subject in tuples:
+            if relation == "member":
+                if "#" in subject:
+                    # Members of the subject-set role are members of obj's role
+                    child = _role_name(subject.split("#", 1)[0])
+                    role_parents.setdefault(child, set()).add(_role_name(obj))
+                else:
+                    direct_roles.setdefault(subject, set()).add(_role_name(obj))
+            elif relation == "granted":
+                if obj.startswith("role:"):
+                    role_grants.setdefault(_role_name(obj), set()).add(subject)
+                elif "#" in subject:
+                    role_grants.setdefault(_role_name(subject.split("#", 1)[0]), set()).add(obj)
+                else:
+                    direct_permissions.setdefault(subject, set()).add(obj)
+
+        self._role_permissions = {role: frozenset(perms) for role, perms in role_grants.items()}
+        self._role_parents = role_parents
+        self._direct_roles = direct_roles
+        self._direct_permissions = direct_permissions
+
+    def _role_closure(self, roles: Set[str]) -> FrozenSet[str]:
+        """All roles reachable from roles through nested memberships."""
+        seen = set()
+        stack = list(roles)
+        while stack:
+            role = stack.pop()
+            if role in seen:
+                continue
+            seen.add(role)
+            stack.extend(self._role_parents.get(role, ()))
+        return frozenset(seen)
+
+    def _rebuild_user(self, username: str) -> None:
+        direct_roles = self._direct_roles.get(username)
+        direct_permissions = self._direct_permissions.get(username)
+        if not direct_roles and not direct_permissions:
+            self._user_roles.pop(username, None)
+            self._user_masks.pop(username, None)
+            return
+        roles = self._role_closure(direct_roles or set())
+        mask = permission_registry.mask(direct_permissions or ())
+        for role in roles:
+            mask |= permission_registry.mask(self._role_permissions.get(role, ()))
+        self._user_roles[username] = roles
+        self._user_masks[username] = mask
+
+    def _rebuild_all(self) -> None:
+        self._user_roles = {}
+        self._user_masks = {}
+        for username in self._direct_roles.keys() | self._direct_permissions.keys():
+            self._rebuild_user(username)
+
+    def start_periodic_sync(self, interval: float) -> None:
+        """Resync from Keto every interval seconds in a background task."""
+        if interval <= 0 or self._sync_task is not None:
+            return
+
+        async def sync_loop():
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.sync()
+                except Exception as e:
+                    # Keep answering from the previous graph on failure
+                    logger.error(f"Local policy sync failed: {e}")
+
+        self._sync_task = asyncio.create_task(sync_loop())
+
+    async def stop_periodic_sync(self) -> None:
+        if self._sync_task is None:
+            return
+        self._sync_task.cancel()
+        try:
+            await self._sync_task
+        except asyncio.CancelledError:
+            pass
+        self._sync_task = None
+
+    def stats(self) -> dict:
+        return {
+            "tuples": len(self._tuples),
+            "users": len(self._user_masks),
+            "roles": len(self._role_permissions),
+            "loaded_at": self.loaded_at,
+            "full_rebuilds": self.full_rebuilds,
+            "incremental_updates": self.incremental_updates,
+        }
@@ -0,0 +1,124 @@
+"""
+In-process role -> permission index.
+
+Role definitions are effectively static, so instead of asking Keto which
+permissions a role grants on every request, the index is built once at startup
+(from scopes_roles_permissions.json or a bulk Keto dump) and refreshed on a
+schedule or on demand. Role expansion then becomes a dict lookup and Keto is
+only asked for user -> role membership.
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional, TYPE_CHECKING
+
+from config.logger import logger
+
+if TYPE_CHECKING:
+    from adapter.auth.keto_client import KetoPermissionChecker
+
+
+class RolePermissionIndex:
+    """
+    Maps role names (e.g. "data:admin") to the permissions they grant.
+
+    The whole mapping is replaced atomically on each load, so readers never
+    observe a partially built index.
+    """
+
+    def __init__(
+        self,
+        source: str = "file",
+        file_path: Optional[str] = None,
+        keto: Optional["KetoPermissionChecker"] = None,
+    ):
+        if source not in ("file", "keto"):
+            raise ValueError(f"Unsupported role index source '{source}'")
+        if source == "file" and not file_path:
+            raise ValueError("file_path is required for the 'file' role index source")
+        if source == "keto" and keto is None:
+            raise ValueError("A Keto adapter is required for the 'keto' role index source")
+        self.source = source
+        self.file_path = file_path
+        self.keto = keto
+        self._roles: Dict[str, FrozenSet[str]] = {}
+        self.loaded_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def get(self, role_name: str) -> Optional[FrozenSet[str]]:
+        """Return the permissions granted by role_name, or None if unknown."""
+        return self._roles.get(role_name)
+
+    def __len__(self) -> int:
+        return len(self._roles)
+
+    def load_from_file(self, file_path: str) -> None:
+        """Build the index from a scopes_roles_permissions.json file."""
+        data = json.loads(Path(file_path).read_text(encoding="utf-8"))
+        self._replace({
+            role_name: frozenset(definition.get("permissions", []))
+            for role_name, definition in data.get("roles", {}).items()
+        })
+
+    async def load_from_keto(self, keto: "KetoPermissionChecker") -> None:
+        """Build the index from a bulk dump of role grants in Keto."""
+        roles: Dict[str, set] = {}
+        async for tuple_data in keto.iter_relation_tuples(relation="granted"):
+            obj = tuple_data.get("object", "")
+            subject = tuple_data.get("subject_id", "")
+            if obj.startswith("role:") and subject:
+                roles.setdefault(obj.replace("role:", ""), set()).add(subject)
+        self._replace({role_name: frozenset(perms) for role_name, perms in roles.items()})
+
+    async def refresh(self) -> int:
+        """
+        Reload the index from its configured source.
+
+        Returns:
+            Number of roles in the refreshed index
+        """
+        if self.source == "file":
+            self.load_from_file(self.file_path)
+        else:
+            await self.load_from_keto(self.keto)
+        logger.info(f"Role index refreshed from {self.source}: {len(self._roles)} roles")
+        return len(self._roles)
+
+    def _replace(self, roles: Dict[str, FrozenSet[str]]) -> None:
+        self._roles = roles
+        self.loaded_at = time.time()
+
+    def start_periodic_refresh(self, interval: float) -> None:
+        """Refresh the index every interval seconds in a background task."""
+        if interval <= 0 or self._refresh_task is not None:
+            return
+
+        async def refresh_loop():
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.refresh()
+                except Exception as e:
+                    # Keep serving the previous index on failure
+                    logger.error(f"Role index refresh failed: {e}")
+
+        self._refresh_task = asyncio.create_task(refresh_loop())
+
+    async def stop_periodic_refresh(self) -> None:
+        if self._refresh_task is None:
+            return
+        self._refresh_task.cancel()
+        try:
+            await self._refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._refresh_task = None
+
+    def stats(self) -> dict:
+        return {
+            "source": self.source,
+            "roles": len(self._roles),
+            "loaded_at": self.loaded_at,
+        }
@@ -0,0 +1,109 @@
+"""
+Async batch loader (DataLoader pattern).
+
+load(key) does not query right away: it queues the key and schedules one
+dispatch at the end of the current event-loop tick. Every key queued until
+then, e.g. by coroutines started together with asyncio.gather, is fetched
+with a single call to the batch function (one WHERE ... IN (...) query).
+Results stay cached in the loader, so loading a key again is free. Loaders
+are meant to live for one request; see request_memo.request_loader.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional
+
+class LoaderStats:
+    """Load and batch counters, shared by the loaders of every request."""
+
+    def __init__(self):
+        self.loads = 0
+        self.keys_loaded = 0
+        self.batches = 0
+
+    def stats(self) -> dict:
+        return {
+            "loads": self.loads,
+            "keys_loaded": self.keys_loaded,
+            "batches": self.batches,
+            "keys_per_batch": self.keys_loaded / self.batches if self.batches else 0.0,
+        }
+
+
+class BatchLoader:
+    """
+    Batches and caches key lookups.
+
+    Args:
+        batch_fn: Coroutine taking a tuple of distinct keys and returning a
+            dict of key -> value; keys missing from the dict resolve to None
+        max_batch_size: Maximum number of keys per batch_fn call
+        stats: Counters to update; a private set is used when omitted
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[tuple], Awaitable[Dict[Hashable, Any]]],
+        max_batch_size: int = 1000,
+        stats: Optional[LoaderStats] = None,
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.stats = stats if stats is not None else LoaderStats()
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self._queue: List[Hashable] = []
+        self._dispatch_task: Optional[asyncio.Task] = None
+
+    def load(self, key: Hashable) -> Awaitable[Any]:
+        """
+        Return an awaitable resolving to the value of key.
+
+        Callers share one future per key but each gets it behind
+        asyncio.shield, so cancelling one caller never cancels the lookup
+        the others are waiting for.
+        """
+        self.stats.loads += 1
+        future = self._futures.get(key)
+        if future is None or future.cancelled():
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            if not self._queue:
+                loop.call_soon(self._schedule_dispatch, loop)
+            self._queue.append(key)
+        return asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[Hashable]) -> List[Any]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _schedule_dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._dispatch_task = loop.create_task(self._dispatch(self._queue))
+        self._queue = []
+
+    async def _dispatch(self, keys: List[Hashable]) -> None:
+        try:
+            for start in range(0, len(keys), self.max_batch_size):
+                chunk = keys[start:start + self.max_batch_size]
+                self.stats.batches += 1
+                self.stats.keys_loaded += len(chunk)
+                try:
+                    results = await self.batch_fn(tuple(chunk))
+                except Exception as e:
+                    for key in chunk:
+                        # Failures are not cached; the next load retries
+                        future = self._futures.pop(key, None)
+                        if future is not None and not future.done():
+                            future.set_exception(e)
+                    continue
+                for key in chunk:
+                    future = self._futures.get(key)
+                    if future is not None and not future.done():
+                        future.set_result(results.get(key))
+        finally:
+            # If the dispatch itself is cancelled, release waiters instead of
+            # leaving them pending, and let later loads of those keys retry
+            for key in keys:
+                future = self._futures.get(key)
+                if future is not None and not future.done():
+                    future.cancel()
+                if future is not None and future.cancelled():
+                    del self._futures[key]
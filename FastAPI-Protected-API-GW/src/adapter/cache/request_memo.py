@@ -0,0 +1,134 @@
+"""
+Request-scoped memoization.
+
+Adapters decorate idempotent reads with @request_memoized(namespace). Inside a
+request_scope() (opened per HTTP request by RequestMemoMiddleware) repeated
+calls with the same arguments are answered from a dict held in a ContextVar,
+so one request never issues the same DB or Keto lookup twice. The dict is
+dropped when the scope ends, so nothing leaks into other requests. Outside a
+scope (background tasks, CLI) the decorated function is called as usual.
+
+request_loader() keeps per-request BatchLoaders in the same dict, so lookups
+issued together are batched and their results dropped with the request.
+
+Hit and load counters go to the MemoStats passed to request_scope(); the
+container owns one instance, so the counters reset with it.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Dict, Hashable, Iterator, Optional
+
+from adapter.cache.batch_loader import BatchLoader, LoaderStats
+
+_memo: ContextVar[Optional[Dict[Hashable, Any]]] = ContextVar("request_memo", default=None)
+_stats: ContextVar[Optional["MemoStats"]] = ContextVar("request_memo_stats", default=None)
+
+
+class MemoStats:
+    """Memo hit/miss counters, plus the counters of the request loaders."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.loaders = LoaderStats()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+@contextmanager
+def request_scope(stats: Optional[MemoStats] = None) -> Iterator[None]:
+    """
+    Open a fresh memo for the duration of the block.
+
+    Args:
+        stats: Counters to update; nothing is counted when omitted
+    """
+    token = _memo.set({})
+    stats_token = _stats.set(stats)
+    try:
+        yield
+    finally:
+        _stats.reset(stats_token)
+        _memo.reset(token)
+
+
+def _private_copy(result: Any) -> Any:
+    # Lists are copied so a caller mutating its result never changes what
+    # later callers in the request get back
+    return list(result) if isinstance(result, list) else result
+
+
+def invalidate_request_memo(namespace: str) -> None:
+    """Forget every memoized result in namespace, e.g. after a write."""
+    memo = _memo.get()
+    if memo:
+        for key in [key for key in memo if key[0] == namespace]:
+            del memo[key]
+
+
+def request_memoized(namespace: str):
+    """
+    Memoize an async function for the current request scope.
+
+    Calls whose arguments are not hashable bypass the memo. List results
+    are copied, so each caller gets its own list.
+
+    Example:
+        @classmethod
+        @request_memoized("db")
+        async def read_record(cls, table_id, ...): ...
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            memo = _memo.get()
+            if memo is None:
+                return await func(*args, **kwargs)
+            stats = _stats.get()
+            key = (namespace, func.__qualname__, args, tuple(sorted(kwargs.items())))
+            try:
+                if key in memo:
+                    if stats is not None:
+                        stats.hits += 1
+                    return _private_copy(memo[key])
+            except TypeError:
+                return await func(*args, **kwargs)
+            if stats is not None:
+                stats.misses += 1
+            result = await func(*args, **kwargs)
+            memo[key] = _private_copy(result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def request_loader(key: Hashable, batch_fn) -> BatchLoader:
+    """
+    Return the BatchLoader registered under key for the current request.
+
+    The key's first element is its namespace, so invalidate_request_memo()
+    drops the loader and its cached results too. Outside a scope a new,
+    unshared loader is returned (nothing is cached across calls).
+
+    Example:
+        loader = request_loader(("db", "find", "teams", "name"), load_teams_by_name)
+        team = await loader.load("platform")
+    """
+    memo = _memo.get()
+    if memo is None:
+        return BatchLoader(batch_fn)
+    loader = memo.get(key)
+    if loader is None:
+        stats = _stats.get()
+        loader = memo[key] = BatchLoader(batch_fn, stats=stats.loaders if stats is not None else None)
+    return loader
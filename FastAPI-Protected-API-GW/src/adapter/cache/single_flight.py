@@ -0,0 +1,91 @@
+"""
+Single-flight request coalescing.
+
+Concurrent callers asking for the same key share one in-flight call instead of
+each issuing their own, which protects backends from thundering herds when a
+cold cache meets a traffic burst.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent async calls by key.
+
+    The first caller for a key starts the call; callers arriving while it is
+    still running await the same future. The result (or exception) is shared
+    and the key is released as soon as the call completes, so nothing is
+    cached beyond the lifetime of the call.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            # shield: one caller being cancelled must not cancel the shared call
+            return await asyncio.shield(future)
+
+        self.calls += 1
+        return await asyncio.shield(self._start(key, fn()))
+
+    async def do_many(
+        self,
+        keys: Iterable[Hashable],
+        fn: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+    ) -> Dict[Hashable, Any]:
+        """
+        Batch variant of do(): keys already in flight are joined, the others
+        are fetched with one fn(missing_keys) call returning {key: value}.
+        Every key of that call is in flight on its own, so later do() or
+        do_many() callers can join it key by key.
+        """
+        futures = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            future = self._in_flight.get(key)
+            if future is None:
+                missing.append(key)
+            else:
+                self.coalesced += 1
+                futures[key] = future
+
+        if missing:
+            self.calls += 1
+            batch = asyncio.ensure_future(fn(missing))
+
+            async def pick(key: Hashable) -> Any:
+                return (await batch)[key]
+
+            for key in missing:
+                futures[key] = self._start(key, pick(key))
+
+        results = await asyncio.gather(*(asyncio.shield(future) for future in futures.values()))
+        return dict(zip(futures, results))
+
+    def _start(self, key: Hashable, call: Awaitable[Any]) -> asyncio.Future:
+        future = asyncio.ensure_future(call)
+        self._in_flight[key] = future
+
+        def release(done: asyncio.Future) -> None:
+            if self._in_flight.get(key) is done:
+                del self._in_flight[key]
+            # Mark the exception as retrieved even if every caller went away
+            if not done.cancelled():
+                done.exception()
+
+        future.add_done_callback(release)
+        return future
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._in_flight),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,143 @@
+"""
+In-process TTL + LRU cache used by caching adapters.
+
+Entries expire after a per-entry TTL and the least recently used entry is
+evicted once the cache reaches its maximum size. Expired entries can be kept
+for an extra stale window and read back explicitly with get_stale(), e.g. to
+serve last-known-good values while a backend is down. Hit, miss, eviction and
+expiration counters are kept so callers can expose them as metrics. An
+on_remove callback lets callers keep side indexes in step with the entries.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+# Sentinel returned by get() on a miss, since None/False are valid cached values
+MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded mapping with per-entry expiry and LRU eviction.
+
+    Not thread-safe; intended to be used from a single event loop.
+
+    Args:
+        max_size: Maximum number of entries before LRU eviction
+        clock: Monotonic clock driving expiry
+        stale_ttl: Seconds an expired entry stays readable with get_stale()
+        on_remove: Called with (key, value) whenever an entry leaves the cache
+            (expiry, eviction, deletion or replacement), except on clear()
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        clock: Callable[[], float] = time.monotonic,
+        stale_ttl: float = 0.0,
+        on_remove: Optional[Callable[[Hashable, Any], None]] = None,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._on_remove = on_remove
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_hits = 0
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Return the cached value for key, or default if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        value, expires_at = entry
+        now = self._clock()
+        if expires_at <= now:
+            if expires_at + self.stale_ttl <= now:
+                self._remove(key)
+                self.expirations += 1
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def get_stale(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Return the value for key even if expired, as long as it is within the stale window."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        if expires_at + self.stale_ttl <= self._clock():
+            return default
+        self.stale_hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds, evicting the LRU entry if full."""
+        if ttl <= 0:
+            self.delete(key)
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, self._clock() + ttl)
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        value, _ = self._entries.pop(key)
+        if self._on_remove is not None:
+            self._on_remove(key, value)
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove key from the cache. Returns True if it was present."""
+        if key not in self._entries:
+            return False
+        self._remove(key)
+        return True
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every key matching predicate. Returns the number removed."""
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def expiring_keys(self, within: float) -> list:
+        """Keys that are still live but expire in the next `within` seconds."""
+        now = self._clock()
+        return [
+            key for key, (_, expires_at) in self._entries.items()
+            if now < expires_at <= now + within
+        ]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[1] > self._clock()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "stale_hits": self.stale_hits,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,18 +1,175 @@
-from fastapi import Depends, Query
-from typing import Annotated
+from fastapi import Depends, HTTPException, Query, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from typing import Annotated, Callable, Dict
 
+from ports.inbound.auth import Authentication, Authorization
 from ports.inbound.data_manager import DataManager
+from ports.models.auth import TokenData
+from ports.models.pagination import decode_page_cursor
+from ports.models.permissions import permission_registry
 from config.container import container
-from adapter.rest.dto import QueryPagination
+from adapter.rest.dto import (
+    QueryPagination, QueryProjection,
+    ReadUserResponse, ReadTeamResponse
+)
 
 
 def get_pagination(
     offset: int | None = Query(None, ge=0),
     limit: int | None = Query(None, ge=1, le=100),
-    order: str = Query("asc", pattern="^(asc|desc)$")
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
 ) -> QueryPagination:
-    return QueryPagination(offset=offset, limit=limit, order=order)
+    if cursor is not None:
+        if offset is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use either 'cursor' or 'offset', not both",
+            )
+        try:
+            decode_page_cursor(cursor, order)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+    return QueryPagination(offset=offset, limit=limit, order=order, cursor=cursor)
+
+
+def projection(response_model, relationships: tuple[str, ...] = ()) -> Callable:
+    """
+    Build a dependency parsing ?fields= and ?include= for a response model.
+
+    fields selects scalar fields of the response model (id is always
+    returned); include names relationships to load. Both are comma-separated.
+    """
+    scalar_fields = [
+        name for name in response_model.model_fields
+        if name not in relationships and name != "entity"
+    ]
+
+    def split(value: str | None, allowed: list[str], parameter: str) -> list[str] | None:
+        if value is None:
+            return None
+        names = [name.strip() for name in value.split(",") if name.strip()]
+        unknown = [name for name in names if name not in allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown {parameter}: {unknown}. Allowed: {allowed}",
+            )
+        return names
+
+    def get_projection(
+        fields: str | None = Query(None, description=f"Comma-separated subset of {scalar_fields}"),
+        include: str | None = Query(None, description=f"Comma-separated subset of {list(relationships)}"),
+    ) -> QueryProjection:
+        selected = split(fields, scalar_fields, "fields")
+        if selected is not None and "id" not in selected:
+            selected.insert(0, "id")
+        return QueryProjection(
+            fields=selected,
+            include=split(include, list(relationships), "include"),
+        )
+
+    return get_projection
 
 
 PublicCrudDep = Annotated[DataManager, Depends(container.get_public_crud)]
 PaginationDep = Annotated[QueryPagination, Depends(get_pagination)]
+UserProjectionDep = Annotated[QueryProjection, Depends(projection(ReadUserResponse))]
+TeamProjectionDep = Annotated[QueryProjection, Depends(projection(ReadTeamResponse, ("manager", "users")))]
+AuthenticationDep = Annotated[Authentication, Depends(container.get_authentication_use_case)]
+AuthorizationDep = Annotated[Authorization, Depends(container.get_authorization_use_case)]
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+async def get_token_data(
+    request: Request,
+    authentication: AuthenticationDep,
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> TokenData:
+    """
+    Validate the bearer token once per request.
+
+    The result is kept on request.state.token_data, together with a
+    request.state.permissions dict of permission decisions already made,
+    so every other dependency and the handler reuse them.
+    """
+    token_data = getattr(request.state, "token_data", None)
+    if token_data is not None:
+        return token_data
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Missing bearer token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    try:
+        token_data = await authentication.validate_access_token(credentials.credentials)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
+        )
+    request.state.token_data = token_data
+    request.state.permissions = {}
+    return token_data
+
+
+TokenDep = Annotated[TokenData, Depends(get_token_data)]
+
+
+def require(*permissions: str) -> Callable:
+    """
+    Build a dependency that guards a route with the given permissions.
+
+    The token must carry every permission as a scope (a bit test against the
+    token's scope mask, no I/O) and the user must still hold it. Only the
+    permissions not yet decided during this request are sent, as one batch,
+    to the Authorization use case (and its cached PermissionChecker).
+
+    Example:
+        @crud_routes.get("/users", dependencies=[Depends(require("data:read"))])
+
+        async def handler(token: Annotated[TokenData, Depends(require("data:write"))]): ...
+    """
+    required = list(dict.fromkeys(permissions))
+    # Route permissions are a fixed set: give them bits up front so token
+    # scopes, which never intern, can be tested against them
+    for permission in required:
+        permission_registry.bit(permission)
+
+    async def dependency(
+        request: Request,
+        token_data: TokenDep,
+        authorization: AuthorizationDep,
+    ) -> TokenData:
+        if not permission_registry.has_all(token_data.scope_mask, required):
+            missing_scopes = [
+                permission for permission in required
+                if not permission_registry.has(token_data.scope_mask, permission)
+            ]
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Token lacks required scopes: {missing_scopes}",
+                headers={"WWW-Authenticate": 'Bearer error="insufficient_scope"'},
+            )
+
+        decisions: Dict[str, bool] = request.state.permissions
+        undecided = [permission for permission in required if permission not in decisions]
+        if undecided:
+            decisions.update(
+                await authorization.check_permissions(token_data.username, undecided)
+            )
+        denied = [permission for permission in required if not decisions.get(permission)]
+        if denied:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Missing permissions: {denied}",
+            )
+        return token_data
+
+    return dependency
@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import Literal
 from uuid import UUID
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
 class CreateUser(BaseModel):
     name: str
@@ -24,6 +25,24 @@ class CreateResponse(BaseModel):
     record_name: str | None = None
 
 
+MAX_BATCH_SIZE = 5000
+
+
+class BatchCreateUsers(BaseModel):
+    records: list[CreateUser] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+    upsert: bool = False
+
+
+class BatchCreateTeams(BaseModel):
+    records: list[CreateTeam] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+    upsert: bool = False
+
+
+class BatchCreateResponse(BaseModel):
+    count: int
+    records: list[CreateResponse]
+
+
 class ReadEntity(BaseModel):
     record_id: UUID | None = None
     record_name: str | None = None
@@ -34,6 +53,12 @@ class QueryPagination(BaseModel):
     offset: int | None = None
     limit: int | None = None
     order: Literal["asc", "desc"] = "asc"
+    cursor: str | None = None
+
+
+class QueryProjection(BaseModel):
+    fields: list[str] | None = None
+    include: list[str] | None = None
 
 
 class ReadUserResponse(BaseModel):
@@ -57,3 +82,22 @@ class ReadTeamResponse(BaseModel):
     manager: ReadUserResponse | None = None
     users: list[ReadUserResponse] | None = None
     entity: Literal["teams"] = "teams"
+
+
+class ExportUserRow(BaseModel):
+    id: UUID
+    name: str
+    email: EmailStr
+    location: str | None = None
+    team_id: UUID | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class ExportTeamRow(BaseModel):
+    id: UUID
+    name: str
+    description: str | None = None
+    manager_id: UUID | None = None
+    created_at: datetime
+    updated_at: datetime
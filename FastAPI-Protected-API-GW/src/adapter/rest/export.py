@@ -0,0 +1,50 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, Iterable, Mapping
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+async def ndjson_chunks(partitions: AsyncIterator[Iterable[Mapping]]) -> AsyncIterator[str]:
+    """Encode each partition of rows as one chunk of newline-delimited JSON."""
+    async for rows in partitions:
+        yield "".join(json.dumps(dict(row), default=str) + "\n" for row in rows)
+
+
+async def csv_chunks(partitions: AsyncIterator[Iterable[Mapping]], columns: list[str]) -> AsyncIterator[str]:
+    """
+    Encode each partition of rows as one chunk of CSV.
+
+    The header comes from the given columns and is sent before any row,
+    so an empty table still exports a valid CSV file.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns)
+    writer.writeheader()
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    async for rows in partitions:
+        writer.writerows(dict(row) for row in rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def export_response(partitions: AsyncIterator[Iterable[Mapping]], entity: str, format: str, row_model: type[BaseModel]) -> StreamingResponse:
+    if format == "csv":
+        chunks = csv_chunks(partitions, list(row_model.model_fields))
+    else:
+        chunks = ndjson_chunks(partitions)
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{entity}.{format}"'},
+    )
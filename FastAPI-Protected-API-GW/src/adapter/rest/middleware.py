@@ -0,0 +1,88 @@
+import math
+from http.cookies import SimpleCookie
+
+from adapter.cache.request_memo import request_scope
+from adapter.sql.data_base import replica_router
+from adapter.sql.replicas import consistency_scope
+from config.container import container
+
+
+class RequestMemoMiddleware:
+    """
+    Opens a request-scoped memo around every HTTP request.
+
+    Implemented as plain ASGI middleware (rather than BaseHTTPMiddleware) so
+    the ContextVar set here is visible to dependencies and handlers, and stays
+    open while streaming responses are produced.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with request_scope(container.get_request_memo_stats()):
+            await self.app(scope, receive, send)
+
+
+class ReadYourWritesMiddleware:
+    """
+    Carries each client's last write time for read-your-writes routing.
+
+    The time comes in with the request as the X-Last-Write header or the
+    last_write cookie. When the request writes, the new time is sent back in
+    both, the cookie expiring with the pin window. Reads within that window of
+    the client's last write go to the primary; see adapter.sql.replicas.
+    """
+
+    header = b"x-last-write"
+    cookie = "last_write"
+
+    def __init__(self, app, pin_window: float | None = None):
+        self.app = app
+        self.pin_window = pin_window
+
+    @classmethod
+    def last_write(cls, scope) -> float | None:
+        value = None
+        for name, header_value in scope.get("headers", ()):
+            if name == cls.header:
+                value = header_value.decode("latin-1")
+                break
+            if name == b"cookie":
+                morsel = SimpleCookie(header_value.decode("latin-1")).get(cls.cookie)
+                if morsel is not None:
+                    value = morsel.value
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
+    def response_headers(self, last_write: float) -> list:
+        pin_window = replica_router.pin_window if self.pin_window is None else self.pin_window
+        value = f"{last_write:.3f}"
+        return [
+            (self.header, value.encode("latin-1")),
+            (
+                b"set-cookie",
+                f"{self.cookie}={value}; Max-Age={math.ceil(pin_window)}; Path=/; HttpOnly; SameSite=Lax".encode("latin-1"),
+            ),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with consistency_scope(self.last_write(scope)) as state:
+            async def send_with_last_write(message):
+                if message["type"] == "http.response.start" and state.wrote:
+                    message = {
+                        **message,
+                        "headers": [*message.get("headers", ()), *self.response_headers(state.last_write)],
+                    }
+                await send(message)
+
+            await self.app(scope, receive, send_with_last_write)
@@ -1,20 +1,40 @@
 from uuid import UUID
-from fastapi import APIRouter, status
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
 
-from adapter.rest.di import PublicCrudDep, PaginationDep
+from config.container import container
+from adapter.rest.di import (
+    PublicCrudDep, PaginationDep,
+    UserProjectionDep, TeamProjectionDep,
+    require
+)
+from adapter.rest.export import export_response
 from adapter.rest.dto import (
     CreateResponse, CreateUser, CreateTeam,
-    ReadUserResponse, ReadTeamResponse
+    BatchCreateUsers, BatchCreateTeams, BatchCreateResponse,
+    ReadUserResponse, ReadTeamResponse, QueryProjection,
+    ExportUserRow, ExportTeamRow
 )
 
 health_routes = APIRouter()
 crud_routes = APIRouter()
+# Operational endpoints change gateway state, so every one needs authz:write
+admin_routes = APIRouter(prefix="/admin", dependencies=[Depends(require("authz:write"))])
 
 @health_routes.get("/health", tags=["Health"])
 def health_check():
     return {"status": "ok"}
 
 
+# Cache, breaker and pool statistics reveal internals, so they need authz:read
+@health_routes.get("/metrics", tags=["Health"], dependencies=[Depends(require("authz:read"))])
+def metrics():
+    return container.get_metrics()
+
+
 @crud_routes.post(
     "/users",
     response_model=CreateResponse,
@@ -57,6 +77,147 @@ async def create_team(
     )
 
 
+def set_next_cursor(response: Response, records) -> None:
+    # List bodies stay plain JSON arrays; the cursor for the next page travels in a header
+    next_cursor = getattr(records, "next_cursor", None)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+
+async def batch_create(data_manager, entity: str, body) -> BatchCreateResponse:
+    records = await data_manager.process(
+        operation="bulk_upsert" if body.upsert else "bulk_create",
+        entity=entity,
+        # Unset fields are left out so an upsert only overwrites what was sent
+        records=[record.model_dump(exclude={"entity"}, exclude_unset=True) for record in body.records]
+    )
+    return BatchCreateResponse(
+        count=len(records),
+        records=[CreateResponse(record_id=rec.id, record_name=rec.name) for rec in records],
+    )
+
+
+@crud_routes.post(
+    "/users/batch",
+    response_model=BatchCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    tags=["Users"]
+)
+async def batch_create_users(
+    body: BatchCreateUsers,
+    data_manager: PublicCrudDep
+):
+    return await batch_create(data_manager, "users", body)
+
+
+@crud_routes.post(
+    "/teams/batch",
+    response_model=BatchCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    tags=["Teams"]
+)
+async def batch_create_teams(
+    body: BatchCreateTeams,
+    data_manager: PublicCrudDep
+):
+    return await batch_create(data_manager, "teams", body)
+
+
+@crud_routes.get(
+    "/users/export",
+    status_code=status.HTTP_200_OK,
+    tags=["Users"]
+)
+async def export_users(
+    data_manager: PublicCrudDep,
+    format: Literal["ndjson", "csv"] = Query("ndjson")
+):
+    partitions = await data_manager.process(operation="export", entity="users")
+    return export_response(partitions, "users", format, ExportUserRow)
+
+
+@crud_routes.get(
+    "/teams/export",
+    status_code=status.HTTP_200_OK,
+    tags=["Teams"]
+)
+async def export_teams(
+    data_manager: PublicCrudDep,
+    format: Literal["ndjson", "csv"] = Query("ndjson")
+):
+    partitions = await data_manager.process(operation="export", entity="teams")
+    return export_response(partitions, "teams", format, ExportTeamRow)
+
+
+TEAM_RELATIONSHIPS = {"manager": ReadUserResponse, "users": ReadUserResponse}
+# Single-team reads load both relationships unless ?include= says otherwise
+TEAM_DEFAULT_INCLUDE = ["manager", "users"]
+
+
+def scalar_fields(response_model, relationships: dict | None = None) -> list[str]:
+    relationships = relationships or {}
+    return [
+        name for name in response_model.model_fields
+        if name not in relationships and name != "entity"
+    ]
+
+
+def project_record(record, response_model, projection: QueryProjection, include: list[str], relationships: dict | None = None) -> dict:
+    """Copy only the selected fields and included relationships of a record."""
+    relationships = relationships or {}
+    fields = projection.fields or scalar_fields(response_model, relationships)
+    data = {name: getattr(record, name) for name in fields}
+    for name in include:
+        value = getattr(record, name)
+        nested_model = relationships[name]
+        if isinstance(value, list):
+            data[name] = [nested_model.model_validate(item) for item in value]
+        else:
+            data[name] = nested_model.model_validate(value) if value is not None else None
+    return data
+
+
+def record_not_found(name: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"{name} not found"
+    )
+
+
+def projected_response(data, projection: QueryProjection, records=None):
+    """
+    Return data as-is when all fields are selected, so the route's
+    response_model applies; partial field selections bypass it.
+    """
+    if projection.fields is None:
+        return data
+    response = JSONResponse(jsonable_encoder(data))
+    if records is not None:
+        set_next_cursor(response, records)
+    return response
+
+
+def rows_response(rows, response_model, projection: QueryProjection, relationships: dict | None = None) -> Response:
+    """
+    Serialize plain row dicts from the fast read path straight to JSON.
+
+    Full reads are given the response model's remaining keys (entity and
+    unloaded relationships) so the payload matches the documented shape.
+    """
+    if projection.fields is None:
+        constants = {name: None for name in relationships or {}}
+        constants["entity"] = response_model.model_fields["entity"].default
+        if isinstance(rows, dict):
+            content = {**rows, **constants}
+        else:
+            content = [{**row, **constants} for row in rows]
+    else:
+        content = rows
+    response = Response(content=to_json(content), media_type="application/json")
+    set_next_cursor(response, rows)
+    return response
+
+
 @crud_routes.get(
     "/users/{record_id}",
     response_model=ReadUserResponse,
@@ -65,14 +226,18 @@ async def create_team(
 )
 async def read_user_by_id(
     record_id: UUID,
-    data_manager: PublicCrudDep
+    data_manager: PublicCrudDep,
+    projection: UserProjectionDep
 ):
-    record = await data_manager.process(
+    row = await data_manager.process(
         operation="read",
         entity="users",
-        record_id=record_id
+        record_id=record_id,
+        columns=projection.fields or scalar_fields(ReadUserResponse)
     )
-    return record
+    if row is None:
+        raise record_not_found("User")
+    return rows_response(row, ReadUserResponse, projection)
 
 
 @crud_routes.get(
@@ -83,16 +248,19 @@ async def read_user_by_id(
 )
 async def read_all_users(
     data_manager: PublicCrudDep,
-    pagination: PaginationDep
+    pagination: PaginationDep,
+    projection: UserProjectionDep
 ):
-    records = await data_manager.process(
+    rows = await data_manager.process(
         operation="read",
         entity="users",
         offset=pagination.offset,
         limit=pagination.limit,
-        order=pagination.order
+        order=pagination.order,
+        cursor=pagination.cursor,
+        columns=projection.fields or scalar_fields(ReadUserResponse)
     )
-    return records
+    return rows_response(rows, ReadUserResponse, projection)
 
 
 @crud_routes.get(
@@ -103,14 +271,23 @@ async def read_all_users(
 )
 async def read_team_by_id(
     record_id: UUID,
-    data_manager: PublicCrudDep
+    data_manager: PublicCrudDep,
+    projection: TeamProjectionDep
 ):
+    include = TEAM_DEFAULT_INCLUDE if projection.include is None else projection.include
     record = await data_manager.process(
         operation="read",
         entity="teams",
-        record_id=record_id
+        record_id=record_id,
+        include=include,
+        fields=projection.fields
+    )
+    if record is None:
+        raise record_not_found("Team")
+    return projected_response(
+        project_record(record, ReadTeamResponse, projection, include, TEAM_RELATIONSHIPS),
+        projection,
     )
-    return record
 
 
 @crud_routes.get(
@@ -120,15 +297,91 @@ async def read_team_by_id(
     tags=["Teams"]
 )
 async def read_all_teams(
+    response: Response,
     data_manager: PublicCrudDep,
-    pagination: PaginationDep
+    pagination: PaginationDep,
+    projection: TeamProjectionDep
 ):
+    if not projection.include:
+        rows = await data_manager.process(
+            operation="read",
+            entity="teams",
+            offset=pagination.offset,
+            limit=pagination.limit,
+            order=pagination.order,
+            cursor=pagination.cursor,
+            columns=projection.fields or scalar_fields(ReadTeamResponse, TEAM_RELATIONSHIPS)
+        )
+        return rows_response(rows, ReadTeamResponse, projection, TEAM_RELATIONSHIPS)
+
     records = await data_manager.process(
         operation="read",
         entity="teams",
         offset=pagination.offset,
         limit=pagination.limit,
-        order=pagination.order
+        order=pagination.order,
+        cursor=pagination.cursor,
+        include=projection.include,
+        fields=projection.fields
+    )
+    set_next_cursor(response, records)
+    return projected_response(
+        [
+            project_record(record, ReadTeamResponse, projection, projection.include, TEAM_RELATIONSHIPS)
+            for record in records
+        ],
+        projection,
+        records,
+    )
+
+
+@crud_routes.get(
+    "/teams/{record_id}/users",
+    response_model=list[ReadUserResponse],
+    status_code=status.HTTP_200_OK,
+    tags=["Teams"]
+)
+async def read_team_members(
+    record_id: UUID,
+    data_manager: PublicCrudDep,
+    pagination: PaginationDep,
+    projection: UserProjectionDep
+):
+    rows = await data_manager.process(
+        operation="read",
+        entity="users",
+        offset=pagination.offset,
+        limit=pagination.limit,
+        order=pagination.order,
+        cursor=pagination.cursor,
+        columns=projection.fields or scalar_fields(ReadUserResponse),
+        filters={"team_id": record_id}
     )
-    return records
+    # An empty page may mean the team itself is missing
+    if not rows and await data_manager.process(
+        operation="read", entity="teams", record_id=record_id, columns=["id"]
+    ) is None:
+        raise record_not_found("Team")
+    return rows_response(rows, ReadUserResponse, projection)
+
 
+@admin_routes.post(
+    "/role-index/refresh",
+    status_code=status.HTTP_200_OK,
+    tags=["Admin"]
+)
+async def refresh_role_index():
+    role_index = container.get_role_index()
+    if role_index is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Role index is not enabled"
+        )
+    try:
+        roles = await role_index.refresh()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Role index refresh failed: {e}"
+        )
+    return {"roles": roles, "source": role_index.source}
@@ -5,19 +5,25 @@ import uvicorn
 
 from config.container import container
 from adapter.sql.data_base import init_db, close_session
-from adapter.rest.routes import health_routes, crud_routes
+from adapter.rest.routes import health_routes, crud_routes, admin_routes
+from adapter.rest.middleware import ReadYourWritesMiddleware, RequestMemoMiddleware
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     container.initialize()
+    await container.startup()
     if environ.get("ENVIRONMENT", "development") == "development":
         await init_db()
     yield
+    await container.shutdown()
     await close_session()
 
 web_app = FastAPI(lifespan=lifespan)
+web_app.add_middleware(RequestMemoMiddleware)
+web_app.add_middleware(ReadYourWritesMiddleware)
 web_app.include_router(health_routes)
 web_app.include_router(crud_routes)
+web_app.include_router(admin_routes)
 
 async def start_web_server():
     await uvicorn.Server(
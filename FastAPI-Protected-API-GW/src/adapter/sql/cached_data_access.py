@@ -0,0 +1,269 @@
+"""
+Read-through entity cache for the DbAccess port.
+
+Users and teams change rarely but are read on every GET by id or name. This
+decorator keeps those single-entity reads in a bounded in-process LRU/TTL
+cache. Records are stored once under their id; unique columns (team name,
+user email) are secondary keys pointing at the id. Any write through the decorator invalidates the written
+table, the tables its foreign keys cascade into, and every cached entity that
+embeds related records.
+
+The cache is per process, so other workers can serve an entity for up to the
+TTL after a write; it is off by default (ENTITY_CACHE_ENABLED). Lookups made
+to validate writes (find_record, find_records: existence and uniqueness of
+teams and users) therefore always go to the database.
+
+With read replicas, only rows read from the primary are stored: a row from a
+lagging replica could otherwise outlive a write in the shared cache and be
+served to the writer, defeating read-your-writes.
+
+Invalidation bumps a generation counter per table. Reads note the generation
+before querying and only store their result if it is unchanged, so a read
+that raced a write never puts the pre-write row back into the cache.
+"""
+
+import time
+from contextlib import nullcontext
+from typing import Callable, Hashable
+from uuid import UUID
+
+from adapter.cache.ttl_cache import MISSING, TTLCache
+from adapter.sql.replicas import ReplicaRouter, track_read_origins
+from ports.repository.data_base import DbAccess
+
+
+class CachedDbAccess(DbAccess):
+    """
+    DbAccess decorator caching single-entity reads.
+
+    Cached: read_record by id or name and read_rows by id. List reads,
+    validation lookups (find_record(s)), exports and writes pass through.
+
+    Args:
+        inner: The DbAccess to decorate
+        max_size: Maximum number of cached entries
+        ttl: Seconds an entity stays cached without being invalidated
+        tables: Tables whose entities are cached
+        clock: Monotonic clock driving expiry
+        replicas: Replica router of the inner DbAccess, if reads may hit replicas
+    """
+
+    # Unique columns usable as secondary keys, per table
+    secondary_keys = {
+        "users": ("email",),
+        "teams": ("name",),
+    }
+
+    # Tables whose rows a write may change through ON DELETE SET NULL
+    # (users.team_id -> teams, teams.manager_id -> users)
+    cascades = {
+        "users": ("teams",),
+        "teams": ("users",),
+    }
+
+    def __init__(
+        self,
+        inner: DbAccess,
+        max_size: int = 10000,
+        ttl: float = 30.0,
+        tables: tuple[str, ...] = ("users", "teams"),
+        clock: Callable[[], float] = time.monotonic,
+        replicas: ReplicaRouter | None = None,
+    ):
+        self.inner = inner
+        self.replicas = replicas
+        self.ttl = ttl
+        self.tables = set(tables)
+        self._cache = TTLCache(max_size=max_size, clock=clock)
+        self.invalidations = 0
+        self._generations: dict[str, int] = {}
+
+    # Cache bookkeeping
+
+    def _generation(self, table_id: str, variant: Hashable) -> int:
+        # Entities with loaded relationships are dropped by writes to any table
+        return self.invalidations if variant[0] else self._generations.get(table_id, 0)
+
+    def _lookup(self, table_id: str, column: str, value, variant: Hashable):
+        """Resolve a secondary key to its id, then fetch the cached variant for that id."""
+        if column != "id":
+            value = self._cache.get(("key", table_id, column, value))
+            if value is MISSING:
+                return MISSING
+        return self._cache.get(("id", table_id, value, variant))
+
+    def _track_reads(self):
+        return track_read_origins() if self.replicas is not None else nullcontext()
+
+    def _cacheable(self, table_id: str, variant: Hashable, generation: int, origins) -> bool:
+        if self._generation(table_id, variant) != generation:
+            # A write invalidated this table while the record was being read
+            return False
+        # Memo hits open no session, so an empty list is as unknown as a replica
+        return origins is None or (bool(origins) and all(origin == "primary" for origin in origins))
+
+    def _store(self, table_id: str, variant: Hashable, record, generation: int, origins=None) -> None:
+        if not self._cacheable(table_id, variant, generation, origins):
+            return
+        get = record.get if isinstance(record, dict) else lambda name, default=None: getattr(record, name, default)
+        record_id = get("id")
+        if record_id is None:
+            return
+        self._cache.set(("id", table_id, record_id, variant), record, self.ttl)
+        for column in self.secondary_keys.get(table_id, ()):
+            value = get(column)
+            if value is not None:
+                self._cache.set(("key", table_id, column, value), record_id, self.ttl)
+
+    def invalidate(self, table_id: str) -> int:
+        """
+        Drop every entry of table_id and of the tables it cascades into, plus
+        entries of other tables that carry loaded relationships (their
+        embedded records may have changed).
+        """
+        tables = {table_id, *self.cascades.get(table_id, ())}
+        for table in tables:
+            self._generations[table] = self._generations.get(table, 0) + 1
+        self.invalidations += 1
+        return self._cache.delete_where(
+            lambda key: key[1] in tables or (key[0] == "id" and bool(key[3][0]))
+        )
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return {**self._cache.stats(), "invalidations": self.invalidations}
+
+    # Cached reads
+
+    async def read_record(
+        self,
+        table_id: str,
+        record_name: str | None = None,
+        record_id: UUID | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        order: str | None = None,
+        cursor: str | None = None,
+        include: tuple[str, ...] | None = None,
+        fields: tuple[str, ...] | None = None,
+        filters: tuple[tuple[str, object], ...] | None = None,
+        ):
+        by_name = record_id is None and "name" in self.secondary_keys.get(table_id, ())
+        cacheable = (
+            table_id in self.tables
+            and (record_id is not None or (record_name is not None and by_name))
+            and fields is None and not filters
+        )
+        if not cacheable:
+            return await self.inner.read_record(
+                table_id=table_id, record_name=record_name, record_id=record_id,
+                offset=offset, limit=limit, order=order, cursor=cursor,
+                include=include, fields=fields, filters=filters,
+            )
+
+        # Variant: loaded relationships ("default" lets the adapter pick, which may load some)
+        variant = (include if include is not None else "default", "record")
+        column, value = ("id", record_id) if record_id is not None else ("name", record_name)
+        record = self._lookup(table_id, column, value, variant)
+        if record is not MISSING:
+            return record
+        generation = self._generation(table_id, variant)
+        with self._track_reads() as origins:
+            record = await self.inner.read_record(
+                table_id=table_id, record_name=record_name, record_id=record_id, include=include,
+            )
+        if record is not None:
+            self._store(table_id, variant, record, generation, origins)
+        return record
+
+    async def read_rows(
+        self,
+        table_id: str,
+        columns: tuple[str, ...],
+        record_id: UUID | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        order: str | None = None,
+        cursor: str | None = None,
+        filters: tuple[tuple[str, object], ...] | None = None,
+        ):
+        if table_id not in self.tables or record_id is None or filters:
+            return await self.inner.read_rows(
+                table_id=table_id, columns=columns, record_id=record_id,
+                offset=offset, limit=limit, order=order, cursor=cursor, filters=filters,
+            )
+
+        variant = ((), "row", tuple(columns))
+        row = self._lookup(table_id, "id", record_id, variant)
+        if row is not MISSING:
+            return row
+        generation = self._generation(table_id, variant)
+        with self._track_reads() as origins:
+            row = await self.inner.read_rows(table_id=table_id, columns=columns, record_id=record_id)
+        if row is not None and self._cacheable(table_id, variant, generation, origins):
+            self._cache.set(("id", table_id, record_id, variant), row, self.ttl)
+        return row
+
+    # Pass-through reads
+
+    async def find_record(self, table_id: str, column: str, value):
+        return await self.inner.find_record(table_id=table_id, column=column, value=value)
+
+    async def find_records(self, table_id: str, column: str, values: tuple):
+        return await self.inner.find_records(table_id=table_id, column=column, values=values)
+
+    def query_records(self):
+        return self.inner.query_records()
+
+    def stream_records(self, table_id: str, batch_size: int = 500):
+        return self.inner.stream_records(table_id=table_id, batch_size=batch_size)
+
+    # Writes invalidate before and after: reads started before the write
+    # completes see the generation change and do not store what they read
+
+    async def create_record(self, table_id: str, attributes: dict):
+        self.invalidate(table_id)
+        try:
+            return await self.inner.create_record(table_id=table_id, attributes=attributes)
+        finally:
+            self.invalidate(table_id)
+
+    async def update_record(
+        self,
+        table_id: str,
+        record_name: str | None = None,
+        record_id: UUID | None = None,
+        attributes: dict = {}
+        ):
+        self.invalidate(table_id)
+        try:
+            return await self.inner.update_record(
+                table_id=table_id, record_name=record_name, record_id=record_id, attributes=attributes
+            )
+        finally:
+            self.invalidate(table_id)
+
+    async def delete_record(self, table_id: str, record_name: str | None = None, record_id: UUID | None = None):
+        self.invalidate(table_id)
+        try:
+            return await self.inner.delete_record(
+                table_id=table_id, record_name=record_name, record_id=record_id
+            )
+        finally:
+            self.invalidate(table_id)
+
+    async def bulk_create_records(self, table_id: str, records: list[dict]):
+        self.invalidate(table_id)
+        try:
+            return await self.inner.bulk_create_records(table_id=table_id, records=records)
+        finally:
+            self.invalidate(table_id)
+
+    async def bulk_upsert_records(self, table_id: str, records: list[dict]):
+        self.invalidate(table_id)
+        try:
+            return await self.inner.bulk_upsert_records(table_id=table_id, records=records)
+        finally:
+            self.invalidate(table_id)
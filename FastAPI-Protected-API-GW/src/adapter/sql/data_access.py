@@ -1,14 +1,20 @@
 from uuid import UUID
+from datetime import datetime
 from contextlib import asynccontextmanager
 
-from sqlmodel import select
+from sqlmodel import select, insert, update, delete
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
+from sqlalchemy import bindparam, func, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from pydantic import ValidationError
 
 from adapter.sql.models import User, Team, Project, ProjectUserLink, ProjectRole
-from adapter.sql.data_base import get_session
+from adapter.sql.data_base import get_session, get_read_session, mark_write
+from adapter.sql.statements import StatementRegistry
+from adapter.cache.request_memo import request_loader, request_memoized, invalidate_request_memo
 from ports.repository.data_base import DbAccess
+from ports.models.pagination import Page, decode_page_cursor, encode_cursor
 
 
 class QueryBuilder:
@@ -54,11 +60,108 @@ class DbAccessImpl(DbAccess):
         "project_roles": ProjectRole,
     }
 
+    # Relationships that read_record can eager load on request (include=...)
+    relationships = {
+        "users": {"team": User.team, "manages": User.manages},
+        "teams": {"manager": Team.manager, "users": Team.users},
+        "projects": {"users": Project.users},
+    }
+
+    # Relationships loaded for single-record reads when include is not given
+    default_includes = {
+        "teams": ("manager", "users"),
+    }
+
+    # Natural keys used to detect conflicts in bulk_upsert_records
+    upsert_keys = {
+        "users": ["email"],
+        "teams": ["name"],
+        "project_roles": ["name"],
+    }
+
+    # Plain columns exported by stream_records (relationships are never loaded)
+    export_columns = {
+        "users": ["id", "name", "email", "location", "team_id", "created_at", "updated_at"],
+        "teams": ["id", "name", "description", "manager_id", "created_at", "updated_at"],
+        "projects": ["id", "name", "description", "created_at", "updated_at"],
+        "project_roles": ["id", "name", "description", "created_at", "updated_at"],
+    }
+
+    # Rows per multi-VALUES statement, kept well under SQLite's bound parameter limit
+    bulk_chunk_size = 500
+
+    # Prebuilt statements of the hot read paths (no fields/filters projections)
+    statements = StatementRegistry()
+
+    @staticmethod
+    def _supports_returning(db, kind: str) -> bool:
+        # kind is "insert", "update" or "delete"; SQLite supports RETURNING from 3.35
+        return getattr(db.bind.dialect, f"{kind}_returning", False)
+
+    @staticmethod
+    def _decode_cursor(table_id: str, cursor: str, order) -> tuple:
+        _, last_value, last_id = decode_page_cursor(cursor, order if order in ("asc", "desc") else None)
+        if table_id == "started_projects":
+            try:
+                last_value = datetime.fromisoformat(last_value)
+            except ValueError as error:
+                raise ValueError(f"Invalid cursor: {error}")
+        return last_value, last_id
+
+    @classmethod
+    def _paginate(cls, statement, table_id: str, order, keyset: bool):
+        """
+        Apply offset or keyset paging and (sort key, id) ordering to a list statement.
+
+        Values are left as bind parameters (see _page_params), so one statement
+        per table, order and paging mode serves every page.
+        """
+        model = cls.table[table_id]
+        order_field = model.created_at if table_id == "started_projects" else model.name
+        if keyset:
+            # Keyset pagination: seek past the (sort key, id) of the previous page
+            page_key = tuple_(order_field, model.id)
+            last_key = tuple_(
+                bindparam("last_value", type_=order_field.type),
+                bindparam("last_id", type_=model.id.type),
+            )
+            statement = statement.where(page_key < last_key if order == "desc" else page_key > last_key)
+        else:
+            statement = statement.offset(bindparam("offset"))
+        statement = statement.limit(bindparam("limit"))
+        if keyset or order in ("asc", "desc"):
+            # id breaks ties so the order is total and cursors are stable
+            statement = statement.order_by(
+                *(
+                    (order_field.desc(), model.id.desc()) if order == "desc"
+                    else (order_field.asc(), model.id.asc())
+                )
+            )
+        return statement
+
+    @classmethod
+    def _page_params(cls, table_id: str, offset, limit, order, cursor) -> tuple:
+        """Bind parameters for a _paginate statement, and the page size."""
+        page_size = limit or 100
+        if not cursor:
+            return {"offset": offset or 0, "limit": page_size}, page_size
+        last_value, last_id = cls._decode_cursor(table_id, cursor, order)
+        return {"last_value": last_value, "last_id": last_id, "limit": page_size}, page_size
+
+    @classmethod
+    def _next_cursor(cls, table_id: str, order, page_size: int, records, get) -> str | None:
+        """Cursor for the page after records, or None if records is the last page."""
+        if order not in ("asc", "desc") or len(records) < page_size:
+            return None
+        sort_key = "created_at" if table_id == "started_projects" else "name"
+        last = records[-1]
+        return encode_cursor([order, get(last, sort_key), str(get(last, "id"))])
+
     @classmethod
     @asynccontextmanager
     async def query_records(cls):
         try:
-            async with get_session() as db:
+            async with get_read_session() as db:
                 yield QueryBuilder(db, cls.table)
 
         except SQLAlchemyError as error:
@@ -68,19 +171,35 @@ class DbAccessImpl(DbAccess):
     async def create_record(cls, table_id: str, attributes: dict):
         if not table_id or table_id not in cls.table.keys():
             raise ValueError(f"Table '{table_id}' does not exist.")
+        invalidate_request_memo("db")
+        mark_write()
         try:
             cls.table[table_id].model_validate(attributes)
             async with get_session() as db:
                 rec = cls.table[table_id](**attributes)
-                db.add(rec)
+                if not cls._supports_returning(db, "insert"):
+                    db.add(rec)
+                    await db.commit()
+                    await db.refresh(rec)
+                    return rec
+                # Single INSERT ... RETURNING instead of INSERT + SELECT refresh
+                statement = (
+                    insert(cls.table[table_id])
+                    .values(**rec.model_dump(exclude_none=True))
+                    .returning(cls.table[table_id])
+                )
+                result = await db.exec(statement)
+                new_record = result.scalar_one()
+                # Detach so commit does not expire the RETURNING values
+                db.expunge(new_record)
                 await db.commit()
-                await db.refresh(rec)
-                return rec
+                return new_record
 
         except (SQLAlchemyError, ValidationError) as error:
             raise ValueError(f"Error occurred: {error}")
 
     @classmethod
+    @request_memoized("db")
     async def read_record(
         cls,
         table_id: str,
@@ -89,6 +208,10 @@ class DbAccessImpl(DbAccess):
         offset: int | None = None,
         limit: int | None = None,
         order: str | None = None,
+        cursor: str | None = None,
+        include: tuple[str, ...] | None = None,
+        fields: tuple[str, ...] | None = None,
+        filters: tuple[tuple[str, object], ...] | None = None,
         ):
         if not table_id or table_id not in cls.table.keys():
             raise ValueError(f"Table '{table_id}' does not exist.")
@@ -96,30 +219,184 @@ class DbAccessImpl(DbAccess):
             raise ValueError(f"Table '{table_id}' does not support filtering by name")
 
         is_single_query = record_id is not None or record_name is not None
+        model = cls.table[table_id]
+        relationships = cls.relationships.get(table_id, {})
+        if include is None:
+            # Single reads keep their historical shape; lists load no relationships
+            include = cls.default_includes.get(table_id, ()) if is_single_query else ()
+        unknown = set(include) - relationships.keys()
+        if unknown:
+            raise ValueError(f"Table '{table_id}' has no relationships {sorted(unknown)}")
+        columns = model.__table__.columns.keys()
+        unknown = {name for name in (fields or ())} | {name for name, _ in (filters or ())}
+        unknown -= set(columns)
+        if unknown:
+            raise ValueError(f"Table '{table_id}' has no columns {sorted(unknown)}")
+        if record_id:
+            lookup, params = "id", {"value": record_id}
+        elif record_name:
+            lookup, params = "name", {"value": record_name}
+        else:
+            lookup = "page"
+            params, page_size = cls._page_params(table_id, offset, limit, order, cursor)
+
+        def build():
+            statement = select(model)
+            # Eager load only the relationships that were asked for
+            statement = statement.options(
+                *(selectinload(relationships[name]) for name in include)
+            )
+            if fields:
+                sort_key = "created_at" if table_id == "started_projects" else "name"
+                loaded = dict.fromkeys(["id", sort_key, *fields])
+                statement = statement.options(
+                    load_only(*(getattr(model, name) for name in loaded if name in columns))
+                )
+            for name, value in filters or ():
+                statement = statement.where(getattr(model, name) == value)
+            if lookup == "page":
+                return cls._paginate(statement, table_id, order, keyset=bool(cursor))
+            return statement.where(getattr(model, lookup) == bindparam("value"))
+
+        if fields or filters:
+            statement = build()
+        else:
+            # Fixed shape: reuse one prebuilt statement per table, lookup, order and includes
+            statement = cls.statements.get(
+                ("record", table_id, lookup, order, bool(cursor), tuple(include)), build
+            )
+        try:
+            async with get_read_session() as db:
+                result = await db.exec(statement, params=params)
+                if is_single_query:
+                    return result.first()
+                records = result.all()
+                return Page(
+                    records,
+                    next_cursor=cls._next_cursor(table_id, order, page_size, records, getattr),
+                )
+
+        except (SQLAlchemyError, ValidationError) as error:
+            raise ValueError(f"Error occurred: {error}")
+
+    @classmethod
+    def _check_column(cls, table_id: str, column: str):
+        if not table_id or table_id not in cls.table.keys():
+            raise ValueError(f"Table '{table_id}' does not exist.")
+        model = cls.table[table_id]
+        if column not in model.__table__.columns.keys():
+            raise ValueError(f"Table '{table_id}' has no column '{column}'")
+        return model
+
+    @classmethod
+    async def find_record(cls, table_id: str, column: str, value):
+        """
+        Return the record whose column equals value (no relationships loaded), or None.
+
+        Lookups are batched per request: every find_record on the same column
+        issued in the same event-loop tick becomes one find_records query, and
+        results are reused for the rest of the request.
+        """
+        cls._check_column(table_id, column)
+
+        async def load(values: tuple) -> dict:
+            records = await cls.find_records(table_id=table_id, column=column, values=values)
+            return {getattr(record, column): record for record in records}
+
+        return await request_loader(("db", "find", table_id, column), load).load(value)
+
+    @classmethod
+    async def find_records(cls, table_id: str, column: str, values: tuple):
+        """Return the records whose column is one of values, in one IN query."""
+        model = cls._check_column(table_id, column)
+        if not values:
+            return []
         try:
+            # Always the primary: lookups validate writes, replica lag would break them
             async with get_session() as db:
-                statement = select(cls.table[table_id])
-                # Eager load sqlalchemy relationships for Team table
-                if table_id == "teams":
-                    statement = statement.options(
-                        selectinload(Team.manager),
-                        selectinload(Team.users)
+                statement = cls.statements.get(
+                    ("find", table_id, column),
+                    lambda: select(model).where(
+                        getattr(model, column).in_(bindparam("values", expanding=True))
+                    ),
+                )
+                result = await db.exec(statement, params={"values": list(values)})
+                return list(result.all())
+
+        except SQLAlchemyError as error:
+            raise ValueError(f"Error occurred: {error}")
+
+    @classmethod
+    @request_memoized("db")
+    async def read_rows(
+        cls,
+        table_id: str,
+        columns: tuple[str, ...],
+        record_id: UUID | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        order: str | None = None,
+        cursor: str | None = None,
+        filters: tuple[tuple[str, object], ...] | None = None,
+        ):
+        """
+        Read-only fast path returning plain dicts of the given columns.
+
+        Selects only those columns through Core, so rows skip ORM hydration,
+        the identity map and attribute instrumentation. Returns one dict (or
+        None) for record_id, otherwise a Page of dicts.
+        """
+        if not table_id or table_id not in cls.table.keys():
+            raise ValueError(f"Table '{table_id}' does not exist.")
+        model = cls.table[table_id]
+        table_columns = model.__table__.columns
+        unknown = ({*columns} | {name for name, _ in (filters or ())}) - set(table_columns.keys())
+        if unknown:
+            raise ValueError(f"Table '{table_id}' has no columns {sorted(unknown)}")
+
+        sort_key = "created_at" if table_id == "started_projects" else "name"
+        # The cursor needs the sort key and id of the last row even if not requested
+        selected = list(dict.fromkeys([*columns, "id", sort_key]))
+        extra = [name for name in selected if name not in columns]
+        if record_id is not None:
+            lookup, params = "id", {"value": record_id}
+        else:
+            lookup = "page"
+            params, page_size = cls._page_params(table_id, offset, limit, order, cursor)
+
+        def build():
+            statement = select(*(table_columns[name] for name in selected))
+            for name, value in filters or ():
+                statement = statement.where(table_columns[name] == value)
+            if lookup == "page":
+                return cls._paginate(statement, table_id, order, keyset=bool(cursor))
+            return statement.where(table_columns["id"] == bindparam("value"))
+
+        if filters:
+            statement = build()
+        else:
+            statement = cls.statements.get(
+                ("rows", table_id, tuple(selected), lookup, order, bool(cursor)), build
+            )
+        try:
+            async with get_read_session() as db:
+                result = await db.exec(statement, params=params)
+                if record_id is not None:
+                    row = result.mappings().first()
+                    return {name: row[name] for name in columns} if row else None
+
+                rows = result.mappings().all()
+                next_cursor = cls._next_cursor(
+                    table_id, order, page_size, rows, lambda row, name: row[name]
+                )
+                if extra:
+                    return Page(
+                        ({name: row[name] for name in columns} for row in rows),
+                        next_cursor=next_cursor,
                     )
-                if record_id:
-                    statement = statement.where(cls.table[table_id].id == record_id)
-                elif record_name:
-                    statement = statement.where(cls.table[table_id].name == record_name)
-                else:
-                    statement = statement.offset(offset or 0).limit(limit or 100)
-                    if order in ("asc", "desc"):
-                        order_field = cls.table[table_id].created_at if table_id == "started_projects" else cls.table[table_id].name
-                        statement = statement.order_by(
-                            order_field.asc() if order == "asc" else order_field.desc()
-                        )
-                result = await db.exec(statement)
-                return result.first() if is_single_query else result.all()
+                return Page((dict(row) for row in rows), next_cursor=next_cursor)
 
-        except (SQLAlchemyError, ValidationError) as error:
+        except SQLAlchemyError as error:
             raise ValueError(f"Error occurred: {error}")
 
     @classmethod
@@ -132,6 +409,8 @@ class DbAccessImpl(DbAccess):
         ):
         if not table_id or table_id not in cls.table.keys():
             raise ValueError(f"Table '{table_id}' does not exist.")
+        invalidate_request_memo("db")
+        mark_write()
 
         record_id = attributes.get("id")
         record_name = attributes.get("name")
@@ -140,23 +419,43 @@ class DbAccessImpl(DbAccess):
         if record_name and table_id == "started_projects":
             raise ValueError(f"Table '{table_id}' does not support filtering by name")
 
+        model = cls.table[table_id]
+        condition = model.id == record_id if record_id else model.name == record_name
+        identifier = f"id '{record_id}'" if record_id else f"name '{record_name}'"
+        changes = {
+            key: value for key, value in attributes.items()
+            if key not in ("id", "created_at", "updated_at") and value is not None
+            and not (key == "name" and record_name and not record_id)
+        }
         try:
             async with get_session() as db:
-                statement = select(cls.table[table_id]).where(
-                    cls.table[table_id].id == record_id if record_id
-                    else cls.table[table_id].name == record_name
-                )
-                result = await db.exec(statement)
+                if changes and cls._supports_returning(db, "update"):
+                    # Single UPDATE ... WHERE ... RETURNING instead of SELECT + UPDATE + refresh
+                    statement = (
+                        update(model)
+                        .where(condition)
+                        .values(**changes)
+                        .returning(model)
+                        .execution_options(synchronize_session=False)
+                    )
+                    result = await db.exec(statement)
+                    updated_record = result.scalar_one_or_none()
+                    if not updated_record:
+                        raise ValueError(f"Record with {identifier} not found in table '{table_id}'.")
+                    db.expunge(updated_record)
+                    await db.commit()
+                    return updated_record
+
+                result = await db.exec(select(model).where(condition))
                 existing_record = result.first()
 
                 if not existing_record:
-                    identifier = f"id '{record_id}'" if record_id else f"name '{record_name}'"
                     raise ValueError(f"Record with {identifier} not found in table '{table_id}'.")
 
-                for key, value in attributes.items():
-                    if key not in ("id", "created_at", "updated_at") and value is not None:
-                        if not (key == "name" and record_name and not record_id):
-                            setattr(existing_record, key, value)
+                if not changes:
+                    return existing_record
+                for key, value in changes.items():
+                    setattr(existing_record, key, value)
                 db.add(existing_record)
                 await db.commit()
                 await db.refresh(existing_record)
@@ -169,19 +468,29 @@ class DbAccessImpl(DbAccess):
     async def delete_record(cls, table_id: str, record_name: str | None = None, record_id: UUID | None = None):
         if not table_id or table_id not in cls.table.keys():
             raise ValueError(f"Table '{table_id}' does not exist.")
+        invalidate_request_memo("db")
+        mark_write()
         if not record_id and not record_name:
             raise ValueError("Either 'id' or 'name' is required for delete operation.")
         if record_name and table_id == "started_projects":
             raise ValueError(f"Table '{table_id}' does not support filtering by name")
+        model = cls.table[table_id]
+        condition = model.id == record_id if record_id else model.name == record_name
+        identifier = f"id '{record_id}'" if record_id else f"name '{record_name}'"
         try:
             async with get_session() as db:
-                statement = select(cls.table[table_id]).where(
-                    cls.table[table_id].id == record_id if record_id else cls.table[table_id].name == record_name
-                )
-                result = await db.exec(statement)
+                if cls._supports_returning(db, "delete"):
+                    # Single DELETE ... RETURNING instead of SELECT + DELETE
+                    statement = delete(model).where(condition).returning(model.id)
+                    result = await db.exec(statement)
+                    if not result.first():
+                        raise ValueError(f"Record with {identifier} not found in table '{table_id}'.")
+                    await db.commit()
+                    return {"message": f"Record deleted successfully"}
+
+                result = await db.exec(select(model).where(condition))
                 existing_record = result.first()
                 if not existing_record:
-                    identifier = f"id '{record_id}'" if record_id else f"name '{record_name}'"
                     raise ValueError(f"Record with {identifier} not found in table '{table_id}'.")
                 await db.delete(existing_record)
                 await db.commit()
@@ -189,3 +498,133 @@ class DbAccessImpl(DbAccess):
 
         except (SQLAlchemyError, ValidationError) as error:
             raise ValueError(f"Error occurred: {error}")
+
+    @classmethod
+    def _bulk_rows(cls, table_id: str, records: list[dict]) -> list[dict]:
+        # Build through the model so defaults (e.g. id) apply, and give every
+        # row the same keys as required by executemany / multi-VALUES inserts
+        model = cls.table[table_id]
+        rows = []
+        for record in records:
+            model.model_validate(record)
+            rows.append(model(**record).model_dump(exclude={"created_at", "updated_at"}))
+        return rows
+
+    @classmethod
+    async def bulk_create_records(cls, table_id: str, records: list[dict]):
+        if not table_id or table_id not in cls.table.keys():
+            raise ValueError(f"Table '{table_id}' does not exist.")
+        if not records:
+            return []
+        invalidate_request_memo("db")
+        mark_write()
+        try:
+            rows = cls._bulk_rows(table_id, records)
+            model = cls.table[table_id]
+            async with get_session() as db:
+                # One transaction; executemany batches the rows into multi-VALUES inserts
+                if cls._supports_returning(db, "insert"):
+                    result = await db.exec(insert(model).returning(model), params=rows)
+                    new_records = list(result.scalars().all())
+                else:
+                    new_records = [model(**row) for row in rows]
+                    db.add_all(new_records)
+                    await db.flush()
+                db.expunge_all()
+                await db.commit()
+                return new_records
+
+        except (SQLAlchemyError, ValidationError) as error:
+            raise ValueError(f"Error occurred: {error}")
+
+    @classmethod
+    def _merge_upserts(cls, table_id: str, records: list[dict]) -> list[dict]:
+        # Records sharing a conflict key are merged in order, as if upserted one
+        # after the other: a single ON CONFLICT statement cannot touch a row twice
+        merged = {}
+        for record in records:
+            key = tuple(record.get(column) for column in cls.upsert_keys[table_id])
+            merged[key] = {**merged.get(key, {}), **record}
+        return list(merged.values())
+
+    @classmethod
+    async def bulk_upsert_records(cls, table_id: str, records: list[dict]):
+        """
+        Insert records or, on a conflict key match, update the existing rows.
+
+        Only the columns present in a record are updated on conflict, so
+        omitted fields keep their stored values instead of being reset to
+        their defaults. Records are grouped by the set of columns they carry,
+        one statement per group and chunk.
+        """
+        if not table_id or table_id not in cls.upsert_keys.keys():
+            raise ValueError(f"Table '{table_id}' does not support upsert.")
+        if not records:
+            return []
+        invalidate_request_memo("db")
+        mark_write()
+        try:
+            groups = {}
+            for record in cls._merge_upserts(table_id, records):
+                groups.setdefault(frozenset(record), []).append(record)
+            model = cls.table[table_id]
+            conflict_keys = cls.upsert_keys[table_id]
+            async with get_session() as db:
+                dialect = db.bind.dialect.name
+                if dialect == "postgresql":
+                    dialect_insert = postgresql.insert
+                elif dialect == "sqlite":
+                    dialect_insert = sqlite.insert
+                else:
+                    raise ValueError(f"Upsert is not supported on '{dialect}'.")
+
+                upserted = []
+                for sent, group in groups.items():
+                    rows = cls._bulk_rows(table_id, group)
+                    for start in range(0, len(rows), cls.bulk_chunk_size):
+                        statement = dialect_insert(model).values(rows[start:start + cls.bulk_chunk_size])
+                        statement = statement.on_conflict_do_update(
+                            index_elements=conflict_keys,
+                            set_={
+                                **{
+                                    column: statement.excluded[column]
+                                    for column in rows[0]
+                                    if column in sent and column != "id" and column not in conflict_keys
+                                },
+                                # onupdate does not fire for ON CONFLICT DO UPDATE
+                                "updated_at": func.now(),
+                            },
+                        ).returning(model)
+                        result = await db.exec(statement)
+                        upserted.extend(result.scalars().all())
+                db.expunge_all()
+                await db.commit()
+                return upserted
+
+        except (SQLAlchemyError, ValidationError) as error:
+            raise ValueError(f"Error occurred: {error}")
+
+    @classmethod
+    async def stream_records(cls, table_id: str, batch_size: int = 500):
+        """
+        Yield lists of row mappings read through a server-side cursor.
+
+        Only the export columns are selected and at most batch_size rows are
+        held in memory at a time, whatever the table size.
+        """
+        if not table_id or table_id not in cls.export_columns.keys():
+            raise ValueError(f"Table '{table_id}' does not support export.")
+        model = cls.table[table_id]
+        statement = (
+            select(*(getattr(model, column) for column in cls.export_columns[table_id]))
+            .order_by(model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        try:
+            async with get_read_session() as db:
+                result = await db.stream(statement)
+                async for partition in result.mappings().partitions():
+                    yield partition
+
+        except SQLAlchemyError as error:
+            raise ValueError(f"Error occurred: {error}")
@@ -3,22 +3,32 @@ from os import environ
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
-from sqlalchemy import event
+from sqlalchemy import event, make_url
+
+from adapter.sql.pool import InstrumentedQueuePool, PoolMetrics, pool_options
+from adapter.sql.replicas import ReplicaRouter
+from config.settings import settings
+
+
+def server_engine(connection_string: str) -> AsyncEngine:
+    connect_args = {}
+    if make_url(connection_string).drivername == "postgresql+asyncpg":
+        # Per-connection LRU of asyncpg prepared statements (0 behind PgBouncer transaction pooling)
+        connect_args["prepared_statement_cache_size"] = settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+    # Pool sizing and pre-ping strategy come from Settings (see adapter/sql/pool.py)
+    return create_async_engine(
+        connection_string,
+        echo = False,
+        future = True,
+        query_cache_size = settings.DB_QUERY_CACHE_SIZE,
+        connect_args = connect_args,
+        **pool_options(settings),
+    )
 
 
 def db_engine(env: str) -> AsyncEngine:
     if env not in ["development", "test"]:
-        connection_string = environ.get("PSQL_DATABASE_URL")
-        return create_async_engine(
-            connection_string,
-            echo = False,
-            future = True,
-            pool_pre_ping = True,
-            pool_size = 20,
-            max_overflow = 2,
-            pool_timeout = 30,
-            pool_recycle = 7200,
-        )
+        return server_engine(environ.get("PSQL_DATABASE_URL"))
 
     else:
         if env == "development":
@@ -34,6 +44,7 @@ def db_engine(env: str) -> AsyncEngine:
                 "check_same_thread": False
                 },
             future = True,
+            poolclass = InstrumentedQueuePool,
             pool_pre_ping = True,
         )
         @event.listens_for(dev_engine.sync_engine, "connect")
@@ -49,13 +60,51 @@ async def init_db() -> None:
         async with engine.begin() as conn:
             await conn.run_sync(SQLModel.metadata.create_all)
 
+def replica_engines() -> list[AsyncEngine]:
+    urls = [url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+    return [server_engine(url) for url in urls]
+
 def get_session() -> AsyncSession:
     return AsyncSession(engine)
 
+def get_read_session():
+    """Session for reads that tolerate replica lag (async context manager)."""
+    return replica_router.session()
+
+def mark_write() -> None:
+    """Keep this client's reads on the primary for the read-your-writes window."""
+    replica_router.mark_write()
+
+def idle_pre_ping() -> float | None:
+    return settings.DB_POOL_PRE_PING_IDLE if settings.DB_POOL_PRE_PING == "idle" else None
+
+def pool_stats() -> dict:
+    """Live pool metrics of the primary and every replica engine."""
+    return {name: metrics.stats() for name, metrics in pool_metrics.items()}
+
 async def close_session() -> bool:
+    await replica_router.dispose()
     await engine.dispose()
     return True
 
 
 current_environment = environ.get("ENVIRONMENT", "development")
-engine = db_engine(current_environment)
\ No newline at end of file
+engine = db_engine(current_environment)
+replica_router = ReplicaRouter(
+    primary=engine,
+    replicas=replica_engines(),
+    strategy=settings.DATABASE_REPLICA_STRATEGY,
+    pin_window=settings.DATABASE_READ_YOUR_WRITES_WINDOW,
+    health_check_timeout=settings.DATABASE_REPLICA_HEALTH_CHECK_TIMEOUT,
+)
+pool_metrics = {
+    # SQLite dev/test engines keep SQLAlchemy's own pre-ping
+    "primary": PoolMetrics(
+        engine,
+        pre_ping_idle=None if current_environment in ["development", "test"] else idle_pre_ping(),
+    ),
+    **{
+        replica.name: PoolMetrics(replica.engine, pre_ping_idle=idle_pre_ping())
+        for replica in replica_router.replicas
+    },
+}
@@ -4,7 +4,7 @@ from datetime import datetime
 
 from pydantic import ConfigDict, EmailStr
 from sqlmodel import Field, SQLModel, String, Relationship
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import Column, DateTime, Index, func
 
 
 class ProjectUserLink(SQLModel, table=True):
@@ -23,6 +23,8 @@ class ProjectUserLink(SQLModel, table=True):
 
 class User(SQLModel, table=True):
     model_config = ConfigDict(extra='ignore')
+    # Backs keyset pagination on (name, id); names are not unique
+    __table_args__ = (Index("ix_user_name_id", "name", "id"),)
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     name: str = Field(index=True)
@@ -0,0 +1,175 @@
+"""
+Connection pool configuration and instrumentation for the SQL adapter.
+
+pool_options() turns Settings into create_async_engine keyword arguments,
+shrinking the per-process pool so that all uvicorn workers together stay
+within DB_MAX_CONNECTIONS. PoolMetrics hooks pool events to expose live
+usage (checked out, overflow, wait time, timeouts) in container metrics.
+
+Pre-ping strategies:
+
+- "always": SQLAlchemy pings on every checkout (one extra round trip each);
+- "idle": ping only connections that sat in the pool longer than
+  DB_POOL_PRE_PING_IDLE seconds, which is when servers and proxies drop them;
+- "never": rely on pool_recycle and error-time invalidation only.
+"""
+
+import time
+from typing import Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from config.logger import logger
+
+PRE_PING_STRATEGIES = ("always", "idle", "never")
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool timing every checkout (wait for a free slot included)."""
+
+    metrics: Optional["PoolMetrics"] = None
+    # Log as SQLAlchemy's pool (WARN by default) rather than under this module
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.AsyncAdaptedQueuePool"
+
+    def connect(self):
+        if self.metrics is None:
+            return super().connect()
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.record_wait(time.perf_counter() - started)
+
+    def recreate(self):
+        # engine.dispose() replaces the pool; keep reporting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def pool_options(settings) -> dict:
+    """
+    Build pool keyword arguments for create_async_engine from settings.
+
+    With DB_MAX_CONNECTIONS set, pool_size + max_overflow is capped at
+    DB_MAX_CONNECTIONS // WEB_CONCURRENCY so every worker gets a fair share.
+
+    Raises:
+        ValueError: If DB_POOL_PRE_PING is not a known strategy
+    """
+    if settings.DB_POOL_PRE_PING not in PRE_PING_STRATEGIES:
+        raise ValueError(
+            f"Unknown DB_POOL_PRE_PING '{settings.DB_POOL_PRE_PING}'. Use one of {PRE_PING_STRATEGIES}"
+        )
+    pool_size = settings.DB_POOL_SIZE
+    max_overflow = settings.DB_POOL_MAX_OVERFLOW
+    if settings.DB_MAX_CONNECTIONS > 0:
+        per_worker = max(1, settings.DB_MAX_CONNECTIONS // max(1, settings.WEB_CONCURRENCY))
+        if pool_size + max_overflow > per_worker:
+            pool_size = min(pool_size, per_worker)
+            max_overflow = per_worker - pool_size
+            logger.info(
+                f"Database pool capped at {pool_size}+{max_overflow} connections per worker "
+                f"({settings.DB_MAX_CONNECTIONS} across {settings.WEB_CONCURRENCY} workers)"
+            )
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING == "always",
+    }
+
+
+class PoolMetrics:
+    """
+    Live metrics of one engine's pool, fed by pool event listeners.
+
+    Args:
+        engine: Engine whose pool is observed (must use InstrumentedQueuePool
+            for wait time and timeouts)
+        pre_ping_idle: Ping connections idle longer than this many seconds on
+            checkout (None disables the idle pre-ping)
+        clock: Monotonic clock for idle tracking
+    """
+
+    def __init__(self, engine: AsyncEngine, pre_ping_idle: Optional[float] = None, clock=time.monotonic):
+        self.engine = engine
+        self.pre_ping_idle = pre_ping_idle
+        self.clock = clock
+        self.connects = 0
+        self.checkouts = 0
+        self.invalidations = 0
+        self.pings = 0
+        self.failed_pings = 0
+        self.timeouts = 0
+        self.waits = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+        pool = engine.sync_engine.pool
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.metrics = self
+        event.listen(engine.sync_engine, "connect", self._on_connect)
+        event.listen(engine.sync_engine, "checkout", self._on_checkout)
+        event.listen(engine.sync_engine, "checkin", self._on_checkin)
+        event.listen(engine.sync_engine, "invalidate", self._on_invalidate)
+
+    def record_wait(self, seconds: float) -> None:
+        self.waits += 1
+        self.wait_time_total += seconds
+        self.wait_time_max = max(self.wait_time_max, seconds)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        self.connects += 1
+        connection_record.info["checked_in_at"] = self.clock()
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        self.checkouts += 1
+        if self.pre_ping_idle is None:
+            return
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or self.clock() - checked_in_at < self.pre_ping_idle:
+            return
+        self.pings += 1
+        try:
+            self.engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            # The pool discards this connection and retries with a fresh one
+            self.failed_pings += 1
+            raise exc.DisconnectionError(f"Idle connection failed pre-ping: {e}")
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = self.clock()
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        self.invalidations += 1
+
+    def stats(self) -> dict:
+        pool = self.engine.sync_engine.pool
+        gauges = {}
+        if hasattr(pool, "checkedout"):
+            gauges = {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+            }
+        return {
+            **gauges,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "invalidations": self.invalidations,
+            "pings": self.pings,
+            "failed_pings": self.failed_pings,
+            "timeouts": self.timeouts,
+            "wait_time_avg": self.wait_time_total / self.waits if self.waits else 0.0,
+            "wait_time_max": self.wait_time_max,
+        }
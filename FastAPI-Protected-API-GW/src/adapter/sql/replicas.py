@@ -0,0 +1,231 @@
+"""
+Read-replica routing for the SQL adapter.
+
+Reads that tolerate replication lag (lists, single reads, exports) open their
+session through ReplicaRouter.session(), which picks a healthy replica by
+round-robin or least in-flight sessions and falls back to the primary when
+no replica is configured or healthy. A background task probes every replica
+with SELECT 1 and takes failing ones out of rotation until they recover.
+
+Read-your-writes: the time of a client's last write travels with the client
+(ReadYourWritesMiddleware reads it from a cookie or header and sends it back
+after a write), and reads within pin_window seconds of it go to the primary.
+Keeping it on the client rather than in this process means the pin holds
+whichever worker serves the next request, and anonymous clients never share
+or miss a pin.
+
+track_read_origins() lets callers see which engines served the reads made in
+a block, e.g. so a shared cache only keeps rows read from the primary.
+"""
+
+import asyncio
+import itertools
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from config.logger import logger
+
+_consistency: ContextVar[Optional["ConsistencyState"]] = ContextVar("consistency", default=None)
+_read_origins: ContextVar[Optional[list]] = ContextVar("read_origins", default=None)
+
+
+class ConsistencyState:
+    """Last write time (epoch seconds) of one client, and whether the block wrote."""
+
+    def __init__(self, last_write: Optional[float] = None):
+        self.last_write = last_write
+        self.wrote = False
+
+
+@contextmanager
+def consistency_scope(last_write: Optional[float] = None) -> Iterator[ConsistencyState]:
+    """Attribute the reads and writes of the block to one client request."""
+    state = ConsistencyState(last_write)
+    token = _consistency.set(state)
+    try:
+        yield state
+    finally:
+        _consistency.reset(token)
+
+
+@contextmanager
+def track_read_origins() -> Iterator[list]:
+    """Collect "primary" or the replica name for every read session opened in the block."""
+    origins = []
+    token = _read_origins.set(origins)
+    try:
+        yield origins
+    finally:
+        _read_origins.reset(token)
+
+
+async def probe_engine(engine: AsyncEngine) -> None:
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+class Replica:
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.healthy = True
+        self.in_flight = 0
+        self.reads = 0
+        self.failed_checks = 0
+
+    def stats(self) -> dict:
+        return {
+            "healthy": self.healthy,
+            "in_flight": self.in_flight,
+            "reads": self.reads,
+            "failed_checks": self.failed_checks,
+        }
+
+
+class ReplicaRouter:
+    """
+    Routes read sessions to replicas and write sessions to the primary.
+
+    Args:
+        primary: Engine of the primary database
+        replicas: Engines of the read replicas (may be empty)
+        strategy: "round_robin" or "least_connections"
+        pin_window: Seconds reads stay on the primary after a write (0 disables)
+        health_check_timeout: Seconds a replica probe may take
+        probe: Coroutine raising if an engine is unusable
+        clock: Wall clock (epoch seconds) for write times, shared by all workers
+    """
+
+    strategies = ("round_robin", "least_connections")
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: list[AsyncEngine] = (),
+        strategy: str = "round_robin",
+        pin_window: float = 5.0,
+        health_check_timeout: float = 2.0,
+        probe: Callable[[AsyncEngine], Awaitable[None]] = probe_engine,
+        clock: Callable[[], float] = time.time,
+    ):
+        if strategy not in self.strategies:
+            raise ValueError(f"Unknown replica strategy '{strategy}'. Use one of {self.strategies}")
+        self.primary = primary
+        self.replicas = [Replica(f"replica-{index}", engine) for index, engine in enumerate(replicas)]
+        self.strategy = strategy
+        self.pin_window = pin_window
+        self.health_check_timeout = health_check_timeout
+        self.probe = probe
+        self._clock = clock
+        self._round_robin = itertools.count()
+        self._health_task: Optional[asyncio.Task] = None
+        self.primary_reads = 0
+        self.pinned_reads = 0
+        self.writes = 0
+
+    def mark_write(self) -> None:
+        """Record a write of the current client, keeping its reads on the primary."""
+        state = _consistency.get()
+        if state is None or not self.replicas or self.pin_window <= 0:
+            return
+        state.last_write = self._clock()
+        state.wrote = True
+        self.writes += 1
+
+    def is_pinned(self) -> bool:
+        state = _consistency.get()
+        if state is None or state.last_write is None:
+            return False
+        return 0 <= self._clock() - state.last_write < self.pin_window
+
+    def choose(self) -> Optional[Replica]:
+        """Pick a healthy replica for a read, or None to read from the primary."""
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        if self.strategy == "least_connections":
+            return min(healthy, key=lambda replica: replica.in_flight)
+        return healthy[next(self._round_robin) % len(healthy)]
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """Open a read-only session on a replica (or the primary, see choose)."""
+        replica = None
+        if self.replicas:
+            if self.is_pinned():
+                self.pinned_reads += 1
+            else:
+                replica = self.choose()
+        origins = _read_origins.get()
+        if origins is not None:
+            origins.append("primary" if replica is None else replica.name)
+        if replica is None:
+            self.primary_reads += 1
+            async with AsyncSession(self.primary) as db:
+                yield db
+            return
+
+        replica.in_flight += 1
+        replica.reads += 1
+        try:
+            async with AsyncSession(replica.engine) as db:
+                yield db
+        finally:
+            replica.in_flight -= 1
+
+    async def check_health(self) -> None:
+        """Probe every replica and update which ones take reads."""
+        for replica in self.replicas:
+            try:
+                await asyncio.wait_for(self.probe(replica.engine), self.health_check_timeout)
+            except Exception as e:
+                replica.failed_checks += 1
+                if replica.healthy:
+                    logger.error(f"Database {replica.name} failed its health check: {e}")
+                replica.healthy = False
+            else:
+                if not replica.healthy:
+                    logger.info(f"Database {replica.name} is healthy again")
+                replica.healthy = True
+
+    def start_health_checks(self, interval: float) -> None:
+        """Probe the replicas every interval seconds in a background task."""
+        if not self.replicas or interval <= 0 or self._health_task is not None:
+            return
+
+        async def health_loop():
+            while True:
+                await asyncio.sleep(interval)
+                await self.check_health()
+
+        self._health_task = asyncio.create_task(health_loop())
+
+    async def stop_health_checks(self) -> None:
+        if self._health_task is None:
+            return
+        self._health_task.cancel()
+        try:
+            await self._health_task
+        except asyncio.CancelledError:
+            pass
+        self._health_task = None
+
+    async def dispose(self) -> None:
+        await self.stop_health_checks()
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> dict:
+        return {
+            "strategy": self.strategy,
+            "primary_reads": self.primary_reads,
+            "pinned_reads": self.pinned_reads,
+            "writes": self.writes,
+            "replicas": {replica.name: replica.stats() for replica in self.replicas},
+        }
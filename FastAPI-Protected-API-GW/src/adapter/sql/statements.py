@@ -0,0 +1,59 @@
+"""
+Registry of prebuilt, parameterized statements for the hot SQL paths.
+
+DbAccessImpl's frequent queries (single reads by id/name/email, list pages
+per table and order) only differ in their parameter values. Building them
+once with bindparam() placeholders and reusing the same statement object
+skips re-creating the select()/where()/order_by()/options() constructs and
+lets SQLAlchemy reuse the memoized cache key of the statement, so every call
+goes straight to the compiled form in the engine's query cache (and, on
+asyncpg, to the prepared statement cached per connection).
+"""
+
+from typing import Callable, Hashable
+
+from sqlalchemy.sql import Executable
+
+
+class StatementRegistry:
+    """
+    Keeps prebuilt statements by key.
+
+    Args:
+        max_size: Maximum number of statements kept; once full, further
+            statements are built on every call instead of being registered
+    """
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self._statements: dict[Hashable, Executable] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], Executable]) -> Executable:
+        """Return the statement registered under key, building it on first use."""
+        statement = self._statements.get(key)
+        if statement is not None:
+            self.hits += 1
+            return statement
+        self.misses += 1
+        statement = build()
+        if len(self._statements) < self.max_size:
+            self._statements[key] = statement
+        return statement
+
+    def clear(self) -> None:
+        self._statements.clear()
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._statements),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,12 +1,27 @@
+import httpx
 
 from ports.inbound.data_manager import DataManager
-from ports.inbound.auth import Authorization
-from ports.outbound.auth import PermissionChecker
+from ports.inbound.auth import Authentication, Authorization
+from ports.outbound.auth import PermissionChecker, TokenValidator
 from ports.repository.data_base import DbAccess
 from adapter.sql.data_access import DbAccessImpl
-from adapter.auth.keto_client import KetoPermissionChecker
+from adapter.sql.cached_data_access import CachedDbAccess
+from adapter.sql.data_base import pool_stats, replica_router
+from adapter.auth.keto_client import KetoPermissionChecker, create_keto_http_client
+from adapter.auth.cached_checker import CachedPermissionChecker
+from adapter.auth.coalescing_checker import CoalescingPermissionChecker
+from adapter.auth.role_index import RolePermissionIndex
+from adapter.auth.cache_warmer import AuthzCacheWarmer
+from adapter.auth.circuit_breaker import CircuitBreaker
+from adapter.auth.local_policy import LocalPolicyPermissionChecker
+from adapter.auth.hydra_validator import HydraTokenValidator, create_hydra_http_client
+from adapter.auth.cached_token_validator import CachedTokenValidator
+from adapter.auth.jwt_validator import JwtTokenValidator
+from adapter.cache.request_memo import MemoStats
+from config.logger import logger
+from config.settings import settings
 from core.data_manager.use_cases import DataManagerImpl, PublicCrud
-from core.auth.use_cases import AuthorizationImpl
+from core.auth.use_cases import AuthenticationImpl, AuthorizationImpl
 
 
 class DependencyContainer:
@@ -19,33 +34,196 @@ class DependencyContainer:
 
     def __init__(self):
         self._db_access: DbAccess | None = None
+        self._entity_cache: CachedDbAccess | None = None
         self._data_manager: DataManager | None = None
         self._public_crud: DataManager | None = None
+        self._keto_http_client: httpx.AsyncClient | None = None
+        self._role_index: RolePermissionIndex | None = None
+        self._keto_breaker: CircuitBreaker | None = None
+        self._local_policy: LocalPolicyPermissionChecker | None = None
         self._permission_checker: PermissionChecker | None = None
+        self._authz_coalescer: CoalescingPermissionChecker | None = None
+        self._authz_cache: CachedPermissionChecker | None = None
+        self._authz_cache_warmer: AuthzCacheWarmer | None = None
         self._authorization_use_case: Authorization | None = None
+        self._hydra_http_client: httpx.AsyncClient | None = None
+        self._token_validator: TokenValidator | None = None
+        self._token_cache: CachedTokenValidator | None = None
+        self._jwt_validator: JwtTokenValidator | None = None
+        self._authentication_use_case: Authentication | None = None
+        self._request_memo_stats: MemoStats | None = None
         self._initialized = False
 
     def initialize(self) -> None:
         if self._initialized:
             return
         # Data layer
+        self._request_memo_stats = MemoStats()
         self._db_access = DbAccessImpl()
+        if settings.ENTITY_CACHE_ENABLED:
+            self._entity_cache = CachedDbAccess(
+                inner=self._db_access,
+                max_size=settings.ENTITY_CACHE_MAX_SIZE,
+                ttl=settings.ENTITY_CACHE_TTL,
+                replicas=replica_router if replica_router.replicas else None,
+            )
+            self._db_access = self._entity_cache
         self._data_manager = DataManagerImpl(repository=self._db_access)
         self._public_crud = PublicCrud(data_manager=self._data_manager)
         # Auth layer
-        self._permission_checker = KetoPermissionChecker()
+        self._keto_http_client = create_keto_http_client()
+        if settings.KETO_BREAKER_ENABLED:
+            self._keto_breaker = CircuitBreaker(
+                failure_threshold=settings.KETO_BREAKER_FAILURE_THRESHOLD,
+                slow_call_threshold=settings.KETO_BREAKER_SLOW_CALL_THRESHOLD,
+                reset_timeout=settings.KETO_BREAKER_RESET_TIMEOUT,
+            )
+        keto_permission_checker = KetoPermissionChecker(
+            http_client=self._keto_http_client,
+            breaker=self._keto_breaker,
+        )
+        if settings.KETO_ROLE_INDEX_ENABLED:
+            self._role_index = RolePermissionIndex(
+                source=settings.KETO_ROLE_INDEX_SOURCE,
+                file_path=settings.KETO_ROLE_INDEX_FILE,
+                keto=keto_permission_checker,
+            )
+            if self._role_index.source == "file":
+                self._role_index.load_from_file(settings.KETO_ROLE_INDEX_FILE)
+            keto_permission_checker.role_index = self._role_index
+        if settings.AUTHZ_BACKEND == "local":
+            # Answers in-process; Keto is only used for background resyncs,
+            # so the coalescing and cache layers would add nothing
+            self._local_policy = LocalPolicyPermissionChecker(keto=keto_permission_checker)
+            self._permission_checker = self._local_policy
+        elif settings.AUTHZ_BACKEND == "keto":
+            self._permission_checker = self._build_keto_decorators(keto_permission_checker)
+        else:
+            raise ValueError(f"Unsupported AUTHZ_BACKEND '{settings.AUTHZ_BACKEND}'")
         self._authorization_use_case = AuthorizationImpl(permission_checker=self._permission_checker)
+        # Token validation
+        self._hydra_http_client = create_hydra_http_client()
+        if settings.TOKEN_VALIDATION_MODE == "jwt":
+            # Verified locally, so there is no round trip worth caching
+            self._jwt_validator = JwtTokenValidator(
+                http_client=self._hydra_http_client,
+                jwks_url=settings.JWT_JWKS_URL,
+                issuer=settings.JWT_ISSUER,
+                audience=settings.JWT_AUDIENCE,
+                algorithms=[alg.strip() for alg in settings.JWT_ALGORITHMS.split(",") if alg.strip()],
+                leeway=settings.JWT_LEEWAY,
+                min_refresh_interval=settings.JWT_JWKS_MIN_REFRESH_INTERVAL,
+            )
+            self._token_validator = self._jwt_validator
+        elif settings.TOKEN_VALIDATION_MODE == "introspection":
+            self._token_validator = HydraTokenValidator(http_client=self._hydra_http_client)
+            if settings.TOKEN_CACHE_ENABLED:
+                self._token_cache = CachedTokenValidator(
+                    inner=self._token_validator,
+                    max_size=settings.TOKEN_CACHE_MAX_SIZE,
+                    max_ttl=settings.TOKEN_CACHE_MAX_TTL,
+                    negative_ttl=settings.TOKEN_CACHE_NEGATIVE_TTL,
+                )
+                self._token_validator = self._token_cache
+        else:
+            raise ValueError(f"Unsupported TOKEN_VALIDATION_MODE '{settings.TOKEN_VALIDATION_MODE}'")
+        # No identity provider adapter is wired yet; only token validation is used
+        self._authentication_use_case = AuthenticationImpl(
+            identity_provider=None,
+            token_validator=self._token_validator,
+        )
 
         self._initialized = True
 
+    def _build_keto_decorators(self, keto_permission_checker: KetoPermissionChecker) -> PermissionChecker:
+        permission_checker: PermissionChecker = keto_permission_checker
+        if settings.AUTHZ_COALESCE_ENABLED:
+            self._authz_coalescer = CoalescingPermissionChecker(inner=permission_checker)
+            permission_checker = self._authz_coalescer
+        if settings.AUTHZ_CACHE_ENABLED:
+            self._authz_cache = CachedPermissionChecker(
+                inner=permission_checker,
+                max_size=settings.AUTHZ_CACHE_MAX_SIZE,
+                positive_ttl=settings.AUTHZ_CACHE_POSITIVE_TTL,
+                negative_ttl=settings.AUTHZ_CACHE_NEGATIVE_TTL,
+                max_staleness=settings.AUTHZ_CACHE_MAX_STALENESS,
+            )
+            permission_checker = self._authz_cache
+            if settings.AUTHZ_WARMER_ENABLED:
+                self._authz_cache_warmer = AuthzCacheWarmer(
+                    cache=self._authz_cache,
+                    keto=keto_permission_checker,
+                    role_index=self._role_index,
+                    refresh_interval=settings.AUTHZ_WARMER_INTERVAL,
+                    refresh_ahead=settings.AUTHZ_WARMER_REFRESH_AHEAD,
+                    active_window=settings.AUTHZ_WARMER_ACTIVE_WINDOW,
+                    watch_interval=settings.AUTHZ_WATCH_INTERVAL,
+                    refresh_concurrency=settings.KETO_LOOKUP_CONCURRENCY,
+                )
+        return permission_checker
+
     def reset(self) -> None:
         self._db_access = None
+        self._entity_cache = None
         self._data_manager = None
         self._public_crud = None
+        self._keto_http_client = None
+        self._role_index = None
+        self._keto_breaker = None
+        self._local_policy = None
         self._permission_checker = None
+        self._authz_coalescer = None
+        self._authz_cache = None
+        self._authz_cache_warmer = None
         self._authorization_use_case = None
+        self._hydra_http_client = None
+        self._token_validator = None
+        self._token_cache = None
+        self._jwt_validator = None
+        self._authentication_use_case = None
+        self._request_memo_stats = None
         self._initialized = False
 
+    async def startup(self) -> None:
+        replica_router.start_health_checks(settings.DATABASE_REPLICA_HEALTH_CHECK_INTERVAL)
+        if self._role_index is not None:
+            if self._role_index.source == "keto":
+                try:
+                    await self._role_index.refresh()
+                except Exception as e:
+                    # Role expansion falls back to per-role Keto queries
+                    logger.error(f"Initial role index load failed: {e}")
+            self._role_index.start_periodic_refresh(settings.KETO_ROLE_INDEX_REFRESH_INTERVAL)
+        if self._local_policy is not None:
+            try:
+                await self._local_policy.sync()
+            except Exception as e:
+                # Checks fail closed until the first successful periodic sync
+                logger.error(f"Initial local policy sync failed: {e}")
+            self._local_policy.start_periodic_sync(settings.AUTHZ_LOCAL_SYNC_INTERVAL)
+        if self._authz_cache_warmer is not None:
+            self._authz_cache_warmer.start()
+        if self._jwt_validator is not None:
+            try:
+                await self._jwt_validator.refresh_keys()
+            except ValueError as e:
+                # Keys are fetched on the first token instead
+                logger.error(f"Initial JWKS load failed: {e}")
+
+    async def shutdown(self) -> None:
+        await replica_router.stop_health_checks()
+        if self._authz_cache_warmer is not None:
+            await self._authz_cache_warmer.stop()
+        if self._local_policy is not None:
+            await self._local_policy.stop_periodic_sync()
+        if self._role_index is not None:
+            await self._role_index.stop_periodic_refresh()
+        if self._keto_http_client is not None:
+            await self._keto_http_client.aclose()
+        if self._hydra_http_client is not None:
+            await self._hydra_http_client.aclose()
+        self.reset()
+
     def get_db_access(self) -> DbAccess:
         if self._db_access is None:
             raise RuntimeError("Dependencies not initialized. Call container.initialize() first.")
@@ -66,9 +244,61 @@ class DependencyContainer:
             raise RuntimeError("Dependencies not initialized. Call container.initialize() first.")
         return self._permission_checker
 
+    def get_role_index(self) -> RolePermissionIndex | None:
+        return self._role_index
+
     def get_authorization_use_case(self) -> Authorization:
         if self._authorization_use_case is None:
             raise RuntimeError("Dependencies not initialized. Call container.initialize() first.")
         return self._authorization_use_case
 
+    def get_authentication_use_case(self) -> Authentication:
+        if self._authentication_use_case is None:
+            raise RuntimeError("Dependencies not initialized. Call container.initialize() first.")
+        return self._authentication_use_case
+
+    def get_token_validator(self) -> TokenValidator:
+        if self._token_validator is None:
+            raise RuntimeError("Dependencies not initialized. Call container.initialize() first.")
+        return self._token_validator
+
+    def get_entity_cache(self) -> CachedDbAccess | None:
+        return self._entity_cache
+
+    def get_token_cache(self) -> CachedTokenValidator | None:
+        return self._token_cache
+
+    def get_request_memo_stats(self) -> MemoStats | None:
+        return self._request_memo_stats
+
+    def get_metrics(self) -> dict:
+        metrics = {
+            "db_pool": pool_stats(),
+            "db_statements": DbAccessImpl.statements.stats(),
+        }
+        if self._request_memo_stats is not None:
+            metrics["request_memo"] = self._request_memo_stats.stats()
+            metrics["batch_loader"] = self._request_memo_stats.loaders.stats()
+        if replica_router.replicas:
+            metrics["db_replicas"] = replica_router.stats()
+        if self._entity_cache is not None:
+            metrics["entity_cache"] = self._entity_cache.stats()
+        if self._authz_cache is not None:
+            metrics["authz_cache"] = self._authz_cache.stats()
+        if self._authz_coalescer is not None:
+            metrics["authz_single_flight"] = self._authz_coalescer.stats()
+        if self._authz_cache_warmer is not None:
+            metrics["authz_cache_warmer"] = self._authz_cache_warmer.stats()
+        if self._local_policy is not None:
+            metrics["local_policy"] = self._local_policy.stats()
+        if self._keto_breaker is not None:
+            metrics["keto_circuit_breaker"] = self._keto_breaker.stats()
+        if self._role_index is not None:
+            metrics["role_index"] = self._role_index.stats()
+        if self._token_cache is not None:
+            metrics["token_cache"] = self._token_cache.stats()
+        if self._jwt_validator is not None:
+            metrics["jwt_validator"] = self._jwt_validator.stats()
+        return metrics
+
 container = DependencyContainer()
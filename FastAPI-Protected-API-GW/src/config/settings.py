@@ -11,6 +11,27 @@ class Settings(BaseSettings):
 
     HYDRA_ADMIN_URL: str = "http://localhost:4445"
     HYDRA_PUBLIC_URL: str = "http://localhost:4444"
+
+    # Shared Hydra admin HTTP client (timeout in seconds)
+    HYDRA_MAX_CONNECTIONS: int = 100
+    HYDRA_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HYDRA_TIMEOUT: float = 5.0
+
+    # Introspection result cache (TTLs in seconds; entries never outlive the token's exp)
+    TOKEN_CACHE_ENABLED: bool = True
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    TOKEN_CACHE_MAX_TTL: float = 300.0
+    TOKEN_CACHE_NEGATIVE_TTL: float = 30.0
+
+    # Token validation mode: "introspection" (opaque tokens) or "jwt" (local JWKS verification)
+    TOKEN_VALIDATION_MODE: str = "introspection"
+    JWT_JWKS_URL: Optional[str] = None  # Defaults to HYDRA_PUBLIC_URL/.well-known/jwks.json
+    JWT_ISSUER: Optional[str] = None
+    JWT_AUDIENCE: Optional[str] = None
+    JWT_ALGORITHMS: str = "RS256"  # Comma-separated
+    JWT_LEEWAY: int = 5
+    JWT_JWKS_MIN_REFRESH_INTERVAL: float = 10.0
+
     OAUTH2_CLIENT_ID: Optional[str] = None
     OAUTH2_CLIENT_SECRET: Optional[str] = None
 
@@ -22,6 +43,84 @@ class Settings(BaseSettings):
     KETO_WRITE_URL: str = "http://localhost:4467"
     KETO_NAMESPACE: str = "fastapi-resource-server"
 
+    # Shared Keto HTTP client (connection pool, keep-alive, timeouts in seconds)
+    KETO_HTTP2: bool = True
+    KETO_MAX_CONNECTIONS: int = 100
+    KETO_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    KETO_KEEPALIVE_EXPIRY: float = 30.0
+    KETO_CONNECT_TIMEOUT: float = 2.0
+    KETO_READ_TIMEOUT: float = 5.0
+    KETO_WRITE_TIMEOUT: float = 5.0
+    KETO_POOL_TIMEOUT: float = 2.0
+    KETO_LOOKUP_CONCURRENCY: int = 10
+
+    # Circuit breaker around Keto (slow call threshold and reset timeout in seconds)
+    KETO_BREAKER_ENABLED: bool = True
+    KETO_BREAKER_FAILURE_THRESHOLD: int = 5
+    KETO_BREAKER_SLOW_CALL_THRESHOLD: float = 1.0
+    KETO_BREAKER_RESET_TIMEOUT: float = 30.0
+
+    # In-process role -> permission index ("file" or "keto" source)
+    KETO_ROLE_INDEX_ENABLED: bool = False
+    KETO_ROLE_INDEX_SOURCE: str = "file"
+    KETO_ROLE_INDEX_FILE: str = "ory/keto/scopes_roles_permissions.json"
+    KETO_ROLE_INDEX_REFRESH_INTERVAL: float = 0.0
+
+    # Permission backend: "keto" (remote checks) or "local" (in-process policy synced from Keto)
+    AUTHZ_BACKEND: str = "keto"
+    AUTHZ_LOCAL_SYNC_INTERVAL: float = 30.0
+
+    # Authorization decision cache (TTLs in seconds)
+    AUTHZ_CACHE_ENABLED: bool = True
+    AUTHZ_CACHE_MAX_SIZE: int = 10000
+    AUTHZ_CACHE_POSITIVE_TTL: float = 60.0
+    AUTHZ_CACHE_NEGATIVE_TTL: float = 10.0
+    AUTHZ_CACHE_MAX_STALENESS: float = 0.0
+    AUTHZ_COALESCE_ENABLED: bool = True
+
+    # Background cache warmer and Keto change-watcher (intervals in seconds)
+    AUTHZ_WARMER_ENABLED: bool = False
+    AUTHZ_WARMER_INTERVAL: float = 5.0
+    AUTHZ_WARMER_REFRESH_AHEAD: float = 10.0
+    AUTHZ_WARMER_ACTIVE_WINDOW: float = 300.0
+    AUTHZ_WATCH_INTERVAL: float = 30.0
+
+    # Connection pool of each server engine (primary and every replica), per
+    # worker process. DB_POOL_PRE_PING: "always" | "idle" (ping only connections
+    # idle longer than DB_POOL_PRE_PING_IDLE seconds) | "never". With
+    # DB_MAX_CONNECTIONS > 0, pool_size + max_overflow is capped at
+    # DB_MAX_CONNECTIONS // WEB_CONCURRENCY (the number of uvicorn workers)
+    DB_POOL_SIZE: int = 20
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_USE_LIFO: bool = True
+    DB_POOL_PRE_PING: str = "idle"
+    DB_POOL_PRE_PING_IDLE: float = 60.0
+    DB_MAX_CONNECTIONS: int = 0
+    WEB_CONCURRENCY: int = 1
+
+    # Compiled statement caches: SQLAlchemy's per-engine compiled query cache and,
+    # on asyncpg, the per-connection prepared statement cache (0 for PgBouncer
+    # in transaction mode)
+    DB_QUERY_CACHE_SIZE: int = 1200
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+
+    # Read replicas (comma-separated async URLs; empty reads from the primary).
+    # Strategy: "round_robin" or "least_connections". After a write, a client's
+    # reads stay on the primary for DATABASE_READ_YOUR_WRITES_WINDOW seconds (0 disables)
+    DATABASE_REPLICA_URLS: str = ""
+    DATABASE_REPLICA_STRATEGY: str = "round_robin"
+    DATABASE_REPLICA_HEALTH_CHECK_INTERVAL: float = 5.0
+    DATABASE_REPLICA_HEALTH_CHECK_TIMEOUT: float = 2.0
+    DATABASE_READ_YOUR_WRITES_WINDOW: float = 5.0
+
+    # Read-through cache for single user/team reads (TTL in seconds). Per
+    # process: other workers may serve an entity for up to the TTL after a write
+    ENTITY_CACHE_ENABLED: bool = False
+    ENTITY_CACHE_MAX_SIZE: int = 10000
+    ENTITY_CACHE_TTL: float = 30.0
+
     APP_URL: str = "http://localhost:8080"
     ENVIRONMENT: str = "development"
 
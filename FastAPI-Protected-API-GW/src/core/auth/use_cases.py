@@ -5,10 +5,11 @@ These use cases orchestrate the authentication and authorization flows
 without depending on specific implementations (hexagonal architecture).
 """
 
-from typing import List
+from typing import Dict, List
 from ports.inbound.auth import Authentication, Authorization
 from ports.outbound.auth import IdentityProvider, TokenValidator, PermissionChecker
 from ports.models.auth import TokenData, UserInfo
+from ports.models.permissions import permission_registry
 
 from config.logger import logger
 
@@ -129,6 +130,45 @@ class AuthorizationImpl(Authorization):
             # Fail-safe: deny access on error
             return False
     
+    async def check_permissions(
+        self,
+        username: str,
+        required_permissions: List[str]
+    ) -> Dict[str, bool]:
+        """
+        Check several permissions for a user in one call.
+        
+        Business rules:
+        - Same rules as check_user_access, applied to every permission
+        - Resolved as one batch so multi-scope endpoints pay one lookup
+        """
+        logger.debug(
+            f"Checking access: user={username}, permissions={required_permissions}"
+        )
+        
+        try:
+            results = await self.permission_checker.check_permissions(
+                username,
+                required_permissions
+            )
+            
+            denied = [permission for permission, allowed in results.items() if not allowed]
+            if denied:
+                logger.warning(
+                    f"Access denied: user={username}, permissions={denied}"
+                )
+            else:
+                logger.info(
+                    f"Access granted: user={username}, permissions={required_permissions}"
+                )
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error checking permissions: {e}")
+            # Fail-safe: deny every permission on error
+            return {permission: False for permission in required_permissions}
+    
     async def get_user_authorized_scopes(
         self,
         username: str,
@@ -147,17 +187,18 @@ class AuthorizationImpl(Authorization):
         )
         
         try:
-            # Get all user permissions
-            user_permissions = await self.permission_checker.get_user_permissions(
+            # Get all user permissions as a bitmask
+            granted_mask = await self.permission_checker.get_user_permission_mask(
                 username
             )
             
             # Filter requested scopes to only authorized ones
-            # Scope naming convention: scope maps 1:1 to permission
-            authorized_scopes = [
-                scope for scope in requested_scopes
-                if scope in user_permissions
-            ]
+            # Scope naming convention: scope maps 1:1 to permission,
+            # so each scope is a single bit test against the user's mask
+            authorized_scopes = permission_registry.filter_granted(
+                granted_mask,
+                requested_scopes
+            )
             
             filtered_count = len(requested_scopes) - len(authorized_scopes)
             if filtered_count > 0:
@@ -13,9 +13,10 @@ def validation_helper(func):
 
             case ['DataManagerImpl', 'process', 'create', 'users']:
                 if kwargs.get("team_name"):
-                    record = await self.db.read_record(
+                    record = await self.db.find_record(
                         table_id = "teams",
-                        record_name = kwargs.get("team_name")
+                        column = "name",
+                        value = kwargs.get("team_name")
                     )
                     if not record:
                         raise ValueError(
@@ -25,19 +26,52 @@ def validation_helper(func):
 
             case ['DataManagerImpl', 'process', 'create', 'teams']:
                 if kwargs.get("manager_email"):
-                    async with self.db.query_records() as query:
-                        user = await (
-                            query
-                            .select(query.table["users"])
-                            .where(query.table["users"].email == kwargs.get("manager_email"))
-                            .first()
-                        )
+                    user = await self.db.find_record(
+                        table_id = "users",
+                        column = "email",
+                        value = kwargs.get("manager_email")
+                    )
                     if not user:
                         raise ValueError(
                             f"User with email '{kwargs.get('manager_email')}' does not exist."
                         )
                     kwargs["manager_id"] = user.id
 
+            case ['DataManagerImpl', 'process', 'bulk_create' | 'bulk_upsert', 'users']:
+                # Resolve every referenced team with one IN query instead of one per record
+                team_names = {r["team_name"] for r in kwargs.get("records", []) if r.get("team_name")}
+                if team_names:
+                    teams = await self.db.find_records(
+                        table_id = "teams",
+                        column = "name",
+                        values = tuple(team_names)
+                    )
+                    team_ids = {team.name: team.id for team in teams}
+                    missing = sorted(team_names - team_ids.keys())
+                    if missing:
+                        raise ValueError(f"Teams with names {missing} do not exist.")
+                    kwargs["records"] = [
+                        {**r, "team_id": team_ids[r["team_name"]]} if r.get("team_name") else r
+                        for r in kwargs["records"]
+                    ]
+
+            case ['DataManagerImpl', 'process', 'bulk_create' | 'bulk_upsert', 'teams']:
+                manager_emails = {r["manager_email"] for r in kwargs.get("records", []) if r.get("manager_email")}
+                if manager_emails:
+                    users = await self.db.find_records(
+                        table_id = "users",
+                        column = "email",
+                        values = tuple(manager_emails)
+                    )
+                    manager_ids = {user.email: user.id for user in users}
+                    missing = sorted(manager_emails - manager_ids.keys())
+                    if missing:
+                        raise ValueError(f"Users with emails {missing} do not exist.")
+                    kwargs["records"] = [
+                        {**r, "manager_id": manager_ids[r["manager_email"]]} if r.get("manager_email") else r
+                        for r in kwargs["records"]
+                    ]
+
         return await func(self, *args, **kwargs)
 
     return wrapper
\ No newline at end of file
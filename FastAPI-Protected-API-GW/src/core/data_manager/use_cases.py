@@ -7,6 +7,11 @@ from core.data_manager.data_domain import (
 )
 
 
+def as_tuple(values):
+    # Repository reads are memoized per request, so arguments must be hashable
+    return tuple(values) if values is not None else None
+
+
 class DataManagerImpl(DataManager):
     def __init__(self, repository: DbAccess):
         self.db = repository
@@ -30,10 +35,25 @@ class DataManagerImpl(DataManager):
             attributes = self.entities[entity](**kwargs)
             record = await self.db.create_record(
                 table_id = entity,
-                attributes = attributes.model_dump(exclude_none=True)
+                attributes = attributes.model_dump(exclude_unset=True)
             )
             return record
 
+        elif operation == "read" and kwargs.get("columns"):
+            # Read-only fast path: plain dicts of the requested columns
+            return await self.db.read_rows(
+                table_id = entity,
+                columns = as_tuple(kwargs["columns"]),
+                record_id = kwargs.get("record_id", None),
+                offset = kwargs.get("offset", None),
+                limit = kwargs.get("limit", None),
+                order = kwargs.get("order", "asc"),
+                cursor = kwargs.get("cursor", None),
+                filters = as_tuple(
+                    kwargs["filters"].items() if kwargs.get("filters") else None
+                ),
+            )
+
         elif operation == "read":
             record = await self.db.read_record(
                 table_id = entity,
@@ -42,9 +62,31 @@ class DataManagerImpl(DataManager):
                 offset = kwargs.get("offset", None),
                 limit = kwargs.get("limit", None),
                 order = kwargs.get("order", "asc"),
+                cursor = kwargs.get("cursor", None),
+                include = as_tuple(kwargs.get("include", None)),
+                fields = as_tuple(kwargs.get("fields", None)),
+                filters = as_tuple(
+                    kwargs["filters"].items() if kwargs.get("filters") else None
+                ),
             )
             return record
 
+        elif operation in ("bulk_create", "bulk_upsert"):
+            records = [
+                # Only omitted fields are skipped, so an explicit null can clear a column
+                self.entities[entity](**record).model_dump(exclude_unset=True)
+                for record in kwargs.get("records", [])
+            ]
+            if operation == "bulk_create":
+                return await self.db.bulk_create_records(table_id = entity, records = records)
+            return await self.db.bulk_upsert_records(table_id = entity, records = records)
+
+        elif operation == "export":
+            return self.db.stream_records(
+                table_id = entity,
+                batch_size = kwargs.get("batch_size", 500),
+            )
+
 class PublicCrud():
     def __init__(self, data_manager: DataManager):
         self._proxy_to = data_manager
@@ -53,7 +95,7 @@ class PublicCrud():
         async def filter(*args, **kwargs):
             if kwargs["entity"] not in ["users", "teams", "projects"]:
                 return None
-            if kwargs["operation"] not in ["create", "read", "update", "delete"]:
+            if kwargs["operation"] not in ["create", "read", "update", "delete", "bulk_create", "bulk_upsert", "export"]:
                 return None
             return await getattr(self._proxy_to, name)(*args, **kwargs)
         return filter
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List
 
 from ports.models.auth import TokenData, UserInfo
 
@@ -68,6 +68,24 @@ class Authorization(ABC):
         """
         ...
     
+    @abstractmethod
+    async def check_permissions(
+        self,
+        username: str,
+        required_permissions: List[str]
+    ) -> Dict[str, bool]:
+        """
+        Check several permissions for a user in one shot.
+        
+        Args:
+            username: Username to check
+            required_permissions: Permissions to check
+            
+        Returns:
+            Mapping of each permission to whether the user has it
+        """
+        ...
+    
     @abstractmethod
     async def get_user_authorized_scopes(
         self, 
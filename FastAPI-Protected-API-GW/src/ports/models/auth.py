@@ -1,6 +1,9 @@
+from functools import cached_property
 from typing import List, Optional
 from pydantic import BaseModel
 
+from ports.models.permissions import permission_registry
+
 class TokenData(BaseModel):
     """Domain model for validated token information."""
     sub: str  # Subject (user ID)
@@ -9,6 +12,11 @@ class TokenData(BaseModel):
     active: bool
     expires_at: Optional[int] = None
 
+    @cached_property
+    def scope_mask(self) -> int:
+        """Token scopes encoded as a permission bitmask (unknown scopes are dropped)."""
+        return permission_registry.known_mask(self.scopes)
+
 
 class UserInfo(BaseModel):
     """Domain model for user identity information."""
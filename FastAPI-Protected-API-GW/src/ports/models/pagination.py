@@ -0,0 +1,70 @@
+"""
+Keyset pagination primitives shared by the repository and REST layers.
+
+A cursor is an opaque, URL-safe token wrapping the sort key of the last row of
+a page (e.g. [name, id]). Repositories decode it into a WHERE on that key, so
+fetching page N costs the same index seek as page 1.
+"""
+
+import base64
+import json
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+
+class Page(list):
+    """A page of records; next_cursor is None on the last page."""
+
+    def __init__(self, records=(), next_cursor: Optional[str] = None):
+        super().__init__(records)
+        self.next_cursor = next_cursor
+
+
+def encode_cursor(values: List[Any]) -> str:
+    payload = json.dumps(values, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as error:
+        raise ValueError(f"Invalid cursor: {error}")
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def decode_page_cursor(cursor: str, order: Optional[str] = None) -> Tuple[str, str, UUID]:
+    """
+    Decode and check a [order, last sort key, last id] list cursor.
+
+    Args:
+        cursor: The next_cursor of a previous page
+        order: The order requested for this page (None pages ascending)
+
+    Returns:
+        The cursor order, the sort key of the last row and its id
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another order
+    """
+    values = decode_cursor(cursor)
+    if len(values) != 3:
+        raise ValueError("Invalid cursor")
+    cursor_order, last_value, last_id = values
+    if cursor_order != (order or "asc"):
+        raise ValueError("Invalid cursor: it was issued for another order")
+    if not isinstance(last_value, str) or not isinstance(last_id, str):
+        raise ValueError("Invalid cursor")
+    try:
+        return cursor_order, last_value, UUID(last_id)
+    except ValueError as error:
+        raise ValueError(f"Invalid cursor: {error}")
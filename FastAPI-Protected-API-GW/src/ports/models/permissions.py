@@ -0,0 +1,84 @@
+"""
+Interned permission registry for bitset-encoded permission sets.
+
+Each permission string (e.g. "data:read", "project:delete") is assigned a bit
+position the first time it is seen, so a set of permissions can be carried as
+a single integer mask. Scope filtering and multi-permission checks then become
+bitwise operations, and cached permission sets take a few bytes per user.
+"""
+
+from typing import Dict, Iterable, List
+
+
+class PermissionRegistry:
+    """
+    Assigns stable bit positions to permission strings.
+
+    Only permissions that are actually granted (via mask()) or required by a
+    route (via bit(), see adapter.rest.di.require) are interned; lookups for
+    requested permissions and token scopes (known_mask()) never grow the
+    registry, so arbitrary client-supplied scopes cannot inflate it. A
+    permission that was never interned has no bit and is never satisfied.
+    """
+
+    def __init__(self):
+        self._bits: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def bit(self, permission: str) -> int:
+        """Return the bit for permission, interning it if unknown."""
+        bit = self._bits.get(permission)
+        if bit is None:
+            bit = 1 << len(self._names)
+            self._bits[permission] = bit
+            self._names.append(permission)
+        return bit
+
+    def mask(self, permissions: Iterable[str]) -> int:
+        """Encode granted permissions as a bitmask."""
+        mask = 0
+        for permission in permissions:
+            mask |= self.bit(permission)
+        return mask
+
+    def known_mask(self, permissions: Iterable[str]) -> int:
+        """Encode permissions as a bitmask, ignoring those without a bit."""
+        mask = 0
+        for permission in permissions:
+            mask |= self._bits.get(permission, 0)
+        return mask
+
+    def names(self, mask: int) -> List[str]:
+        """Decode a bitmask back into permission strings."""
+        names = []
+        position = 0
+        while mask:
+            if mask & 1:
+                names.append(self._names[position])
+            mask >>= 1
+            position += 1
+        return names
+
+    def has(self, mask: int, permission: str) -> bool:
+        """Check whether mask grants permission."""
+        return bool(mask & self._bits.get(permission, 0))
+
+    def has_all(self, mask: int, permissions: Iterable[str]) -> bool:
+        """Check whether mask grants every permission in one bitwise test."""
+        required = 0
+        for permission in permissions:
+            bit = self._bits.get(permission)
+            if bit is None:
+                return False
+            required |= bit
+        return mask & required == required
+
+    def filter_granted(self, mask: int, permissions: Iterable[str]) -> List[str]:
+        """Return the permissions (in input order) that mask grants."""
+        return [permission for permission in permissions if self.has(mask, permission)]
+
+
+permission_registry = PermissionRegistry()
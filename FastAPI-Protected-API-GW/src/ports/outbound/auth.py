@@ -1,7 +1,18 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List
 
 from ports.models.auth import TokenData, UserInfo
+from ports.models.permissions import permission_registry
+
+
+class PermissionBackendUnavailable(Exception):
+    """
+    Raised by PermissionChecker implementations when the backing permission
+    system cannot answer (outage, circuit open), as opposed to answering "no".
+    Callers must treat it as a denial unless they hold a known-good answer.
+    """
+
 
 class PermissionChecker(ABC):
     """
@@ -25,6 +36,30 @@ class PermissionChecker(ABC):
         """
         ...
     
+    async def check_permissions(
+        self,
+        username: str,
+        permissions: List[str]
+    ) -> Dict[str, bool]:
+        """
+        Check several permissions for a user in one call.
+
+        The default implementation runs check_permission concurrently;
+        adapters can override it to resolve the batch more cheaply.
+
+        Args:
+            username: The username to check
+            permissions: The permissions to verify (e.g., ["data:read", "project:read"])
+
+        Returns:
+            Mapping of each permission to whether the user has it
+        """
+        unique_permissions = list(dict.fromkeys(permissions))
+        results = await asyncio.gather(
+            *(self.check_permission(username, permission) for permission in unique_permissions)
+        )
+        return dict(zip(unique_permissions, results))
+
     @abstractmethod
     async def get_user_permissions(self, username: str) -> List[str]:
         """
@@ -51,6 +86,21 @@ class PermissionChecker(ABC):
         """
         ...
 
+    async def get_user_permission_mask(self, username: str) -> int:
+        """
+        Get all permissions for a user as a bitmask.
+
+        Implementations that cache permission sets can override this to
+        avoid decoding and re-encoding the permission list.
+
+        Args:
+            username: The username to query
+
+        Returns:
+            Bitmask encoded with the shared permission registry
+        """
+        return permission_registry.mask(await self.get_user_permissions(username))
+
 
 class TokenValidator(ABC):
     """
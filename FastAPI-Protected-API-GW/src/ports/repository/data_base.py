@@ -22,6 +22,39 @@ class DbAccess(ABC):
         offset: int | None = None,
         limit: int | None = None,
         order: str | None = None,
+        cursor: str | None = None,
+        include: tuple[str, ...] | None = None,
+        fields: tuple[str, ...] | None = None,
+        filters: tuple[tuple[str, object], ...] | None = None,
+        ): ...
+
+    @abstractmethod
+    async def find_record(
+        self,
+        table_id: str,
+        column: str,
+        value
+        ): ...
+
+    @abstractmethod
+    async def find_records(
+        self,
+        table_id: str,
+        column: str,
+        values: tuple
+        ): ...
+
+    @abstractmethod
+    async def read_rows(
+        self,
+        table_id: str,
+        columns: tuple[str, ...],
+        record_id: UUID | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        order: str | None = None,
+        cursor: str | None = None,
+        filters: tuple[tuple[str, object], ...] | None = None,
         ): ...
 
     @abstractmethod
@@ -39,4 +72,25 @@ class DbAccess(ABC):
         table_id: str,
         record_name: str | None = None,
         record_id: UUID | None = None
-        ): ...
\ No newline at end of file
+        ): ...
+
+    @abstractmethod
+    async def bulk_create_records(
+        self,
+        table_id: str,
+        records: list[dict]
+        ): ...
+
+    @abstractmethod
+    async def bulk_upsert_records(
+        self,
+        table_id: str,
+        records: list[dict]
+        ): ...
+
+    @abstractmethod
+    def stream_records(
+        self,
+        table_id: str,
+        batch_size: int = 500
+        ): ...
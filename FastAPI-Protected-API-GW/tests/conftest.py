@@ -61,6 +61,19 @@ def db_close():
         gc.collect()
     return _close
 
+class FakeClock:
+    """Clock that only moves when a test sets .now."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@fixture()
+def clock():
+    return FakeClock()
+
 @fixture()
 def sample_one_team():
     return {"name": "sampleteam", "description": "Sample team for testing"}
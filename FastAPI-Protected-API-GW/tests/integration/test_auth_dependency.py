@@ -0,0 +1,100 @@
+from typing import Annotated
+from unittest.mock import AsyncMock, Mock
+
+from fastapi import Depends, FastAPI, Request
+from httpx import AsyncClient, ASGITransport
+from pytest import fixture, mark
+
+from adapter.rest.di import require
+from config.container import container
+from ports.inbound.auth import Authentication, Authorization
+from ports.models.auth import TokenData
+
+
+@fixture()
+def authentication():
+    authentication = Mock(spec=Authentication)
+    authentication.validate_access_token = AsyncMock(return_value=TokenData(
+        sub="user-1",
+        username="alice",
+        scopes=["data:read", "data:write"],
+        active=True,
+    ))
+    return authentication
+
+
+@fixture()
+def authorization():
+    authorization = Mock(spec=Authorization)
+    authorization.check_permissions = AsyncMock(
+        side_effect=lambda username, permissions: {
+            permission: permission == "data:read" for permission in permissions
+        }
+    )
+    return authorization
+
+
+@fixture()
+async def auth_client(authentication, authorization):
+    app = FastAPI()
+
+    @app.get("/read", dependencies=[Depends(require("data:read"))])
+    async def read(token: Annotated[TokenData, Depends(require("data:read"))], request: Request):
+        return {"username": token.username, "decisions": request.state.permissions}
+
+    @app.get("/write", dependencies=[Depends(require("data:read"))])
+    async def write(token: Annotated[TokenData, Depends(require("data:read", "data:write"))]):
+        return {"username": token.username}
+
+    @app.get("/delete", dependencies=[Depends(require("data:delete"))])
+    async def delete():
+        return {}
+
+    app.dependency_overrides[container.get_authentication_use_case] = lambda: authentication
+    app.dependency_overrides[container.get_authorization_use_case] = lambda: authorization
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@mark.anyio
+async def test_missing_token_is_rejected(auth_client):
+    response = await auth_client.get("/read")
+
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+
+
+@mark.anyio
+async def test_invalid_token_is_rejected(auth_client, authentication):
+    authentication.validate_access_token.side_effect = ValueError("Invalid token")
+
+    response = await auth_client.get("/read", headers={"Authorization": "Bearer bad"})
+
+    assert response.status_code == 401
+
+
+@mark.anyio
+async def test_token_and_permissions_resolved_once(auth_client, authentication, authorization):
+    response = await auth_client.get("/read", headers={"Authorization": "Bearer good"})
+
+    assert response.status_code == 200
+    assert response.json() == {"username": "alice", "decisions": {"data:read": True}}
+    authentication.validate_access_token.assert_awaited_once_with("good")
+    authorization.check_permissions.assert_awaited_once_with("alice", ["data:read"])
+
+
+@mark.anyio
+async def test_only_undecided_permissions_are_checked(auth_client, authorization):
+    response = await auth_client.get("/write", headers={"Authorization": "Bearer good"})
+
+    assert response.status_code == 403
+    assert authorization.check_permissions.await_args_list[-1].args == ("alice", ["data:write"])
+
+
+@mark.anyio
+async def test_scope_not_on_token_skips_permission_lookup(auth_client, authorization):
+    response = await auth_client.get("/delete", headers={"Authorization": "Bearer good"})
+
+    assert response.status_code == 403
+    assert "insufficient_scope" in response.headers["www-authenticate"]
+    authorization.check_permissions.assert_not_awaited()
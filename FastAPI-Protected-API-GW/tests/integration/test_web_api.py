@@ -1,5 +1,20 @@
+import csv
+import io
+import json
+from contextlib import contextmanager
+from uuid import uuid4
+
+from unittest.mock import AsyncMock, Mock
+
 from pytest import mark
 
+from adapter.rest.server import web_app
+from adapter.sql.data_access import DbAccessImpl
+from config.container import container
+from ports.inbound.auth import Authentication, Authorization
+from ports.models.auth import TokenData
+from ports.models.pagination import encode_cursor
+
 
 @mark.anyio
 async def test_health_check(fastapi_client):
@@ -264,3 +279,190 @@ async def test_read_team_with_users(fastapi_client, sample_teams_data, sample_us
     data = response.json()
     assert data["id"] == team_id
     assert "users" in data
+
+
+@contextmanager
+def signed_in_as_admin(*permissions):
+    """Accept the bearer token "admin" for a user holding (and scoped for) permissions."""
+    authentication = Mock(spec=Authentication)
+    authentication.validate_access_token = AsyncMock(return_value=TokenData(
+        sub="user-1", username="admin", scopes=list(permissions), active=True,
+    ))
+    authorization = Mock(spec=Authorization)
+    authorization.check_permissions = AsyncMock(
+        side_effect=lambda username, requested: {permission: True for permission in requested}
+    )
+    web_app.dependency_overrides[container.get_authentication_use_case] = lambda: authentication
+    web_app.dependency_overrides[container.get_authorization_use_case] = lambda: authorization
+    try:
+        yield authorization
+    finally:
+        web_app.dependency_overrides.clear()
+
+
+@mark.anyio
+async def test_metrics(fastapi_client):
+    response = await fastapi_client.get("/metrics")
+    assert response.status_code == 401
+
+    with signed_in_as_admin("authz:read"):
+        response = await fastapi_client.get("/metrics", headers={"Authorization": "Bearer admin"})
+
+    assert response.status_code == 200
+    assert "authz_cache" in response.json()
+
+
+@mark.anyio
+async def test_refresh_role_index_requires_admin(fastapi_client):
+    response = await fastapi_client.post("/admin/role-index/refresh")
+
+    assert response.status_code == 401
+
+
+@mark.anyio
+async def test_refresh_role_index_disabled(fastapi_client):
+    with signed_in_as_admin("authz:write") as authorization:
+        response = await fastapi_client.post(
+            "/admin/role-index/refresh", headers={"Authorization": "Bearer admin"}
+        )
+
+    assert response.status_code == 404
+    authorization.check_permissions.assert_awaited_once_with("admin", ["authz:write"])
+
+
+@mark.anyio
+async def test_batch_create_and_upsert_users(fastapi_client, sample_teams_data, sample_users_data):
+    response = await fastapi_client.post(
+        "/teams/batch", json={"records": sample_teams_data["valid_values"]}
+    )
+    assert response.status_code == 201
+    assert response.json()["count"] == 3
+
+    response = await fastapi_client.post(
+        "/users/batch", json={"records": sample_users_data["valid_values"]}
+    )
+    assert response.status_code == 201
+    created = response.json()
+    assert created["count"] == 4
+
+    updated_user = {**sample_users_data["valid_values"][0], "location": "Boston"}
+    response = await fastapi_client.post(
+        "/users/batch", json={"records": [updated_user], "upsert": True}
+    )
+    assert response.status_code == 201
+    assert response.json()["records"][0]["record_id"] == created["records"][0]["record_id"]
+
+    cleared_user = {**sample_users_data["valid_values"][0], "location": None}
+    response = await fastapi_client.post(
+        "/users/batch", json={"records": [cleared_user], "upsert": True}
+    )
+    assert response.status_code == 201
+    response = await fastapi_client.get(f"/users/{created['records'][0]['record_id']}")
+    assert response.json()["location"] is None
+
+    response = await fastapi_client.post("/users/batch", json={"records": []})
+    assert response.status_code == 422
+
+
+@mark.anyio
+async def test_read_all_users_with_cursor(fastapi_client, sample_users_data):
+    response = await fastapi_client.post(
+        "/users/batch", json={"records": sample_users_data["valid_values"][:1] + sample_users_data["valid_values"][3:]}
+    )
+    assert response.status_code == 201
+    response = await fastapi_client.post("/users", json={"name": "eve", "email": "eve@example.com"})
+    assert response.status_code == 201
+
+    names, params = [], {"limit": 2}
+    while True:
+        response = await fastapi_client.get("/users", params=params)
+        assert response.status_code == 200
+        names.extend(user["name"] for user in response.json())
+        if "x-next-cursor" not in response.headers:
+            break
+        params = {"limit": 2, "cursor": response.headers["x-next-cursor"]}
+
+    assert names == ["alice", "diana", "eve"]
+
+    for cursor, order in (("!!!", "asc"), (params["cursor"], "desc"), (encode_cursor(["asc"]), "asc")):
+        response = await fastapi_client.get("/users", params={"cursor": cursor, "order": order})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+    response = await fastapi_client.get("/users", params={"cursor": params.get("cursor", "x"), "offset": 1})
+    assert response.status_code == 400
+
+
+@mark.anyio
+async def test_export_users(fastapi_client, sample_users_data):
+    users = sample_users_data["valid_values"][:1] + sample_users_data["valid_values"][3:]
+    response = await fastapi_client.post("/users/batch", json={"records": users})
+    assert response.status_code == 201
+
+    response = await fastapi_client.get("/users/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(row["email"] for row in rows) == ["alice@example.com", "diana@example.com"]
+    assert set(rows[0]) == {"id", "name", "email", "location", "team_id", "created_at", "updated_at"}
+
+    response = await fastapi_client.get("/users/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert sorted(row["name"] for row in rows) == ["alice", "diana"]
+
+    response = await fastapi_client.get("/teams/export")
+    assert response.status_code == 200
+    assert response.text == ""
+
+    response = await fastapi_client.get("/teams/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.text.splitlines() == [",".join(DbAccessImpl.export_columns["teams"])]
+
+
+@mark.anyio
+async def test_read_teams_projection(fastapi_client, sample_teams_data, sample_users_data):
+    response = await fastapi_client.post("/teams/batch", json={"records": sample_teams_data["valid_values"]})
+    assert response.status_code == 201
+    team_id = response.json()["records"][0]["record_id"]
+    response = await fastapi_client.post("/users/batch", json={"records": sample_users_data["valid_values"]})
+    assert response.status_code == 201
+
+    # List pages do not load members unless asked to
+    response = await fastapi_client.get("/teams")
+    assert response.status_code == 200
+    assert all(team["users"] is None and team["manager"] is None for team in response.json())
+
+    response = await fastapi_client.get("/teams", params={"include": "users"})
+    engineering = next(team for team in response.json() if team["id"] == team_id)
+    assert [user["name"] for user in engineering["users"]] == ["bob"]
+
+    response = await fastapi_client.get("/teams", params={"fields": "name"})
+    assert response.status_code == 200
+    assert all(set(team) == {"id", "name"} for team in response.json())
+
+    response = await fastapi_client.get(f"/teams/{team_id}", params={"include": "manager"})
+    assert response.status_code == 200
+    assert response.json()["users"] is None
+
+    response = await fastapi_client.get(f"/teams/{team_id}/users", params={"fields": "name,email"})
+    assert response.status_code == 200
+    assert response.json() == [{"id": response.json()[0]["id"], "name": "bob", "email": "bob@example.com"}]
+
+    response = await fastapi_client.get("/teams", params={"include": "projects"})
+    assert response.status_code == 400
+    response = await fastapi_client.get("/users", params={"fields": "password"})
+    assert response.status_code == 400
+
+
+@mark.anyio
+async def test_missing_records_return_not_found(fastapi_client):
+    response = await fastapi_client.post("/teams", json={"name": "empty"})
+    assert response.status_code == 201
+    response = await fastapi_client.get(f"/teams/{response.json()['record_id']}/users")
+    assert response.status_code == 200
+    assert response.json() == []
+
+    for path in (f"/users/{uuid4()}", f"/teams/{uuid4()}", f"/teams/{uuid4()}/users"):
+        response = await fastapi_client.get(path)
+        assert response.status_code == 404
@@ -5,6 +5,7 @@ Unit tests for authentication and authorization use cases.
 import pytest
 from unittest.mock import AsyncMock, Mock
 from core.auth.use_cases import AuthorizationImpl
+from ports.models.permissions import permission_registry
 from ports.outbound.auth import PermissionChecker
 
 
@@ -78,8 +79,8 @@ async def test_get_user_authorized_scopes_all_authorized(
     requested_scopes = ["data:read", "data:write"]
     user_permissions = ["data:read", "data:write", "data:delete"]
     
-    mock_permission_checker.get_user_permissions = AsyncMock(
-        return_value=user_permissions
+    mock_permission_checker.get_user_permission_mask = AsyncMock(
+        return_value=permission_registry.mask(user_permissions)
     )
     
     # Execute
@@ -104,8 +105,8 @@ async def test_get_user_authorized_scopes_partial_authorization(
     requested_scopes = ["data:read", "data:write", "data:delete"]
     user_permissions = ["data:read"]  # User only has read permission
     
-    mock_permission_checker.get_user_permissions = AsyncMock(
-        return_value=user_permissions
+    mock_permission_checker.get_user_permission_mask = AsyncMock(
+        return_value=permission_registry.mask(user_permissions)
     )
     
     # Execute
@@ -131,8 +132,8 @@ async def test_get_user_authorized_scopes_no_permissions(
     requested_scopes = ["data:read", "data:write"]
     user_permissions = []  # User has no permissions
     
-    mock_permission_checker.get_user_permissions = AsyncMock(
-        return_value=user_permissions
+    mock_permission_checker.get_user_permission_mask = AsyncMock(
+        return_value=permission_registry.mask(user_permissions)
     )
     
     # Execute
@@ -151,8 +152,8 @@ async def test_get_user_authorized_scopes_error_handling(
     mock_permission_checker
 ):
     """Test scope filtering handles errors gracefully (fail-safe)."""
-    # Setup - make get_user_permissions raise an exception
-    mock_permission_checker.get_user_permissions = AsyncMock(
+    # Setup - make get_user_permission_mask raise an exception
+    mock_permission_checker.get_user_permission_mask = AsyncMock(
         side_effect=Exception("Connection error")
     )
     
@@ -164,3 +165,42 @@ async def test_get_user_authorized_scopes_error_handling(
     
     # Verify - should return empty list on error (fail-safe)
     assert len(result) == 0
+
+
+@pytest.mark.asyncio
+async def test_check_permissions_batch(authorization_use_case, mock_permission_checker):
+    """Test checking several permissions in one call."""
+    # Setup
+    mock_permission_checker.check_permissions = AsyncMock(
+        return_value={"data:read": True, "project:read": False}
+    )
+    
+    # Execute
+    result = await authorization_use_case.check_permissions(
+        "testuser",
+        ["data:read", "project:read"]
+    )
+    
+    # Verify
+    assert result == {"data:read": True, "project:read": False}
+    mock_permission_checker.check_permissions.assert_called_once_with(
+        "testuser", ["data:read", "project:read"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_check_permissions_error_handling(authorization_use_case, mock_permission_checker):
+    """Test batch permission check denies everything on error (fail-safe)."""
+    # Setup
+    mock_permission_checker.check_permissions = AsyncMock(
+        side_effect=Exception("Connection error")
+    )
+    
+    # Execute
+    result = await authorization_use_case.check_permissions(
+        "testuser",
+        ["data:read", "project:read"]
+    )
+    
+    # Verify
+    assert result == {"data:read": False, "project:read": False}
@@ -0,0 +1,132 @@
+"""
+Unit tests for the async batch loader and its per-request registration.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from adapter.cache.batch_loader import BatchLoader, LoaderStats
+from adapter.cache.request_memo import invalidate_request_memo, request_loader, request_scope
+from adapter.sql.data_access import DbAccessImpl
+
+
+def squares_loader(**kwargs):
+    backend = AsyncMock(side_effect=lambda keys: {key: key * key for key in keys if key >= 0})
+    return BatchLoader(backend, **kwargs), backend
+
+
+@pytest.mark.asyncio
+async def test_loads_in_the_same_tick_are_batched():
+    """Test that concurrent loads become one batch call with distinct keys."""
+    loader, backend = squares_loader()
+
+    results = await asyncio.gather(loader.load(2), loader.load(3), loader.load(2), loader.load(-1))
+
+    assert results == [4, 9, 4, None]
+    backend.assert_awaited_once_with((2, 3, -1))
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_and_later_ticks_batch_again():
+    """Test that loaded keys are reused and new keys go out in a new batch."""
+    loader, backend = squares_loader()
+
+    assert await loader.load_many([1, 2]) == [1, 4]
+    assert await loader.load_many([2, 3]) == [4, 9]
+
+    assert [call.args[0] for call in backend.await_args_list] == [(1, 2), (3,)]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_split_at_max_batch_size():
+    loader, backend = squares_loader(max_batch_size=2)
+
+    assert await loader.load_many(range(5)) == [0, 1, 4, 9, 16]
+
+    assert backend.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_failures_propagate_and_are_not_cached():
+    """Test that a failed batch fails its loads and the keys are retried later."""
+    backend = AsyncMock(side_effect=[ValueError("db down"), {1: "one"}])
+    loader = BatchLoader(backend)
+
+    with pytest.raises(ValueError):
+        await loader.load(1)
+    assert await loader.load(1) == "one"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_break_the_batch():
+    """Test that cancelling one waiter leaves other waiters and later loads working."""
+    release = asyncio.Event()
+
+    async def slow_squares(keys):
+        await release.wait()
+        return {key: key * key for key in keys}
+
+    loader = BatchLoader(slow_squares)
+    cancelled = asyncio.ensure_future(loader.load(2))
+    waiting = asyncio.ensure_future(loader.load(2))
+    other = asyncio.ensure_future(loader.load(3))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+
+    assert await asyncio.wait_for(asyncio.gather(waiting, other), timeout=1) == [4, 9]
+    assert cancelled.cancelled()
+    assert await asyncio.wait_for(loader.load(2), timeout=1) == 4
+
+
+@pytest.mark.asyncio
+async def test_request_loader_lives_for_one_request():
+    """Test that a loader is shared within a scope and dropped on invalidation."""
+    batch_fn = AsyncMock(return_value={})
+
+    with request_scope():
+        loader = request_loader(("db", "find", "teams", "name"), batch_fn)
+        assert request_loader(("db", "find", "teams", "name"), batch_fn) is loader
+        invalidate_request_memo("db")
+        assert request_loader(("db", "find", "teams", "name"), batch_fn) is not loader
+
+    assert request_loader(("db", "find", "teams", "name"), batch_fn) is not loader
+
+
+@pytest.mark.asyncio
+async def test_find_record_lookups_become_one_in_query(
+    db_create_tables, db_close, sample_teams_data, monkeypatch
+):
+    """Test that gathered find_record calls issue a single find_records query."""
+    await db_create_tables()
+    await DbAccessImpl.bulk_create_records(table_id="teams", records=sample_teams_data["valid_values"])
+    find_records = AsyncMock(wraps=DbAccessImpl.find_records)
+    monkeypatch.setattr(DbAccessImpl, "find_records", find_records)
+
+    with request_scope():
+        teams = await asyncio.gather(*(
+            DbAccessImpl.find_record(table_id="teams", column="name", value=name)
+            for name in ("engineering", "sales", "missing", "engineering")
+        ))
+        again = await DbAccessImpl.find_record(table_id="teams", column="name", value="sales")
+
+    assert [team and team.name for team in teams] == ["engineering", "sales", None, "engineering"]
+    assert again is teams[1]
+    find_records.assert_awaited_once()
+    assert set(find_records.await_args.kwargs["values"]) == {"engineering", "sales", "missing"}
+
+    await db_close()
+
+
+@pytest.mark.asyncio
+async def test_loaders_count_into_the_stats_they_are_given():
+    """Test that loads and batches are counted per stats instance."""
+    stats = LoaderStats()
+    loader, _ = squares_loader(stats=stats)
+
+    await loader.load_many([1, 2, 2])
+    await squares_loader()[0].load(3)
+
+    assert stats.stats() == {"loads": 3, "keys_loaded": 2, "batches": 1, "keys_per_batch": 2.0}
@@ -0,0 +1,178 @@
+"""
+Unit tests for the authorization cache warmer and Keto change-watcher.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from adapter.auth.cache_warmer import AuthzCacheWarmer
+from adapter.auth.cached_checker import CachedPermissionChecker
+from ports.outbound.auth import PermissionBackendUnavailable, PermissionChecker
+
+
+def keto_with_snapshots(*snapshots):
+    """Create a fake Keto adapter returning one tuple snapshot per poll."""
+    polls = iter(snapshots)
+
+    async def iter_relation_tuples(**query):
+        for tuple_data in next(polls):
+            yield tuple_data
+
+    keto = Mock()
+    keto.iter_relation_tuples = iter_relation_tuples
+    return keto
+
+
+@pytest.fixture
+def inner_checker():
+    mock = Mock(spec=PermissionChecker)
+    mock.check_permission = AsyncMock(return_value=True)
+    return mock
+
+
+@pytest.mark.asyncio
+async def test_warm_refreshes_active_users_before_expiry(clock, inner_checker):
+    """Test that entries of active users are refreshed ahead of their TTL."""
+    cache = CachedPermissionChecker(inner_checker, positive_ttl=60.0, clock=clock)
+    warmer = AuthzCacheWarmer(cache, refresh_ahead=10.0, active_window=120.0)
+
+    await cache.check_permission("earlyuser", "data:read")
+    clock.now = 100.0
+    await cache.check_permission("recentuser", "data:read")
+
+    # Nothing is close to expiry yet
+    clock.now = 105.0
+    assert await warmer.warm() == 0
+
+    # earlyuser's entry expired at 60; recentuser's expires at 160
+    clock.now = 155.0
+    assert await warmer.warm() == 1
+    assert inner_checker.check_permission.await_count == 3
+
+    # The refreshed entry is served from cache past its original expiry
+    clock.now = 170.0
+    await cache.check_permission("recentuser", "data:read")
+    assert inner_checker.check_permission.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_warm_skips_inactive_users(clock, inner_checker):
+    """Test that users outside the active window are left to expire."""
+    cache = CachedPermissionChecker(inner_checker, positive_ttl=60.0, clock=clock)
+    warmer = AuthzCacheWarmer(cache, refresh_ahead=10.0, active_window=30.0)
+
+    await cache.check_permission("testuser", "data:read")
+    clock.now = 55.0
+
+    assert await warmer.warm() == 0
+
+
+@pytest.mark.asyncio
+async def test_warm_refreshes_concurrently_within_the_limit(clock, inner_checker):
+    """Test that a pass runs lookups in parallel, never more than the limit."""
+    in_flight, peak = 0, 0
+
+    async def slow_check(username, permission):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return True
+
+    cache = CachedPermissionChecker(inner_checker, positive_ttl=60.0, clock=clock)
+    warmer = AuthzCacheWarmer(cache, refresh_ahead=10.0, active_window=120.0, refresh_concurrency=3)
+    for index in range(8):
+        await cache.check_permission(f"user{index}", "data:read")
+    inner_checker.check_permission = AsyncMock(side_effect=slow_check)
+    clock.now = 55.0
+
+    assert await warmer.warm() == 8
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_warm_stops_when_the_backend_is_unavailable(clock, inner_checker):
+    """Test that an outage ends the pass instead of failing every entry."""
+    cache = CachedPermissionChecker(inner_checker, positive_ttl=60.0, clock=clock)
+    warmer = AuthzCacheWarmer(cache, refresh_ahead=10.0, active_window=120.0, refresh_concurrency=1)
+    for index in range(5):
+        await cache.check_permission(f"user{index}", "data:read")
+    inner_checker.check_permission = AsyncMock(side_effect=PermissionBackendUnavailable("circuit open"))
+    clock.now = 55.0
+
+    assert await warmer.warm() == 0
+    assert inner_checker.check_permission.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_poll_changes_invalidates_changed_users(inner_checker):
+    """Test that users whose tuples changed are invalidated."""
+    cache = CachedPermissionChecker(inner_checker)
+    keto = keto_with_snapshots(
+        [
+            {"object": "role:data:user", "relation": "member", "subject_id": "alice"},
+            {"object": "role:data:user", "relation": "member", "subject_id": "bob"},
+        ],
+        [
+            {"object": "role:data:admin", "relation": "member", "subject_id": "alice"},
+            {"object": "role:data:user", "relation": "member", "subject_id": "bob"},
+        ],
+    )
+    warmer = AuthzCacheWarmer(cache, keto=keto)
+
+    await cache.check_permission("alice", "data:delete")
+    await cache.check_permission("bob", "data:delete")
+
+    assert await warmer.poll_changes() == 0  # first poll only records a baseline
+    assert await warmer.poll_changes() == 1
+
+    await cache.check_permission("alice", "data:delete")
+    await cache.check_permission("bob", "data:delete")
+    assert inner_checker.check_permission.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_poll_changes_clears_cache_on_role_definition_change(inner_checker):
+    """Test that a change to a role's grants clears the whole cache."""
+    cache = CachedPermissionChecker(inner_checker)
+    keto = keto_with_snapshots(
+        [{"object": "role:data:user", "relation": "granted", "subject_id": "data:read"}],
+        [
+            {"object": "role:data:user", "relation": "granted", "subject_id": "data:read"},
+            {"object": "role:data:user", "relation": "granted", "subject_id": "data:write"},
+        ],
+    )
+    warmer = AuthzCacheWarmer(cache, keto=keto)
+
+    await cache.check_permission("alice", "data:write")
+    await warmer.poll_changes()
+    await warmer.poll_changes()
+
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_role_index_is_refreshed_before_the_cache_is_cleared(inner_checker):
+    """Test that entries stored during the role index refresh are cleared too."""
+    cache = CachedPermissionChecker(inner_checker)
+    keto = keto_with_snapshots(
+        [{"object": "role:data:user", "relation": "granted", "subject_id": "data:read"}],
+        [{"object": "role:data:user", "relation": "granted", "subject_id": "data:write"}],
+    )
+
+    async def refresh():
+        # A request expands roles with the old index while the refresh runs
+        await cache.check_permission("alice", "data:write")
+
+    role_index = Mock(source="keto")
+    role_index.refresh = AsyncMock(side_effect=refresh)
+    warmer = AuthzCacheWarmer(cache, keto=keto, role_index=role_index)
+
+    await warmer.poll_changes()
+    await warmer.poll_changes()
+
+    role_index.refresh.assert_awaited_once()
+    assert cache.stats()["size"] == 0
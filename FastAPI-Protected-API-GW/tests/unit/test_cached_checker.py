@@ -0,0 +1,127 @@
+"""
+Unit tests for the caching PermissionChecker decorator.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from adapter.auth.cached_checker import CachedPermissionChecker
+from adapter.cache.ttl_cache import TTLCache
+from ports.models.permissions import permission_registry
+from ports.outbound.auth import PermissionChecker
+
+
+@pytest.fixture
+def inner_checker():
+    """Create a mock PermissionChecker to be decorated."""
+    return Mock(spec=PermissionChecker)
+
+
+@pytest.mark.asyncio
+async def test_check_permission_is_cached(inner_checker):
+    """Test that repeated decisions are served from the cache."""
+    inner_checker.check_permission = AsyncMock(return_value=True)
+    checker = CachedPermissionChecker(inner_checker)
+
+    assert await checker.check_permission("testuser", "data:read") is True
+    assert await checker.check_permission("testuser", "data:read") is True
+
+    inner_checker.check_permission.assert_awaited_once_with("testuser", "data:read")
+    stats = checker.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_negative_decisions_use_negative_ttl(inner_checker):
+    """Test that denied decisions expire according to the negative TTL."""
+    inner_checker.check_permission = AsyncMock(return_value=False)
+    checker = CachedPermissionChecker(inner_checker, positive_ttl=60.0, negative_ttl=0.0)
+
+    assert await checker.check_permission("testuser", "data:delete") is False
+    assert await checker.check_permission("testuser", "data:delete") is False
+
+    # A zero negative TTL disables caching of denials
+    assert inner_checker.check_permission.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user(inner_checker):
+    """Test that invalidating a user drops only that user's entries."""
+    inner_checker.check_permission = AsyncMock(return_value=True)
+    inner_checker.get_user_roles = AsyncMock(return_value=["data:admin"])
+    checker = CachedPermissionChecker(inner_checker)
+
+    await checker.check_permission("testuser", "data:read")
+    await checker.get_user_roles("testuser")
+    await checker.check_permission("otheruser", "data:read")
+
+    assert checker.invalidate_user("testuser") == 2
+
+    await checker.check_permission("otheruser", "data:read")
+    await checker.check_permission("testuser", "data:read")
+    assert inner_checker.check_permission.await_count == 3
+
+
+def test_ttl_cache_lru_eviction_and_expiry(clock):
+    """Test LRU eviction and TTL expiry counters of the underlying cache."""
+    cache = TTLCache(max_size=2, clock=clock)
+
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    cache.get("a")  # "a" becomes most recently used
+    cache.set("c", 3, ttl=10)  # evicts "b"
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+    clock.now = 11.0
+    assert cache.get("a", None) is None
+    assert cache.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_permission_sets_are_cached_as_masks(inner_checker):
+    """Test that user permission sets are cached as bitmasks."""
+    inner_checker.get_user_permission_mask = AsyncMock(
+        return_value=permission_registry.mask(["data:read", "data:write"])
+    )
+    checker = CachedPermissionChecker(inner_checker)
+
+    first = await checker.get_user_permissions("testuser")
+    second = await checker.get_user_permissions("testuser")
+
+    assert sorted(first) == sorted(second) == ["data:read", "data:write"]
+    inner_checker.get_user_permission_mask.assert_awaited_once_with("testuser")
+
+
+@pytest.mark.asyncio
+async def test_check_permissions_only_fetches_misses(inner_checker):
+    """Test that a batch check reuses cached decisions and fetches the rest."""
+    inner_checker.check_permission = AsyncMock(return_value=True)
+    inner_checker.check_permissions = AsyncMock(return_value={"project:read": False})
+    checker = CachedPermissionChecker(inner_checker)
+
+    await checker.check_permission("testuser", "data:read")
+    results = await checker.check_permissions("testuser", ["data:read", "project:read"])
+
+    assert results == {"data:read": True, "project:read": False}
+    inner_checker.check_permissions.assert_awaited_once_with("testuser", ["project:read"])
+
+
+@pytest.mark.asyncio
+async def test_lookup_in_flight_during_invalidation_is_not_stored():
+    """Test that a grant revoked while it was being loaded is not cached."""
+    inner_checker = Mock(spec=PermissionChecker)
+    checker = CachedPermissionChecker(inner_checker)
+
+    async def revoked_during_lookup(username, permission):
+        checker.invalidate_user(username)
+        return True
+
+    inner_checker.check_permission = AsyncMock(side_effect=revoked_during_lookup)
+    assert await checker.check_permission("testuser", "data:read") is True
+
+    inner_checker.check_permission = AsyncMock(return_value=False)
+    assert await checker.check_permission("testuser", "data:read") is False
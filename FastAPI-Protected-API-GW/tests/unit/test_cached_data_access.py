@@ -0,0 +1,174 @@
+"""
+Unit tests for the read-through entity cache.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from adapter.sql.cached_data_access import CachedDbAccess
+from adapter.sql.data_access import DbAccessImpl
+from adapter.sql.replicas import ReplicaRouter, _read_origins
+
+
+TEAM = SimpleNamespace(id=uuid4(), name="platform", manager_id=None)
+USER = SimpleNamespace(id=uuid4(), name="Ana", email="ana@example.com", team_id=TEAM.id)
+
+
+def cached_db(clock, ttl=30.0):
+    inner = Mock(spec=DbAccessImpl)
+    inner.read_record = AsyncMock(side_effect=lambda table_id, **kwargs: TEAM if table_id == "teams" else USER)
+    inner.find_record = AsyncMock(side_effect=lambda table_id, **kwargs: TEAM if table_id == "teams" else USER)
+    inner.read_rows = AsyncMock(return_value={"id": USER.id, "name": USER.name})
+    inner.update_record = AsyncMock(return_value=USER)
+    return CachedDbAccess(inner=inner, ttl=ttl, clock=clock), inner
+
+
+@pytest.mark.asyncio
+async def test_reads_by_id_are_cached(clock):
+    """Test that repeated single reads by id hit the repository once."""
+    db, inner = cached_db(clock)
+
+    assert await db.read_record(table_id="users", record_id=USER.id) is USER
+    assert await db.read_record(table_id="users", record_id=USER.id) is USER
+
+    assert inner.read_record.await_count == 1
+    assert db.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_secondary_keys_resolve_to_the_cached_entity(clock):
+    """Test that a team read by name shares the entry stored by id."""
+    db, inner = cached_db(clock)
+
+    await db.read_record(table_id="teams", record_name="platform", include=())
+
+    assert await db.read_record(table_id="teams", record_id=TEAM.id, include=()) is TEAM
+    assert await db.read_record(table_id="teams", record_name="platform", include=()) is TEAM
+    assert inner.read_record.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_variants_are_cached_separately(clock):
+    """Test that records with different loaded relationships or columns do not mix."""
+    db, inner = cached_db(clock)
+
+    await db.read_record(table_id="teams", record_id=TEAM.id)
+    await db.read_record(table_id="teams", record_id=TEAM.id, include=())
+    await db.read_record(table_id="teams", record_id=TEAM.id, include=("users",))
+    await db.read_rows(table_id="users", columns=("id", "name"), record_id=USER.id)
+    await db.read_rows(table_id="users", columns=("id", "name"), record_id=USER.id)
+
+    assert inner.read_record.await_count == 3
+    assert inner.read_rows.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_list_and_projected_reads_pass_through(clock):
+    """Test that only single-entity reads are cached."""
+    db, inner = cached_db(clock)
+
+    await db.read_record(table_id="users", limit=10)
+    await db.read_record(table_id="users", limit=10)
+    await db.read_record(table_id="users", record_id=USER.id, fields=("id",))
+    await db.read_record(table_id="users", record_id=USER.id, fields=("id",))
+
+    assert inner.read_record.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_the_table_and_related_entities(clock):
+    """Test that a user write drops cached users and, through the FK cascade, teams."""
+    db, inner = cached_db(clock)
+    await db.read_record(table_id="users", record_id=USER.id, include=())
+    await db.read_record(table_id="teams", record_id=TEAM.id, include=())
+    await db.read_record(table_id="teams", record_id=TEAM.id, include=("users",))
+
+    await db.update_record(table_id="users", record_id=USER.id, attributes={"name": "Ana B"})
+
+    await db.read_record(table_id="users", record_id=USER.id, include=())
+    await db.read_record(table_id="teams", record_id=TEAM.id, include=())
+    await db.read_record(table_id="teams", record_id=TEAM.id, include=("users",))
+    assert inner.read_record.await_count == 6
+    assert db.stats()["invalidations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_read_racing_a_write_is_not_cached(clock):
+    """Test that a row read before a write completes is not stored afterwards."""
+    db, inner = cached_db(clock)
+    old_user = SimpleNamespace(**{**vars(USER), "name": "Old"})
+
+    async def read_then_write(table_id, **kwargs):
+        # The write commits and invalidates while this read is in flight
+        await db.update_record(table_id="users", record_id=USER.id, attributes={"name": "Ana"})
+        return old_user
+
+    inner.read_record = AsyncMock(side_effect=read_then_write)
+    assert await db.read_record(table_id="users", record_id=USER.id, include=()) is old_user
+
+    inner.read_record = AsyncMock(return_value=USER)
+    assert await db.read_record(table_id="users", record_id=USER.id, include=()) is USER
+
+
+@pytest.mark.asyncio
+async def test_rows_read_from_a_replica_are_not_cached(clock):
+    """Test that with replicas only primary reads are stored (read-your-writes)."""
+    db, inner = cached_db(clock)
+    db.replicas = Mock(spec=ReplicaRouter)
+
+    def read_from(origin):
+        async def read(table_id, **kwargs):
+            _read_origins.get().append(origin)
+            return USER
+        return read
+
+    inner.read_record = AsyncMock(side_effect=read_from("replica-1"))
+    await db.read_record(table_id="users", record_id=USER.id)
+    await db.read_record(table_id="users", record_id=USER.id)
+    assert inner.read_record.await_count == 2
+
+    inner.read_record = AsyncMock(side_effect=read_from("primary"))
+    await db.read_record(table_id="users", record_id=USER.id)
+    await db.read_record(table_id="users", record_id=USER.id)
+    assert inner.read_record.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl(clock):
+    """Test that an entity is re-read once its TTL has passed."""
+    db, inner = cached_db(clock, ttl=5.0)
+
+    await db.read_record(table_id="users", record_id=USER.id)
+    clock.now = 6.0
+    await db.read_record(table_id="users", record_id=USER.id)
+
+    assert inner.read_record.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_misses_are_not_cached(clock):
+    """Test that a missing entity is looked up again (it may be created next)."""
+    db, inner = cached_db(clock)
+    inner.read_record = AsyncMock(return_value=None)
+
+    assert await db.read_record(table_id="teams", record_name="ghost") is None
+    assert await db.read_record(table_id="teams", record_name="ghost") is None
+
+    assert inner.read_record.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_validation_lookups_bypass_the_cache(clock):
+    """Test that find_record(s) always query, even for entities that are cached."""
+    db, inner = cached_db(clock)
+    inner.find_records = AsyncMock(return_value=[TEAM])
+    await db.read_record(table_id="teams", record_id=TEAM.id, include=())
+
+    assert await db.find_record(table_id="teams", column="name", value="platform") is TEAM
+    assert await db.find_records(table_id="teams", column="name", values=("platform",)) == [TEAM]
+
+    inner.find_record.assert_awaited_once_with(table_id="teams", column="name", value="platform")
+    inner.find_records.assert_awaited_once_with(table_id="teams", column="name", values=("platform",))
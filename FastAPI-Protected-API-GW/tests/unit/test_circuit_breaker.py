@@ -0,0 +1,106 @@
+"""
+Unit tests for the Keto circuit breaker and stale decision fallback.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from adapter.auth.cached_checker import CachedPermissionChecker
+from adapter.auth.circuit_breaker import CircuitBreaker, CLOSED, HALF_OPEN, OPEN
+from adapter.auth.keto_client import KetoPermissionChecker
+from ports.outbound.auth import PermissionBackendUnavailable, PermissionChecker
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    """Test that the breaker trips, short-circuits, and recovers via a probe."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.allow_request() is False
+
+    clock.now = 10.0
+    assert breaker.allow_request() is True
+    assert breaker.state == HALF_OPEN
+    # Only one probe at a time while half-open
+    assert breaker.allow_request() is False
+
+    breaker.record_success(latency=0.01)
+    assert breaker.state == CLOSED
+    assert breaker.stats()["times_opened"] == 1
+
+
+def test_slow_calls_count_as_failures():
+    """Test that calls over the latency threshold trip the breaker."""
+    breaker = CircuitBreaker(failure_threshold=1, slow_call_threshold=0.5)
+
+    breaker.record_success(latency=2.0)
+
+    assert breaker.state == OPEN
+    assert breaker.stats()["slow_calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_keto_short_circuits_when_open():
+    """Test that an open breaker stops Keto calls and reports unavailability."""
+    shared_client = AsyncMock(spec=httpx.AsyncClient)
+    shared_client.get = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    keto_client = KetoPermissionChecker(http_client=shared_client, breaker=breaker)
+
+    with pytest.raises(PermissionBackendUnavailable):
+        await keto_client.check_permission("testuser", "data:read")
+    with pytest.raises(PermissionBackendUnavailable):
+        await keto_client.check_permission("testuser", "data:read")
+
+    # The second call never reached Keto
+    assert shared_client.get.await_count == 1
+    assert breaker.stats()["short_circuited"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [asyncio.CancelledError(), RuntimeError("unexpected")])
+async def test_interrupted_probe_does_not_wedge_the_breaker(error, clock):
+    """Test that a half-open probe ending without a response still releases the breaker."""
+    shared_client = AsyncMock(spec=httpx.AsyncClient)
+    shared_client.get = AsyncMock(side_effect=error)
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+    keto_client = KetoPermissionChecker(http_client=shared_client, breaker=breaker)
+    breaker.record_failure()
+
+    clock.now = 10.0
+    with pytest.raises(type(error)):
+        await keto_client._get("/relation-tuples/check", {})
+    assert breaker.state == OPEN
+
+    clock.now = 20.0
+    assert breaker.allow_request() is True
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_stale_decision_during_outage(clock):
+    """Test last-known-good decisions are served within the staleness window."""
+    inner_checker = Mock(spec=PermissionChecker)
+    inner_checker.check_permission = AsyncMock(return_value=True)
+    checker = CachedPermissionChecker(
+        inner_checker, positive_ttl=60.0, max_staleness=120.0, clock=clock
+    )
+
+    assert await checker.check_permission("testuser", "data:read") is True
+
+    inner_checker.check_permission = AsyncMock(
+        side_effect=PermissionBackendUnavailable("Keto circuit breaker is open")
+    )
+    clock.now = 100.0
+    assert await checker.check_permission("testuser", "data:read") is True
+    assert checker.stats()["stale_hits"] == 1
+
+    # Past the staleness window the outage surfaces to the caller
+    clock.now = 200.0
+    with pytest.raises(PermissionBackendUnavailable):
+        await checker.check_permission("testuser", "data:read")
@@ -0,0 +1,113 @@
+"""
+Unit tests for single-flight coalescing of permission lookups.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from adapter.auth.coalescing_checker import CoalescingPermissionChecker
+from ports.outbound.auth import PermissionChecker
+
+
+@pytest.fixture
+def slow_inner_checker():
+    """Create a mock PermissionChecker whose lookups take a moment."""
+    async def slow_permissions(username):
+        await asyncio.sleep(0.01)
+        return ["data:read"]
+
+    async def slow_roles(username):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("Keto unavailable")
+
+    mock = Mock(spec=PermissionChecker)
+    mock.get_user_permissions = AsyncMock(side_effect=slow_permissions)
+    mock.get_user_roles = AsyncMock(side_effect=slow_roles)
+    return mock
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_call(slow_inner_checker):
+    """Test that concurrent identical lookups hit the backend once."""
+    checker = CoalescingPermissionChecker(slow_inner_checker)
+
+    results = await asyncio.gather(
+        *(checker.get_user_permissions("testuser") for _ in range(50))
+    )
+
+    assert all(result == ["data:read"] for result in results)
+    slow_inner_checker.get_user_permissions.assert_awaited_once_with("testuser")
+    assert checker.stats()["coalesced"] == 49
+    assert checker.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_different_keys_are_not_coalesced(slow_inner_checker):
+    """Test that lookups for different users are issued separately."""
+    checker = CoalescingPermissionChecker(slow_inner_checker)
+
+    await asyncio.gather(
+        checker.get_user_permissions("testuser"),
+        checker.get_user_permissions("otheruser"),
+    )
+
+    assert slow_inner_checker.get_user_permissions.await_count == 2
+    assert checker.stats()["coalesced"] == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_not_retained(slow_inner_checker):
+    """Test that a failure propagates to every waiter and is not cached."""
+    checker = CoalescingPermissionChecker(slow_inner_checker)
+
+    results = await asyncio.gather(
+        checker.get_user_roles("testuser"),
+        checker.get_user_roles("testuser"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    with pytest.raises(RuntimeError):
+        await checker.get_user_roles("testuser")
+    assert slow_inner_checker.get_user_roles.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batched_checks_are_coalesced_per_permission():
+    """Test that check_permissions joins in-flight checks and batches the rest."""
+    async def slow_checks(username, permissions):
+        await asyncio.sleep(0.01)
+        return {permission: permission == "data:read" for permission in permissions}
+
+    async def slow_check(username, permission):
+        return (await slow_checks(username, [permission]))[permission]
+
+    inner = Mock(spec=PermissionChecker)
+    inner.check_permission = AsyncMock(side_effect=slow_check)
+    inner.check_permissions = AsyncMock(side_effect=slow_checks)
+    checker = CoalescingPermissionChecker(inner)
+
+    _, batch = await asyncio.gather(
+        checker.check_permission("testuser", "data:read"),
+        checker.check_permissions("testuser", ["data:read", "data:write", "project:read"]),
+    )
+
+    assert batch == {"data:read": True, "data:write": False, "project:read": False}
+    inner.check_permissions.assert_awaited_once_with("testuser", ["data:write", "project:read"])
+    assert checker.stats()["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_permission_mask_is_forwarded():
+    """Test that mask lookups reach the inner checker's own implementation."""
+    inner = Mock(spec=PermissionChecker)
+    inner.get_user_permission_mask = AsyncMock(return_value=0b101)
+    checker = CoalescingPermissionChecker(inner)
+
+    masks = await asyncio.gather(*(checker.get_user_permission_mask("testuser") for _ in range(3)))
+
+    assert masks == [0b101] * 3
+    inner.get_user_permission_mask.assert_awaited_once_with("testuser")
+    inner.get_user_permissions.assert_not_called()
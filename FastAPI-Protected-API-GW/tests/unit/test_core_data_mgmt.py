@@ -149,4 +149,44 @@ async def test_pub_data_manager(
 
     await db_close()
 
-    assert not path.exists("test.db")
\ No newline at end of file
+    assert not path.exists("test.db")
+
+@pytest.mark.asyncio
+async def test_bulk_create_resolves_teams_in_one_query(
+    db_create_tables,
+    db_close,
+    sample_teams_data,
+    sample_users_data,
+    ):
+    data_manager = DataManagerImpl(repository=DbAccessImpl())
+
+    await db_create_tables()
+
+    teams = await data_manager.process(
+        operation="bulk_create",
+        entity="teams",
+        records=sample_teams_data["valid_values"]
+    )
+    assert len(teams) == 3
+
+    users = await data_manager.process(
+        operation="bulk_create",
+        entity="users",
+        records=sample_users_data["valid_values"]
+    )
+    team_ids = {team.name: team.id for team in teams}
+    assert {user.name: user.team_id for user in users} == {
+        "alice": None,
+        "bob": team_ids["engineering"],
+        "charlie": team_ids["marketing"],
+        "diana": None,
+    }
+
+    with pytest.raises(ValueError, match="nonexistentteam"):
+        await data_manager.process(
+            operation="bulk_create",
+            entity="users",
+            records=[sample_users_data["invalid_value"][1]]
+        )
+
+    await db_close()
@@ -3,6 +3,7 @@ from os import path
 import pytest
 
 from adapter.sql.data_access import DbAccessImpl
+from adapter.sql.statements import StatementRegistry
 
 @pytest.mark.asyncio
 async def test_db_data_access(
@@ -61,3 +62,222 @@ async def test_db_data_access(
     await db_close()
 
     assert not path.exists("test.db")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("returning", [True, False])
+async def test_db_data_access_writes(
+    monkeypatch,
+    returning,
+    db_create_tables,
+    db_close,
+    sample_teams_data,
+    ):
+
+    # Exercise both the RETURNING path and the fallback for dialects without it
+    monkeypatch.setattr(DbAccessImpl, "_supports_returning", staticmethod(lambda db, kind: returning))
+    await db_create_tables()
+
+    team = await DbAccessImpl.create_record(
+        table_id="teams",
+        attributes=sample_teams_data["valid_values"][0]
+    )
+    assert team.id is not None
+    assert team.created_at is not None
+
+    updated = await DbAccessImpl.update_record(
+        table_id="teams",
+        attributes={"id": team.id, "description": "Updated description"}
+    )
+    assert updated.id == team.id
+    assert updated.description == "Updated description"
+
+    updated = await DbAccessImpl.update_record(
+        table_id="teams",
+        attributes={"name": team.name, "description": "By name"}
+    )
+    assert updated.description == "By name"
+
+    with pytest.raises(ValueError, match="not found"):
+        await DbAccessImpl.update_record(
+            table_id="teams",
+            attributes={"name": "missing", "description": "x"}
+        )
+
+    result = await DbAccessImpl.delete_record(table_id="teams", record_id=team.id)
+    assert result == {"message": "Record deleted successfully"}
+    assert await DbAccessImpl.read_record(table_id="teams", record_id=team.id) is None
+
+    with pytest.raises(ValueError, match="not found"):
+        await DbAccessImpl.delete_record(table_id="teams", record_id=team.id)
+
+    await db_close()
+
+
+@pytest.mark.asyncio
+async def test_db_bulk_create_and_upsert(
+    db_create_tables,
+    db_close,
+    sample_users_data,
+    ):
+
+    await db_create_tables()
+
+    users = [sample_users_data["valid_values"][0], sample_users_data["valid_values"][3]]
+    created = await DbAccessImpl.bulk_create_records(table_id="users", records=users)
+    assert [user.name for user in created] == ["alice", "diana"]
+    assert all(user.id is not None for user in created)
+
+    # Duplicate emails make the whole batch fail in one transaction
+    with pytest.raises(ValueError):
+        await DbAccessImpl.bulk_create_records(
+            table_id="users",
+            records=[{"name": "eve", "email": "eve@example.com"}, users[0]]
+        )
+    assert await DbAccessImpl.read_record(table_id="users", record_name="eve") is None
+
+    upserted = await DbAccessImpl.bulk_upsert_records(
+        table_id="users",
+        records=[
+            {"name": "alice", "email": "alice@example.com", "location": "Boston"},
+            {"name": "eve", "email": "eve@example.com"},
+        ]
+    )
+    assert {user.name for user in upserted} == {"alice", "eve"}
+    alice = await DbAccessImpl.read_record(table_id="users", record_name="alice")
+    assert alice.id == created[0].id
+    assert alice.location == "Boston"
+    assert len(await DbAccessImpl.read_record(table_id="users")) == 3
+
+    # Columns a record leaves out keep their values; repeated keys are merged
+    upserted = await DbAccessImpl.bulk_upsert_records(
+        table_id="users",
+        records=[
+            {"name": "alice", "email": "alice@example.com"},
+            {"name": "Alice", "email": "alice@example.com"},
+        ]
+    )
+    assert len(upserted) == 1
+    alice = await DbAccessImpl.read_record(table_id="users", record_id=created[0].id)
+    assert (alice.name, alice.location) == ("Alice", "Boston")
+
+    await db_close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order", ["asc", "desc"])
+async def test_db_keyset_pagination(order, db_create_tables, db_close):
+
+    await db_create_tables()
+
+    # Duplicate names exercise the id tie-breaker
+    await DbAccessImpl.bulk_create_records(
+        table_id="users",
+        records=[
+            {"name": name, "email": f"{name}{i}@example.com"}
+            for i, name in enumerate(["bob", "alice", "bob", "carol", "bob"])
+        ]
+    )
+
+    seen, cursor = [], None
+    while True:
+        page = await DbAccessImpl.read_record(table_id="users", limit=2, order=order, cursor=cursor)
+        seen.extend(page)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    expected = sorted(seen, key=lambda user: (user.name, str(user.id)), reverse=order == "desc")
+    assert [user.id for user in seen] == [user.id for user in expected]
+    assert len({user.id for user in seen}) == 5
+
+    with pytest.raises(ValueError, match="order"):
+        first_page = await DbAccessImpl.read_record(table_id="users", limit=2, order=order)
+        await DbAccessImpl.read_record(
+            table_id="users", limit=2,
+            order="asc" if order == "desc" else "desc",
+            cursor=first_page.next_cursor
+        )
+
+    await db_close()
+
+
+@pytest.mark.asyncio
+async def test_db_stream_records(db_create_tables, db_close):
+
+    await db_create_tables()
+
+    await DbAccessImpl.bulk_create_records(
+        table_id="users",
+        records=[{"name": f"user{i}", "email": f"user{i}@example.com"} for i in range(5)]
+    )
+
+    partitions = [
+        partition async for partition in DbAccessImpl.stream_records(table_id="users", batch_size=2)
+    ]
+
+    assert [len(partition) for partition in partitions] == [2, 2, 1]
+    assert set(partitions[0][0].keys()) == set(DbAccessImpl.export_columns["users"])
+
+    await db_close()
+
+
+@pytest.mark.asyncio
+async def test_db_read_rows(db_create_tables, db_close, sample_users_data):
+
+    await db_create_tables()
+
+    users = await DbAccessImpl.bulk_create_records(
+        table_id="users",
+        records=sample_users_data["valid_values"][:1] + sample_users_data["valid_values"][3:]
+    )
+
+    page = await DbAccessImpl.read_rows(table_id="users", columns=("email",), limit=1, order="asc")
+    assert page == [{"email": "alice@example.com"}]
+    assert page.next_cursor is not None
+
+    page = await DbAccessImpl.read_rows(
+        table_id="users", columns=("email",), limit=1, order="asc", cursor=page.next_cursor
+    )
+    assert page == [{"email": "diana@example.com"}]
+
+    row = await DbAccessImpl.read_rows(table_id="users", columns=("id", "name"), record_id=users[0].id)
+    assert row == {"id": users[0].id, "name": "alice"}
+
+    with pytest.raises(ValueError, match="no columns"):
+        await DbAccessImpl.read_rows(table_id="users", columns=("password",))
+
+    await db_close()
+
+
+@pytest.mark.asyncio
+async def test_db_prebuilt_statements(db_create_tables, db_close, sample_users_data, monkeypatch):
+
+    await db_create_tables()
+    monkeypatch.setattr(DbAccessImpl, "statements", StatementRegistry())
+
+    users = await DbAccessImpl.bulk_create_records(
+        table_id="users", records=sample_users_data["valid_values"][:1] + sample_users_data["valid_values"][3:]
+    )
+
+    # One statement per query shape, reused with different parameter values
+    for user in users:
+        record = await DbAccessImpl.read_record(table_id="users", record_id=user.id)
+        assert record.email == user.email
+        found = await DbAccessImpl.find_record(table_id="users", column="email", value=user.email)
+        assert found.id == user.id
+    assert await DbAccessImpl.find_record(table_id="users", column="email", value="nobody@example.com") is None
+
+    for offset, name in ((0, "alice"), (1, "diana")):
+        page = await DbAccessImpl.read_record(table_id="users", offset=offset, limit=1, order="asc")
+        assert [record.name for record in page] == [name]
+
+    stats = DbAccessImpl.statements.stats()
+    assert stats["size"] == 3
+    assert stats["hits"] == 4
+
+    # Projections are built per call and never registered
+    await DbAccessImpl.read_record(table_id="users", record_id=users[0].id, fields=("email",))
+    assert len(DbAccessImpl.statements) == 3
+
+    await db_close()
@@ -0,0 +1,110 @@
+"""
+Unit tests for local JWT validation against a cached JWKS.
+"""
+
+import time
+
+import httpx
+import pytest
+from joserfc import jwt
+from joserfc.jwk import RSAKey
+from unittest.mock import AsyncMock, Mock
+
+from adapter.auth.jwt_validator import JwtTokenValidator
+
+ISSUER = "http://hydra.test"
+
+
+def generate_key(kid):
+    return RSAKey.generate_key(2048, parameters={"kid": kid}, private=True)
+
+
+def issue_token(key, **claims):
+    payload = {
+        "sub": "user-1",
+        "iss": ISSUER,
+        "exp": int(time.time()) + 60,
+        "scp": ["data:read"],
+        "ext": {"username": "testuser"},
+    }
+    payload.update(claims)
+    return jwt.encode({"alg": "RS256", "kid": key.kid}, payload, key)
+
+
+def jwks_client(*key_sets):
+    """Create a mock HTTP client serving one JWKS document per fetch."""
+    responses = []
+    for keys in key_sets:
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"keys": [key.as_dict(private=False) for key in keys]}
+        responses.append(response)
+    client = AsyncMock(spec=httpx.AsyncClient)
+    client.get.side_effect = responses
+    return client
+
+
+@pytest.mark.asyncio
+async def test_valid_token_is_mapped_without_refetching_keys():
+    """Test claim mapping and that keys are fetched only once."""
+    key = generate_key("k1")
+    client = jwks_client([key])
+    validator = JwtTokenValidator(http_client=client, jwks_url="http://hydra.test/jwks", issuer=ISSUER)
+
+    for _ in range(3):
+        token_data = await validator.introspect_token(issue_token(key))
+
+    assert token_data.sub == "user-1"
+    assert token_data.username == "testuser"
+    assert token_data.scopes == ["data:read"]
+    assert client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_triggers_rotation(clock):
+    """Test that a token signed by a new key refreshes the key set."""
+    old_key, new_key = generate_key("k1"), generate_key("k2")
+    validator = JwtTokenValidator(
+        http_client=jwks_client([old_key], [old_key, new_key]),
+        jwks_url="http://hydra.test/jwks",
+        min_refresh_interval=10.0,
+        clock=clock,
+    )
+
+    await validator.introspect_token(issue_token(old_key))
+    clock.now = 30.0
+    token_data = await validator.introspect_token(issue_token(new_key))
+
+    assert token_data.sub == "user-1"
+    assert validator.stats()["refreshes"] == 2
+    assert validator.stats()["keys"] == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_refresh_is_rate_limited(clock):
+    """Test that unknown kids within the refresh interval are rejected without a fetch."""
+    key = generate_key("k1")
+    client = jwks_client([key])
+    validator = JwtTokenValidator(http_client=client, jwks_url="http://hydra.test/jwks", clock=clock)
+
+    await validator.introspect_token(issue_token(key))
+    with pytest.raises(ValueError, match="Unknown signing key"):
+        await validator.introspect_token(issue_token(generate_key("forged")))
+
+    assert client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_invalid_claims_are_rejected():
+    """Test that expired tokens and wrong issuers raise ValueError."""
+    key = generate_key("k1")
+    validator = JwtTokenValidator(
+        http_client=jwks_client([key]), jwks_url="http://hydra.test/jwks", issuer=ISSUER
+    )
+
+    with pytest.raises(ValueError):
+        await validator.introspect_token(issue_token(key, exp=int(time.time()) - 60))
+    with pytest.raises(ValueError):
+        await validator.introspect_token(issue_token(key, iss="http://evil.test"))
+    with pytest.raises(ValueError, match="Malformed"):
+        await validator.introspect_token("not-a-jwt")
@@ -305,3 +305,115 @@ async def test_get_user_permissions_empty(keto_client):
         
         # Verify
         assert len(permissions) == 0
+
+
+@pytest.mark.asyncio
+async def test_injected_client_is_reused_across_calls(mock_keto_check_allowed):
+    """Test that all Keto calls go through the single injected HTTP client."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = mock_keto_check_allowed
+
+    shared_client = AsyncMock(spec=httpx.AsyncClient)
+    shared_client.get = AsyncMock(return_value=mock_response)
+    keto_client = KetoPermissionChecker(http_client=shared_client)
+
+    with patch('httpx.AsyncClient') as mock_client:
+        await keto_client.check_permission("testuser", "data:read")
+        await keto_client.check_permission("testuser", "data:write")
+
+        # No per-call client is created
+        mock_client.assert_not_called()
+
+    assert shared_client.get.await_count == 2
+
+    # The injected client belongs to the container, not the adapter
+    await keto_client.aclose()
+    shared_client.aclose.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_keto_http_client_uses_settings():
+    """Test that the shared client is configured from Settings."""
+    from adapter.auth.keto_client import create_keto_http_client
+    from config.settings import settings
+
+    client = create_keto_http_client()
+    try:
+        assert client.timeout.connect == settings.KETO_CONNECT_TIMEOUT
+        assert client.timeout.read == settings.KETO_READ_TIMEOUT
+        assert client.timeout.write == settings.KETO_WRITE_TIMEOUT
+        assert client.timeout.pool == settings.KETO_POOL_TIMEOUT
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_user_permissions_expands_roles_concurrently():
+    """Test that roles are expanded concurrently and duplicates looked up once."""
+    import asyncio
+
+    membership = {
+        "relation_tuples": [
+            {"object": "role:data:admin", "relation": "member", "subject_id": "testuser"},
+            {"object": "role:project:user", "relation": "member", "subject_id": "testuser"},
+            {"object": "role:data:admin", "relation": "member", "subject_id": "testuser"},
+        ]
+    }
+    role_permissions = {
+        "role:data:admin": ["data:read", "data:write"],
+        "role:project:user": ["project:read"],
+    }
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_get(url, params=None):
+        nonlocal in_flight, max_in_flight
+        response = Mock()
+        response.status_code = 200
+        if "object" not in params:
+            response.json.return_value = membership
+            return response
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        response.json.return_value = {
+            "relation_tuples": [
+                {"object": params["object"], "relation": "granted", "subject_id": p}
+                for p in role_permissions[params["object"]]
+            ]
+        }
+        return response
+
+    shared_client = AsyncMock(spec=httpx.AsyncClient)
+    shared_client.get = AsyncMock(side_effect=fake_get)
+    keto_client = KetoPermissionChecker(http_client=shared_client)
+
+    permissions = await keto_client.get_user_permissions("testuser")
+
+    assert sorted(permissions) == ["data:read", "data:write", "project:read"]
+    # One membership query plus one query per distinct role
+    assert shared_client.get.await_count == 3
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_check_permissions_batch():
+    """Test that a batch of permissions is checked in one call."""
+    async def fake_get(url, params=None):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"allowed": params["object"] == "data:read"}
+        return response
+
+    shared_client = AsyncMock(spec=httpx.AsyncClient)
+    shared_client.get = AsyncMock(side_effect=fake_get)
+    keto_client = KetoPermissionChecker(http_client=shared_client)
+
+    results = await keto_client.check_permissions(
+        "testuser", ["data:read", "project:read", "data:read"]
+    )
+
+    assert results == {"data:read": True, "project:read": False}
+    assert shared_client.get.await_count == 2
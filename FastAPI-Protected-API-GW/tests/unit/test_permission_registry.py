@@ -0,0 +1,49 @@
+"""
+Unit tests for bitset-encoded permission sets.
+"""
+
+from ports.models.auth import TokenData
+from ports.models.permissions import PermissionRegistry, permission_registry
+
+
+def test_mask_round_trip():
+    """Test that permissions are interned to stable bits and decoded back."""
+    registry = PermissionRegistry()
+
+    mask = registry.mask(["data:read", "data:write"])
+    assert registry.bit("data:read") == 0b01
+    assert registry.bit("data:write") == 0b10
+    assert mask == 0b11
+    assert registry.names(mask) == ["data:read", "data:write"]
+
+
+def test_filter_and_has_all():
+    """Test scope filtering and multi-permission checks against a mask."""
+    registry = PermissionRegistry()
+    mask = registry.mask(["data:read", "project:read"])
+    registry.mask(["data:delete"])  # known, but not granted
+
+    assert registry.filter_granted(
+        mask, ["data:read", "data:delete", "project:read", "unknown:scope"]
+    ) == ["data:read", "project:read"]
+    assert registry.has_all(mask, ["data:read", "project:read"])
+    assert not registry.has_all(mask, ["data:read", "data:delete"])
+    # Unknown permissions are never satisfied and are not interned
+    assert not registry.has_all(mask, ["unknown:scope"])
+    assert len(registry) == 3
+
+
+def test_token_scope_mask():
+    """Test that token scopes can be carried as a bitmask without growing the registry."""
+    permission_registry.mask(["data:read", "data:write"])
+    known = len(permission_registry)
+    token = TokenData(
+        sub="user-id",
+        username="testuser",
+        scopes=["data:read", "data:write", "made-up:scope"],
+        active=True
+    )
+
+    assert permission_registry.has_all(token.scope_mask, ["data:read", "data:write"])
+    assert not permission_registry.has(token.scope_mask, "data:delete")
+    assert len(permission_registry) == known
@@ -0,0 +1,126 @@
+"""
+Unit tests for connection pool configuration and metrics.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from adapter.sql.pool import InstrumentedQueuePool, PoolMetrics, pool_options
+
+
+def pool_settings(**overrides):
+    values = {
+        "DB_POOL_SIZE": 20,
+        "DB_POOL_MAX_OVERFLOW": 10,
+        "DB_POOL_TIMEOUT": 30.0,
+        "DB_POOL_RECYCLE": 1800,
+        "DB_POOL_USE_LIFO": True,
+        "DB_POOL_PRE_PING": "idle",
+        "DB_MAX_CONNECTIONS": 0,
+        "WEB_CONCURRENCY": 1,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def observed_engine(tmp_path, clock, pre_ping_idle=None):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path}/pool.db",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    return engine, PoolMetrics(engine, pre_ping_idle=pre_ping_idle, clock=clock)
+
+
+def test_pool_options_follow_settings():
+    options = pool_options(pool_settings(DB_POOL_PRE_PING="always"))
+
+    assert options["pool_size"] == 20
+    assert options["max_overflow"] == 10
+    assert options["pool_pre_ping"] is True
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert pool_options(pool_settings())["pool_pre_ping"] is False
+
+
+def test_pool_is_capped_per_worker():
+    """Test that all workers together stay within DB_MAX_CONNECTIONS."""
+    options = pool_options(pool_settings(DB_MAX_CONNECTIONS=100, WEB_CONCURRENCY=8))
+
+    assert options["pool_size"] + options["max_overflow"] == 12
+    assert options["pool_size"] == 12
+
+    roomy = pool_options(pool_settings(DB_MAX_CONNECTIONS=100, WEB_CONCURRENCY=2))
+    assert (roomy["pool_size"], roomy["max_overflow"]) == (20, 10)
+
+
+def test_unknown_pre_ping_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        pool_options(pool_settings(DB_POOL_PRE_PING="sometimes"))
+
+
+@pytest.mark.asyncio
+async def test_metrics_track_checkouts_and_timeouts(tmp_path, clock):
+    """Test live gauges while a connection is held, and a timed-out checkout."""
+    engine, metrics = observed_engine(tmp_path, clock)
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            assert metrics.stats()["checked_out"] == 1
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+
+        stats = metrics.stats()
+        assert stats["checked_out"] == 0
+        assert stats["connects"] == 1
+        assert stats["checkouts"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["wait_time_max"] >= 0.05
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_idle_pre_ping_only_pings_idle_connections(tmp_path, clock):
+    """Test that only connections idle past the threshold are pinged on checkout."""
+    engine, metrics = observed_engine(tmp_path, clock, pre_ping_idle=10.0)
+    try:
+        for _ in range(2):
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+        assert metrics.pings == 0
+
+        clock.now = 11.0
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        assert metrics.pings == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_failed_pre_ping_replaces_the_connection(tmp_path, monkeypatch, clock):
+    """Test that a dead idle connection is discarded and a fresh one is used."""
+    engine, metrics = observed_engine(tmp_path, clock, pre_ping_idle=10.0)
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+        def dead_ping(dbapi_connection):
+            monkeypatch.undo()
+            raise ConnectionError("server closed the connection")
+
+        monkeypatch.setattr(engine.dialect, "do_ping", dead_ping)
+        clock.now = 11.0
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+        assert metrics.failed_pings == 1
+        assert metrics.connects == 2
+    finally:
+        await engine.dispose()
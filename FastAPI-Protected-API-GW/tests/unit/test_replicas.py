@@ -0,0 +1,157 @@
+"""
+Unit tests for read-replica routing.
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from adapter.rest.middleware import ReadYourWritesMiddleware
+from adapter.sql.replicas import ReplicaRouter, _consistency, consistency_scope, track_read_origins
+
+
+def engines(count):
+    # Engines only connect on first use, so routing can be tested without a database
+    return [create_async_engine("sqlite+aiosqlite://") for _ in range(count)]
+
+
+def router(clock, replica_count=2, **kwargs):
+    primary, *replicas = engines(replica_count + 1)
+    failing = set()
+
+    async def probe(engine):
+        if engine in failing:
+            raise ConnectionError("replica down")
+
+    return ReplicaRouter(primary, replicas, probe=probe, clock=clock, **kwargs), failing
+
+
+async def bound_engine(replica_router):
+    async with replica_router.session() as db:
+        return db.bind
+
+
+@pytest.mark.asyncio
+async def test_round_robin_spreads_reads(clock):
+    """Test that reads alternate between replicas and never hit the primary."""
+    replica_router, _ = router(clock)
+
+    used = [await bound_engine(replica_router) for _ in range(4)]
+
+    first, second = (replica.engine for replica in replica_router.replicas)
+    assert used == [first, second, first, second]
+    assert replica_router.stats()["primary_reads"] == 0
+
+
+@pytest.mark.asyncio
+async def test_least_connections_prefers_idle_replica(clock):
+    """Test that a replica with an open session is skipped for an idle one."""
+    replica_router, _ = router(clock, strategy="least_connections")
+    first, second = replica_router.replicas
+
+    async with replica_router.session() as db:
+        assert db.bind is first.engine
+        assert first.in_flight == 1
+        assert await bound_engine(replica_router) is second.engine
+    assert first.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_replicas_leave_rotation_until_they_recover(clock):
+    """Test that failed probes route around a replica, then fall back to the primary."""
+    replica_router, failing = router(clock)
+    first, second = replica_router.replicas
+
+    failing.add(first.engine)
+    await replica_router.check_health()
+    assert {await bound_engine(replica_router) for _ in range(3)} == {second.engine}
+
+    failing.add(second.engine)
+    await replica_router.check_health()
+    assert await bound_engine(replica_router) is replica_router.primary
+
+    failing.clear()
+    await replica_router.check_health()
+    assert first.healthy and second.healthy
+    assert first.failed_checks == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_pin_only_the_writing_client_to_the_primary(clock):
+    """Test read-your-writes: the writer reads the primary until the window ends."""
+    replica_router, _ = router(clock, pin_window=5.0)
+
+    clock.now = 100.0
+    with consistency_scope() as writer:
+        replica_router.mark_write()
+        assert await bound_engine(replica_router) is replica_router.primary
+    assert writer.wrote and writer.last_write == 100.0
+    with consistency_scope():
+        assert await bound_engine(replica_router) is not replica_router.primary
+
+    # The next request carries the write time back, whichever worker serves it
+    clock.now = 104.0
+    with consistency_scope(writer.last_write):
+        assert await bound_engine(replica_router) is replica_router.primary
+    clock.now = 106.0
+    with consistency_scope(writer.last_write):
+        assert await bound_engine(replica_router) is not replica_router.primary
+    assert replica_router.stats()["pinned_reads"] == 2
+
+
+@pytest.mark.asyncio
+async def test_without_replicas_everything_reads_the_primary(clock):
+    """Test that no replica URLs means plain primary sessions and no pinning."""
+    replica_router, _ = router(clock, replica_count=0)
+
+    with consistency_scope() as state:
+        replica_router.mark_write()
+        assert await bound_engine(replica_router) is replica_router.primary
+
+    assert not state.wrote
+    assert replica_router.stats()["writes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_read_origins_name_the_engine_that_served_each_read(clock):
+    """Test that tracked reads report the replica, or the primary when pinned."""
+    replica_router, _ = router(clock, replica_count=1)
+
+    with consistency_scope(), track_read_origins() as origins:
+        await bound_engine(replica_router)
+        replica_router.mark_write()
+        await bound_engine(replica_router)
+
+    assert origins == [replica_router.replicas[0].name, "primary"]
+
+
+@pytest.mark.asyncio
+async def test_middleware_round_trips_the_last_write_time():
+    """Test that the write time comes back as cookie and header and is read again."""
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(ReadYourWritesMiddleware.last_write(scope))
+        if scope["path"] == "/write":
+            _consistency.get().last_write, _consistency.get().wrote = 1000.5, True
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    middleware = ReadYourWritesMiddleware(app, pin_window=5.0)
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    await middleware({"type": "http", "path": "/write", "headers": []}, None, send)
+    headers = dict(sent[0]["headers"])
+    assert headers[b"x-last-write"] == b"1000.500"
+    assert headers[b"set-cookie"].startswith(b"last_write=1000.500; Max-Age=5;")
+
+    await middleware({"type": "http", "path": "/read", "headers": [(b"cookie", b"a=1; last_write=1000.500")]}, None, send)
+    await middleware({"type": "http", "path": "/read", "headers": [(b"x-last-write", b"bogus")]}, None, send)
+    assert seen == [None, 1000.5, None]
+    assert b"set-cookie" not in dict(sent[1]["headers"])
+
+
+def test_unknown_strategy_is_rejected(clock):
+    with pytest.raises(ValueError):
+        router(clock, strategy="random")
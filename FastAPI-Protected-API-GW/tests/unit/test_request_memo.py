@@ -0,0 +1,117 @@
+"""
+Unit tests for request-scoped memoization.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from adapter.cache.request_memo import (
+    MemoStats, invalidate_request_memo, request_loader, request_memoized, request_scope
+)
+
+
+def memoized_lookup(namespace="db"):
+    backend = AsyncMock(side_effect=lambda key: f"value-{key}")
+
+    @request_memoized(namespace)
+    async def lookup(key):
+        return await backend(key)
+
+    return lookup, backend
+
+
+@pytest.mark.asyncio
+async def test_calls_are_memoized_within_a_scope():
+    """Test that repeated calls in one scope hit the backend once."""
+    lookup, backend = memoized_lookup()
+
+    with request_scope():
+        assert await lookup("a") == "value-a"
+        assert await lookup("a") == "value-a"
+        await lookup("b")
+
+    assert backend.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_memo_does_not_leak_across_scopes():
+    """Test that each scope starts empty and no memo exists outside one."""
+    lookup, backend = memoized_lookup()
+
+    with request_scope():
+        await lookup("a")
+    with request_scope():
+        await lookup("a")
+    await lookup("a")
+    await lookup("a")
+
+    assert backend.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_isolated():
+    """Test that concurrent tasks each get their own memo."""
+    lookup, backend = memoized_lookup()
+
+    async def request():
+        with request_scope():
+            await lookup("a")
+            await asyncio.sleep(0)
+            await lookup("a")
+
+    await asyncio.gather(request(), request())
+
+    assert backend.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_is_per_namespace():
+    """Test that a write only forgets results of its own namespace."""
+    db_lookup, db_backend = memoized_lookup("db")
+    keto_lookup, keto_backend = memoized_lookup("keto")
+
+    with request_scope():
+        await db_lookup("a")
+        await keto_lookup("a")
+        invalidate_request_memo("db")
+        await db_lookup("a")
+        await keto_lookup("a")
+
+    assert db_backend.await_count == 2
+    assert keto_backend.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_hits_are_counted_on_the_scope_stats():
+    """Test that counters go to the stats passed in, and only to those."""
+    lookup, _ = memoized_lookup()
+    stats = MemoStats()
+
+    with request_scope(stats):
+        await lookup("a")
+        await lookup("a")
+        await request_loader(("db", "squares"), AsyncMock(return_value={2: 4})).load(2)
+    with request_scope():
+        await lookup("a")
+
+    assert stats.stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+    assert stats.loaders.stats()["loads"] == 1
+
+
+@pytest.mark.asyncio
+async def test_list_results_are_not_shared_between_callers():
+    """Test that mutating a memoized list leaves later results intact."""
+    backend = AsyncMock(return_value=["read"])
+
+    @request_memoized("keto")
+    async def permissions(username):
+        return await backend(username)
+
+    with request_scope():
+        (await permissions("alice")).append("write")
+        (await permissions("alice")).append("admin")
+        assert await permissions("alice") == ["read"]
+
+    assert backend.await_count == 1
@@ -0,0 +1,93 @@
+"""
+Unit tests for the in-process role -> permission index.
+"""
+
+from os import path
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from adapter.auth.keto_client import KetoPermissionChecker
+from adapter.auth.role_index import RolePermissionIndex
+
+ROLES_FILE = path.join(
+    path.dirname(path.dirname(path.dirname(path.abspath(__file__)))),
+    "ory", "keto", "scopes_roles_permissions.json"
+)
+
+
+def keto_response(payload, status_code=200):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    return response
+
+
+def test_load_from_file():
+    """Test building the index from scopes_roles_permissions.json."""
+    index = RolePermissionIndex(source="file", file_path=ROLES_FILE)
+    index.load_from_file(ROLES_FILE)
+
+    assert len(index) == 7
+    assert index.get("data:user") == frozenset({"data:read"})
+    assert index.get("authz:admin") == frozenset({"authz:read", "authz:write"})
+    assert "project:delete" in index.get("project:admin")
+    assert index.get("unknown:role") is None
+
+
+@pytest.mark.asyncio
+async def test_load_from_keto_follows_pagination():
+    """Test building the index from a paginated bulk Keto dump."""
+    shared_client = AsyncMock(spec=httpx.AsyncClient)
+    shared_client.get = AsyncMock(side_effect=[
+        keto_response({
+            "relation_tuples": [
+                {"object": "role:data:admin", "relation": "granted", "subject_id": "data:read"},
+                {"object": "data:read", "relation": "granted", "subject_id": "testuser"},
+            ],
+            "next_page_token": "page-2",
+        }),
+        keto_response({
+            "relation_tuples": [
+                {"object": "role:data:admin", "relation": "granted", "subject_id": "data:write"},
+            ],
+            "next_page_token": "",
+        }),
+    ])
+    keto = KetoPermissionChecker(http_client=shared_client)
+    index = RolePermissionIndex(source="keto", keto=keto)
+
+    assert await index.refresh() == 1
+    assert index.get("data:admin") == frozenset({"data:read", "data:write"})
+    assert shared_client.get.await_args_list[1].kwargs["params"]["page_token"] == "page-2"
+
+
+@pytest.mark.asyncio
+async def test_keto_uses_index_for_role_expansion():
+    """Test that indexed roles are expanded without querying Keto."""
+    index = RolePermissionIndex(source="file", file_path=ROLES_FILE)
+    index.load_from_file(ROLES_FILE)
+
+    shared_client = AsyncMock(spec=httpx.AsyncClient)
+    shared_client.get = AsyncMock(return_value=keto_response({
+        "relation_tuples": [
+            {"object": "role:data:operator", "relation": "member", "subject_id": "testuser"},
+            {"object": "role:project:user", "relation": "member", "subject_id": "testuser"},
+        ]
+    }))
+    keto = KetoPermissionChecker(http_client=shared_client, role_index=index)
+
+    permissions = await keto.get_user_permissions("testuser")
+
+    assert sorted(permissions) == ["data:read", "data:update", "data:write", "project:read"]
+    # Only the user -> role membership query reaches Keto
+    shared_client.get.assert_awaited_once()
+
+
+def test_invalid_source():
+    """Test that misconfigured sources are rejected."""
+    with pytest.raises(ValueError):
+        RolePermissionIndex(source="database")
+    with pytest.raises(ValueError):
+        RolePermissionIndex(source="keto")
@@ -0,0 +1,143 @@
+"""
+Unit tests for the Hydra token validator and its caching decorator.
+"""
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from adapter.auth.cached_token_validator import CachedTokenValidator, token_key
+from adapter.auth.hydra_validator import HydraTokenValidator
+from ports.models.auth import TokenData
+from ports.outbound.auth import TokenValidator
+
+
+def make_token_data(sub="user-1", expires_at=None):
+    return TokenData(sub=sub, username="testuser", scopes=["data:read"], active=True, expires_at=expires_at)
+
+
+@pytest.fixture
+def inner_validator():
+    """Create a mock TokenValidator to be decorated."""
+    return Mock(spec=TokenValidator)
+
+
+@pytest.mark.asyncio
+async def test_hydra_introspection_maps_claims():
+    """Test that an active introspection response is mapped to TokenData."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "active": True,
+        "sub": "user-1",
+        "scope": "data:read data:write",
+        "exp": 2000,
+        "ext": {"username": "testuser"},
+    }
+    client = AsyncMock(spec=httpx.AsyncClient)
+    client.post.return_value = mock_response
+
+    token_data = await HydraTokenValidator(http_client=client).introspect_token("opaque")
+
+    assert token_data.username == "testuser"
+    assert token_data.scopes == ["data:read", "data:write"]
+    assert token_data.expires_at == 2000
+    client.post.assert_awaited_once_with("/admin/oauth2/introspect", data={"token": "opaque"})
+
+
+@pytest.mark.asyncio
+async def test_hydra_inactive_token_is_rejected():
+    """Test that an inactive token raises ValueError."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"active": False}
+    client = AsyncMock(spec=httpx.AsyncClient)
+    client.post.return_value = mock_response
+
+    with pytest.raises(ValueError):
+        await HydraTokenValidator(http_client=client).introspect_token("opaque")
+
+
+@pytest.mark.asyncio
+async def test_hydra_error_status_is_not_a_token_rejection():
+    """Test that a non-200 answer raises an httpx error, not ValueError."""
+    client = AsyncMock(spec=httpx.AsyncClient)
+    client.post.return_value = httpx.Response(
+        503, request=httpx.Request("POST", "http://hydra/admin/oauth2/introspect")
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await HydraTokenValidator(http_client=client).introspect_token("opaque")
+
+
+@pytest.mark.asyncio
+async def test_valid_token_is_cached_until_expiry(inner_validator, clock):
+    """Test that the cache TTL is capped by the token's exp."""
+    inner_validator.introspect_token = AsyncMock(return_value=make_token_data(expires_at=1010))
+    validator = CachedTokenValidator(
+        inner_validator, max_ttl=300.0, clock=clock, wall_clock=lambda: 1000.0 + clock.now
+    )
+
+    await validator.introspect_token("token")
+    clock.now = 9.0
+    await validator.introspect_token("token")
+    assert inner_validator.introspect_token.await_count == 1
+
+    clock.now = 11.0
+    await validator.introspect_token("token")
+    assert inner_validator.introspect_token.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalid_token_is_negatively_cached(inner_validator):
+    """Test that rejected tokens are remembered but outages are not."""
+    inner_validator.introspect_token = AsyncMock(side_effect=ValueError("Token is not active"))
+    validator = CachedTokenValidator(inner_validator, negative_ttl=30.0)
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="not active"):
+            await validator.introspect_token("bad")
+    assert inner_validator.introspect_token.await_count == 1
+
+    inner_validator.introspect_token = AsyncMock(side_effect=httpx.ConnectError("down"))
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            await validator.introspect_token("other")
+    assert inner_validator.introspect_token.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_revocation_evicts_tokens(inner_validator):
+    """Test that revoked tokens and subjects are introspected again."""
+    inner_validator.introspect_token = AsyncMock(return_value=make_token_data())
+    validator = CachedTokenValidator(inner_validator, max_size=10)
+
+    for token in ("a", "b", "c"):
+        await validator.introspect_token(token)
+    # Only hashes of the tokens are kept
+    assert token_key("a") in validator._cache and "a" not in validator._cache
+
+    assert validator.revoke("a") is True
+    assert validator.revoke_subject("user-1") == 2
+    assert len(validator._cache) == 0
+
+    await validator.introspect_token("b")
+    assert inner_validator.introspect_token.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_subject_index_follows_evictions_and_expiry(inner_validator, clock):
+    """Test that tokens leaving the cache also leave the per-subject index."""
+    inner_validator.introspect_token = AsyncMock(
+        side_effect=lambda token: make_token_data(sub=f"user-{token}")
+    )
+    validator = CachedTokenValidator(inner_validator, max_size=2, max_ttl=10.0, clock=clock)
+
+    for token in ("a", "b", "c"):
+        await validator.introspect_token(token)
+    assert set(validator._keys_by_subject) == {"user-b", "user-c"}
+
+    clock.now = 11.0
+    await validator.introspect_token("d")
+    await validator.introspect_token("e")
+    assert set(validator._keys_by_subject) == {"user-d", "user-e"}